@@ -7,75 +7,207 @@ Creates actual security logs that appear in web dashboard
 USAGE:
 1. Start Ryu controller: ryu-manager controller.py --verbose
 2. Start Mininet topology: sudo python3 mininet_topology.py
-3. In Mininet CLI, run: py execfile('automated_attacks.py')
+3. In Mininet CLI, run: py __import__('automated_attacks').main(net)
    OR from another terminal: sudo python3 automated_attacks.py
 """
 
-import subprocess
+import asyncio
 import time
 import json
 import os
+import re
+import shutil
 import sys
+import traceback
+from collections import defaultdict
 from datetime import datetime
 
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # Optional: faster event loop for the concurrent probes
+except ImportError:
+    uvloop = None
+
+# Probe argv per attack type, built from (target_ip, target_port)
+ATTACK_ARGV = {
+    "http_attack": lambda ip, port: ['curl', '-m', '3', '--connect-timeout', '3', f'http://{ip}:{port}'],
+    "tcp_scan": lambda ip, port: ['nc', '-z', '-w', '3', ip, str(port)],
+    "ping_sweep": lambda ip, port: ['ping', '-c', '2', '-W', '1', ip],
+    "ssh_attempt": lambda ip, port: ['nc', '-z', '-w', '3', ip, '22'],
+    "db_attack": lambda ip, port: ['nc', '-z', '-w', '3', ip, '3306'],
+}
+
+# Attack types that are a single `nc -z` TCP connect probe, and the port each
+# one probes (None: the attack's own target_port); these can share a port sweep
+TCP_PROBE_PORTS = {"tcp_scan": None, "ssh_attempt": 22, "db_attack": 3306}
+
+# Open ports in nmap grepable (-oG) output, e.g. "22/open/tcp//ssh///"
+NMAP_OPEN_PORT = re.compile(r'(\d+)/open/tcp')
+
+# Campaign attacks: (host, target_ip, target_port, attack_type, description)
+LATERAL_MOVEMENT_ATTACKS = [
+    # Initial compromise (legitimate access)
+    ("h4", "10.0.0.10", 80, "http_attack", "Initial web access (legitimate)"),
+    
+    # Lateral movement attempts (should be blocked)
+    ("h4", "10.0.0.20", 8080, "http_attack", "Lateral move to App server"),
+    ("h4", "10.0.0.30", 3306, "db_attack", "Database attack attempt"),
+    ("h4", "10.0.0.20", 22, "ssh_attempt", "SSH brute force attempt"),
+    ("h4", "10.0.0.30", 22, "ssh_attempt", "Database SSH attempt"),
+    
+    # Privilege escalation attempts
+    ("h4", "10.0.0.200", 22, "ssh_attempt", "Admin user attack"),
+    
+    # Network reconnaissance
+    ("h4", "10.0.0.20", 80, "tcp_scan", "Port scanning App server"),
+    ("h4", "10.0.0.30", 80, "tcp_scan", "Port scanning DB server"),
+]
+
+INSIDER_THREAT_ATTACKS = [
+    # Admin legitimate access
+    ("h5", "10.0.0.10", 80, "http_attack", "Admin web access (legitimate)"),
+    ("h5", "10.0.0.20", 8080, "http_attack", "Admin app access (legitimate)"),
+    
+    # Malicious insider activities (should be blocked)
+    ("h5", "10.0.0.100", 22, "ssh_attempt", "Admin attacking HR user"),
+    ("h5", "10.0.0.100", 80, "tcp_scan", "Admin scanning HR user"),
+]
+
+# Generated execute_attacks.py; {attacks} is replaced with one block per attack
+EXECUTE_ATTACKS_TEMPLATE = '''#!/usr/bin/env python3
+"""
+Automated Attack Execution Script
+Run this from within Mininet CLI: py execfile("execute_attacks.py")
+"""
+
+import time
+
+print("🚀 Executing automated attacks...")
+print("Watch security_events.log for real-time events!")
+
+{attacks}print("✅ All attacks completed!")
+print("Check security_events.log and web dashboard for results")
+'''
+
+# Flows allowed by the SDN policy (mirrors roles.json)
+ALLOWED_FLOWS = frozenset({
+    ("h4", "10.0.0.10", 80),     # HR -> Web HTTP
+    ("h4", "10.0.0.10", 443),    # HR -> Web HTTPS
+    ("h1", "10.0.0.20", 8080),   # Web -> App
+    ("h2", "10.0.0.30", 3306),   # App -> DB
+})
+
+# Admin (h5) may reach every server on any port
+ALLOWED_HOST_PAIRS = frozenset({
+    ("h5", "10.0.0.10"),
+    ("h5", "10.0.0.20"),
+    ("h5", "10.0.0.30"),
+})
+
+# Exit codes meaning the namespace exec itself failed rather than the probe
+# being blocked: 127 = command not found, 255 = `ip netns exec` error
+NAMESPACE_FAILURE_CODES = frozenset({127, 255})
+NAMESPACE_FAILURE_MARKERS = ('Cannot open network namespace', 'sudo:')
+
+# Echoed after a probe run through a Mininet host shell, so that its exit
+# status can be read back from the output
+EXIT_STATUS_MARKER = '__exit_status='
+
+def split_exit_status(output):
+    """Split host shell output into (output, exit status), the status None if missing"""
+    output, marker, status = output.rpartition(EXIT_STATUS_MARKER)
+    if not marker:
+        return status, None
+    try:
+        return output, int(status.split()[0])
+    except (ValueError, IndexError):
+        return output, None
+
+def namespace_exec_failed(returncode, stderr):
+    """Return True if `sudo ip netns exec` could not run the probe at all"""
+    return (returncode in NAMESPACE_FAILURE_CODES or
+            any(marker in stderr for marker in NAMESPACE_FAILURE_MARKERS))
+
+def write_atomic(path, data):
+    """Write str/bytes to path via a temp file so readers never see a partial file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb' if isinstance(data, bytes) else 'w') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def probed_port(attack_type, target_port):
+    """Return the TCP port a TCP_PROBE_PORTS attack actually connects to"""
+    port = TCP_PROBE_PORTS[attack_type]
+    return target_port if port is None else port
+
+def attack_argv(attack_type, target_ip, target_port):
+    """Return the probe argv for an attack type (plain ping if unknown)"""
+    builder = ATTACK_ARGV.get(attack_type)
+    if builder is None:
+        return ['ping', '-c', '1', '-W', '1', target_ip]
+    return builder(target_ip, target_port)
+
 class AutomatedAttackGenerator:
     """Generate real automated attacks through Mininet"""
     
-    def __init__(self, use_mininet_api=False):
+    def __init__(self, net=None, max_concurrent=4):
         self.attack_results = []
         self.start_time = datetime.now()
         self.mininet_running = False
-        self.use_mininet_api = use_mininet_api
-        self.net = None
+        self.use_mininet_api = False
+        self.net = net  # Mininet network handed in by the caller, if any
+        self.host_cache = {}  # Mininet host name -> host object
+        self.host_locks = {}  # Mininet host name -> lock serializing its shell
+        self.manual_commands = []  # Lines pending for /tmp/attack_cmd.txt
+        self.max_concurrent = max_concurrent  # Probes in flight at once, to spare the controller
         
     def check_mininet_status(self):
         """Check if Mininet topology is running"""
+        # Equivalent to `pgrep -f mininet`, scanning /proc instead of forking pgrep
+        self.mininet_running = False
+        own_pid = str(os.getpid())
         try:
-            # Check for Mininet processes
-            result = subprocess.run(['pgrep', '-f', 'mininet'], 
-                                  capture_output=True, text=True)
-            self.mininet_running = result.returncode == 0
-            return self.mininet_running
-        except:
+            pids = [pid for pid in os.listdir('/proc') if pid.isdigit() and pid != own_pid]
+        except OSError:
             return False
+        
+        for pid in pids:
+            try:
+                with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                    if b'mininet' in f.read():
+                        self.mininet_running = True
+                        break
+            except OSError:
+                continue  # Process exited or is not readable
+        
+        return self.mininet_running
     
     def setup_mininet_connection(self):
         """Try to connect to running Mininet instance"""
+        # The network is passed in explicitly when run from within Mininet CLI
+        if self.net is None:
+            return False
+        
         try:
-            # Try to import Mininet modules
-            from mininet.net import Mininet
-            from mininet.cli import CLI
-            
-            # Check if we can access Mininet network
-            # This works if script is run from within Mininet CLI
-            if 'net' in globals():
-                self.net = globals()['net']
-                self.use_mininet_api = True
-                print("✅ Connected to Mininet network via API")
-                return True
-        except ImportError:
-            pass
+            self.host_cache = {h.name: h for h in self.net.hosts}
         except Exception as e:
             print(f"⚠️  Could not connect to Mininet API: {e}")
+            return False
         
-        return False
+        self.use_mininet_api = True
+        print("✅ Connected to Mininet network via API")
+        return True
     
-    def execute_attack_command(self, host, target_ip, target_port, attack_type):
+    async def execute_attack_command(self, host, target_ip, target_port, attack_type):
         """Execute real attack command through Mininet"""
         
-        # Generate appropriate attack command
-        if attack_type == "http_attack":
-            cmd = f"curl -m 3 --connect-timeout 3 http://{target_ip}:{target_port} 2>/dev/null"
-        elif attack_type == "tcp_scan":
-            cmd = f"nc -z -w 3 {target_ip} {target_port} 2>/dev/null"
-        elif attack_type == "ping_sweep":
-            cmd = f"ping -c 2 -W 1 {target_ip} >/dev/null 2>&1"
-        elif attack_type == "ssh_attempt":
-            cmd = f"nc -z -w 3 {target_ip} 22 2>/dev/null"
-        elif attack_type == "db_attack":
-            cmd = f"nc -z -w 3 {target_ip} 3306 2>/dev/null"
-        else:
-            cmd = f"ping -c 1 -W 1 {target_ip} >/dev/null 2>&1"
+        # Generate appropriate attack command as an argv list (no /bin/sh involved)
+        argv = attack_argv(attack_type, target_ip, target_port)
+        cmd = ' '.join(argv)
         
         print(f"🔴 ATTACK: {host} -> {target_ip}:{target_port} ({attack_type})")
         
@@ -86,196 +218,233 @@ class AutomatedAttackGenerator:
         try:
             # Method 1: Use Mininet API if available
             if self.use_mininet_api and self.net:
-                host_obj = self.net.get(host)
+                host_obj = self.host_cache.get(host)
                 if host_obj:
                     print(f"   🎯 Executing via Mininet API: {host} {cmd}")
-                    result = host_obj.cmd(cmd)
-                    success = True  # Command executed
-                    stdout = result
-                    print(f"   ✅ Command executed through Mininet network")
+                    # host.cmd blocks on the host's shell pipe: run it in a worker
+                    # thread, but never drive the same host's shell concurrently
+                    lock = self.host_locks.setdefault(host, asyncio.Lock())
+                    async with lock:
+                        result = await asyncio.to_thread(
+                            host_obj.cmd, f'{cmd}; echo {EXIT_STATUS_MARKER}$?')
+                    # Judge the probe by its exit status, as in namespace mode and
+                    # as port sweeps judge theirs by nmap's open/closed verdict
+                    stdout, returncode = split_exit_status(result)
+                    success = returncode == 0
+                    if success:
+                        print(f"   ✅ Command executed through Mininet network")
+                    else:
+                        print(f"   🚫 Probe ran through Mininet but did not connect (rc={returncode})")
                 else:
                     print(f"   ❌ Host {host} not found in Mininet network")
             
             # Method 2: Use network namespaces (if Mininet is running)
             elif self.mininet_running:
                 # Try to execute in network namespace
-                ns_cmd = f"sudo ip netns exec {host} {cmd}"
-                print(f"   🎯 Executing via namespace: {ns_cmd}")
+                ns_argv = ['sudo', 'ip', 'netns', 'exec', host, *argv]
+                print(f"   🎯 Executing via namespace: {' '.join(ns_argv)}")
                 
-                result = subprocess.run(ns_cmd, shell=True, capture_output=True, 
-                                      text=True, timeout=10)
-                success = result.returncode == 0
-                stdout = result.stdout
-                stderr = result.stderr
+                returncode, stdout, stderr = await self.run_subprocess(ns_argv, timeout=10)
+                success = returncode == 0
                 
                 if success:
                     print(f"   ✅ Command executed in network namespace")
+                elif not namespace_exec_failed(returncode, stderr):
+                    # The probe itself ran and was refused/timed out: that is the
+                    # SDN policy at work, so don't re-run it outside the namespace
+                    print(f"   🚫 Probe ran in namespace but did not connect (rc={returncode})")
                 else:
                     print(f"   ⚠️  Namespace execution failed, trying alternative...")
                     # Fallback: Try direct execution to generate some traffic
-                    direct_cmd = cmd.replace(f"{host} ", "")
-                    result = subprocess.run(direct_cmd, shell=True, capture_output=True, 
-                                          text=True, timeout=10)
-                    success = result.returncode == 0
-                    stdout = result.stdout
-                    stderr = result.stderr
+                    # Only the exit status matters here, so nothing is captured
+                    returncode, stdout, stderr = await self.run_subprocess(argv, timeout=10, capture_stderr=False)
+                    success = returncode == 0
             
             # Method 3: Generate command file for manual execution
             else:
                 print(f"   📝 Generating command for manual execution...")
-                with open('/tmp/attack_cmd.txt', 'a') as f:
-                    f.write(f"# {attack_type}: {host} -> {target_ip}:{target_port}\n")
-                    f.write(f"{host} {cmd}\n\n")
+                self.manual_commands.append(
+                    f"# {attack_type}: {host} -> {target_ip}:{target_port}\n{host} {cmd}\n\n")
                 
-                print(f"   💡 Command saved to /tmp/attack_cmd.txt")
+                print(f"   💡 Command queued for /tmp/attack_cmd.txt")
                 print(f"   🎯 Execute in Mininet CLI to generate REAL traffic!")
                 
                 # Simulate result for reporting
                 success = self.simulate_attack_result(host, target_ip, target_port)
             
-            # Small delay between attacks
-            time.sleep(0.5)
-            
             return success, stdout, stderr
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             print(f"   ⏰ Command timed out")
             return False, "", "Command timed out"
         except Exception as e:
             print(f"   ❌ Error executing command: {e}")
             return False, "", str(e)
     
-    def simulate_attack_result(self, host, target_ip, target_port):
-        """Simulate attack results based on security policies"""
+    async def run_subprocess(self, argv, timeout, capture_stdout=False, capture_stderr=True):
+        """Run argv without a shell and return (returncode, stdout, stderr)
+        
+        Streams that are not captured go to DEVNULL, so no pipe has to be
+        drained; their value in the returned tuple is an empty string.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE if capture_stderr else asyncio.subprocess.DEVNULL)
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        stdout = stdout.decode(errors='replace') if stdout else ""
+        stderr = stderr.decode(errors='replace') if stderr else ""
+        return proc.returncode, stdout, stderr
+    
+    async def execute_port_sweep(self, host, target_ip, ports):
+        """Probe several TCP ports on one target with a single nmap run
         
-        # HR user (h4) attacks
-        if host == "h4":
-            if target_ip == "10.0.0.10" and target_port in [80, 443]:
-                return True  # HR can access web server
-            else:
-                return False  # HR blocked from everything else
+        Returns {port: (success, stdout, stderr)}, or None if the sweep could
+        not be run and the ports should be probed individually.
+        """
+        port_list = ','.join(str(port) for port in sorted(set(ports)))
+        argv = ['nmap', '-Pn', '-T4', '-p', port_list, '-oG', '-', target_ip]
         
-        # Admin user (h5) attacks
-        elif host == "h5":
-            if target_ip in ["10.0.0.10", "10.0.0.20", "10.0.0.30"]:
-                return True  # Admin can access servers
-            else:
-                return False  # Admin blocked from users
-        
-        # Server attacks
-        elif host in ["h1", "h2", "h3"]:
-            # Server-to-server communication
-            if (host == "h1" and target_ip == "10.0.0.20" and target_port == 8080):
-                return True
-            elif (host == "h2" and target_ip == "10.0.0.30" and target_port == 3306):
-                return True
+        print(f"🔴 PORT SWEEP: {host} -> {target_ip}:{port_list} (TCP probes x{len(ports)})")
+        
+        stderr = ""
+        try:
+            if self.use_mininet_api and self.net:
+                host_obj = self.host_cache.get(host)
+                if not host_obj:
+                    return None
+                lock = self.host_locks.setdefault(host, asyncio.Lock())
+                async with lock:
+                    stdout = await asyncio.to_thread(host_obj.cmd, ' '.join(argv))
             else:
-                return False
+                ns_argv = ['sudo', 'ip', 'netns', 'exec', host, *argv]
+                returncode, stdout, stderr = await self.run_subprocess(ns_argv, timeout=30, capture_stdout=True)
+                if namespace_exec_failed(returncode, stderr):
+                    print(f"   ⚠️  Namespace sweep failed, probing ports individually...")
+                    return None
+        except asyncio.TimeoutError:
+            print(f"   ⏰ Port sweep timed out")
+            return {port: (False, "", "Command timed out") for port in ports}
+        except Exception as e:
+            print(f"   ⚠️  Port sweep failed ({e}), probing ports individually...")
+            return None
         
-        return False
+        open_ports = {int(port) for port in NMAP_OPEN_PORT.findall(stdout)}
+        return {port: (port in open_ports, stdout, stderr) for port in ports}
     
-    def run_lateral_movement_attacks(self):
-        """Simulate lateral movement attack campaign"""
-        
-        print("\n🔴 LATERAL MOVEMENT ATTACK CAMPAIGN")
-        print("=" * 50)
-        print("Simulating attacker who compromised HR user attempting lateral movement...")
-        print()
-        
-        attacks = [
-            # Initial compromise (legitimate access)
-            ("h4", "10.0.0.10", 80, "http_attack", "Initial web access (legitimate)"),
-            
-            # Lateral movement attempts (should be blocked)
-            ("h4", "10.0.0.20", 8080, "http_attack", "Lateral move to App server"),
-            ("h4", "10.0.0.30", 3306, "db_attack", "Database attack attempt"),
-            ("h4", "10.0.0.20", 22, "ssh_attempt", "SSH brute force attempt"),
-            ("h4", "10.0.0.30", 22, "ssh_attempt", "Database SSH attempt"),
-            
-            # Privilege escalation attempts
-            ("h4", "10.0.0.200", 22, "ssh_attempt", "Admin user attack"),
-            
-            # Network reconnaissance
-            ("h4", "10.0.0.20", 80, "tcp_scan", "Port scanning App server"),
-            ("h4", "10.0.0.30", 80, "tcp_scan", "Port scanning DB server"),
-        ]
-        
-        blocked_attacks = 0
-        total_attacks = len(attacks)
+    async def dispatch_attacks(self, attacks):
+        """Run a campaign's attacks concurrently, one nmap sweep per probed target
+        
+        Returns one (success, stdout, stderr) tuple per attack, in order.
+        """
+        # Group the nc-based TCP probes (scans, SSH and database attempts) by
+        # (source host, target) so each target's ports are swept at once
+        sweeps = defaultdict(list)
+        if (self.use_mininet_api or self.mininet_running) and shutil.which('nmap'):
+            for i, (host, target_ip, _, attack_type, _) in enumerate(attacks):
+                if attack_type in TCP_PROBE_PORTS:
+                    sweeps[(host, target_ip)].append(i)
+        sweeps = {key: indices for key, indices in sweeps.items() if len(indices) > 1}
+        swept = {i for indices in sweeps.values() for i in indices}
+        
+        outcomes = [None] * len(attacks)
+        # Bound in-flight probes so controller backpressure isn't mistaken for policy blocks
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        async def run_single(i):
+            async with semaphore:
+                outcomes[i] = await self.execute_attack_command(*attacks[i][:4])
+        
+        async def run_sweep(host, target_ip, indices):
+            ports = {i: probed_port(attacks[i][3], attacks[i][2]) for i in indices}
+            async with semaphore:
+                by_port = await self.execute_port_sweep(host, target_ip, list(ports.values()))
+            if by_port is None:
+                await asyncio.gather(*(run_single(i) for i in indices))
+                return
+            for i in indices:
+                outcomes[i] = by_port[ports[i]]
+        
+        await asyncio.gather(
+            *(run_single(i) for i in range(len(attacks)) if i not in swept),
+            *(run_sweep(host, target_ip, indices) for (host, target_ip), indices in sweeps.items()))
+        
+        return outcomes
+    
+    def save_manual_commands(self):
+        """Write all queued manual-execution commands in a single pass"""
+        if not self.manual_commands:
+            return
         
-        for host, target_ip, target_port, attack_type, description in attacks:
-            print(f"\n🎯 {description}")
-            
-            success, stdout, stderr = self.execute_attack_command(host, target_ip, target_port, attack_type)
-            
-            result = {
-                'attack': description,
-                'source': host,
-                'target': f"{target_ip}:{target_port}",
-                'type': attack_type,
-                'blocked': not success,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            self.attack_results.append(result)
-            
-            if not success:
-                blocked_attacks += 1
-                print(f"   ✅ BLOCKED by SDN controller")
-            else:
-                print(f"   ⚠️  ALLOWED (legitimate or policy gap)")
-            
-            # Delay between attacks
-            time.sleep(2)
+        with open('/tmp/attack_cmd.txt', 'w') as f:
+            f.writelines(self.manual_commands)
         
-        return blocked_attacks, total_attacks
+        print(f"💡 {len(self.manual_commands)} commands saved to /tmp/attack_cmd.txt")
     
-    def run_insider_threat_simulation(self):
-        """Simulate malicious insider threat"""
+    def simulate_attack_result(self, host, target_ip, target_port):
+        """Simulate attack results based on security policies"""
+        return ((host, target_ip, target_port) in ALLOWED_FLOWS or
+                (host, target_ip) in ALLOWED_HOST_PAIRS)
+    
+    async def run_campaign(self, title, intro, attacks, allowed_label):
+        """Run one attack campaign concurrently and record per-attack results
         
-        print("\n🟡 INSIDER THREAT SIMULATION")
+        attacks is a list of (host, target_ip, target_port, attack_type, description).
+        Returns (blocked_attacks, total_attacks).
+        """
+        
+        print(f"\n{title}")
         print("=" * 50)
-        print("Simulating malicious admin user attempting unauthorized access...")
+        print(intro)
         print()
         
-        attacks = [
-            # Admin legitimate access
-            ("h5", "10.0.0.10", 80, "http_attack", "Admin web access (legitimate)"),
-            ("h5", "10.0.0.20", 8080, "http_attack", "Admin app access (legitimate)"),
-            
-            # Malicious insider activities (should be blocked)
-            ("h5", "10.0.0.100", 22, "ssh_attempt", "Admin attacking HR user"),
-            ("h5", "10.0.0.100", 80, "tcp_scan", "Admin scanning HR user"),
-        ]
+        # Attacks are independent, so launch the whole campaign concurrently
+        outcomes = await self.dispatch_attacks(attacks)
+        batch_ts = time.time()  # One stamp for the whole batch, formatted at report time
         
         blocked_attacks = 0
         
-        for host, target_ip, target_port, attack_type, description in attacks:
+        for (host, target_ip, target_port, attack_type, description), (success, stdout, stderr) in zip(attacks, outcomes):
             print(f"\n🎯 {description}")
             
-            success, stdout, stderr = self.execute_attack_command(host, target_ip, target_port, attack_type)
-            
-            result = {
+            self.attack_results.append({
                 'attack': description,
                 'source': host,
                 'target': f"{target_ip}:{target_port}",
                 'type': attack_type,
                 'blocked': not success,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            self.attack_results.append(result)
+                'ts': batch_ts
+            })
             
             if not success:
                 blocked_attacks += 1
                 print(f"   ✅ BLOCKED by SDN controller")
             else:
-                print(f"   ⚠️  ALLOWED (legitimate access)")
-            
-            time.sleep(2)
+                print(f"   ⚠️  ALLOWED ({allowed_label})")
         
         return blocked_attacks, len(attacks)
     
+    async def run_lateral_movement_attacks(self):
+        """Simulate lateral movement attack campaign"""
+        return await self.run_campaign(
+            "🔴 LATERAL MOVEMENT ATTACK CAMPAIGN",
+            "Simulating attacker who compromised HR user attempting lateral movement...",
+            LATERAL_MOVEMENT_ATTACKS,
+            "legitimate or policy gap")
+    
+    async def run_insider_threat_simulation(self):
+        """Simulate malicious insider threat"""
+        return await self.run_campaign(
+            "🟡 INSIDER THREAT SIMULATION",
+            "Simulating malicious admin user attempting unauthorized access...",
+            INSIDER_THREAT_ATTACKS,
+            "legitimate access")
+    
     def generate_attack_commands_file(self):
         """Generate file with all attack commands for manual execution"""
         
@@ -292,18 +461,8 @@ class AutomatedAttackGenerator:
                 target_ip = target_parts[0]
                 target_port = int(target_parts[1]) if len(target_parts) > 1 else 80
                 
-                if result['type'] == 'http_attack':
-                    cmd = f"{source} curl -m 3 --connect-timeout 3 http://{target_ip}:{target_port}"
-                elif result['type'] == 'tcp_scan':
-                    cmd = f"{source} nc -z -w 3 {target_ip} {target_port}"
-                elif result['type'] == 'ssh_attempt':
-                    cmd = f"{source} nc -z -w 3 {target_ip} 22"
-                elif result['type'] == 'db_attack':
-                    cmd = f"{source} nc -z -w 3 {target_ip} 3306"
-                elif result['type'] == 'ping_sweep':
-                    cmd = f"{source} ping -c 2 -W 1 {target_ip}"
-                else:
-                    cmd = f"{source} ping -c 1 -W 1 {target_ip}"
+                argv = attack_argv(result['type'], target_ip, target_port)
+                cmd = f"{source} {' '.join(argv)}"
                 
                 commands.append({
                     'description': result['attack'],
@@ -312,40 +471,33 @@ class AutomatedAttackGenerator:
                 })
         
         # Save to file
-        with open('automated_attack_commands.txt', 'w') as f:
-            f.write("# AUTOMATED ATTACK COMMANDS FOR MININET CLI\n")
-            f.write("# Copy and paste these commands into your Mininet CLI\n")
-            f.write("# Each command generates REAL network traffic through your SDN controller\n")
-            f.write("# Watch 'tail -f security_events.log' to see real-time security events!\n\n")
-            
-            f.write("# QUICK EXECUTION SCRIPT:\n")
-            f.write("# You can also run all commands at once by copying this section:\n\n")
-            
-            for i, cmd_info in enumerate(commands, 1):
-                f.write(f"# {i}. {cmd_info['description']} (Expected: {cmd_info['expected']})\n")
-                f.write(f"{cmd_info['command']}\n")
-                f.write("sleep 1\n\n")
+        lines = [
+            "# AUTOMATED ATTACK COMMANDS FOR MININET CLI\n",
+            "# Copy and paste these commands into your Mininet CLI\n",
+            "# Each command generates REAL network traffic through your SDN controller\n",
+            "# Watch 'tail -f security_events.log' to see real-time security events!\n\n",
+            "# QUICK EXECUTION SCRIPT:\n",
+            "# You can also run all commands at once by copying this section:\n\n",
+        ]
+        for i, cmd_info in enumerate(commands, 1):
+            lines.append(f"# {i}. {cmd_info['description']} (Expected: {cmd_info['expected']})\n"
+                         f"{cmd_info['command']}\n"
+                         "sleep 1\n\n")
+        
+        write_atomic('automated_attack_commands.txt', ''.join(lines))
         
         # Also create a Python script for automated execution
-        with open('execute_attacks.py', 'w') as f:
-            f.write('#!/usr/bin/env python3\n')
-            f.write('"""\nAutomated Attack Execution Script\n')
-            f.write('Run this from within Mininet CLI: py execfile("execute_attacks.py")\n"""\n\n')
-            f.write('import time\n\n')
-            f.write('print("🚀 Executing automated attacks...")\n')
-            f.write('print("Watch security_events.log for real-time events!")\n\n')
-            
-            for i, cmd_info in enumerate(commands, 1):
-                host = cmd_info['command'].split()[0]
-                cmd = ' '.join(cmd_info['command'].split()[1:])
-                f.write(f'# {cmd_info["description"]}\n')
-                f.write(f'print("🔴 Attack {i}: {cmd_info["description"]}")\n')
-                f.write(f'result = {host}.cmd("{cmd}")\n')
-                f.write(f'print(f"   Result: {{result.strip()}}")\n')
-                f.write('time.sleep(1)\n\n')
-            
-            f.write('print("✅ All attacks completed!")\n')
-            f.write('print("Check security_events.log and web dashboard for results")\n')
+        attacks = []
+        for i, cmd_info in enumerate(commands, 1):
+            host, cmd = cmd_info['command'].split(' ', 1)
+            banner = f"🔴 Attack {i}: {cmd_info['description']}"
+            attacks.append(f"# {cmd_info['description']}\n"
+                           f"print({banner!r})\n"
+                           f"result = net.get({host!r}).cmd({cmd!r})\n"
+                           'print(f"   Result: {result.strip()}")\n'
+                           "time.sleep(1)\n\n")
+        
+        write_atomic('execute_attacks.py', EXECUTE_ATTACKS_TEMPLATE.format(attacks=''.join(attacks)))
         
         print(f"✅ Generated {len(commands)} attack commands")
         print("📄 Files created:")
@@ -356,6 +508,19 @@ class AutomatedAttackGenerator:
         print("2. AUTOMATED: In Mininet CLI run: py execfile('execute_attacks.py')")
         print("3. MONITORING: Watch logs with: tail -f security_events.log")
     
+    def format_attack_details(self):
+        """Return attack results with batch stamps rendered as ISO timestamps"""
+        stamps = {}
+        details = []
+        for result in self.attack_results:
+            detail = dict(result)
+            ts = detail.pop('ts')
+            if ts not in stamps:
+                stamps[ts] = datetime.fromtimestamp(ts).isoformat()
+            detail['timestamp'] = stamps[ts]
+            details.append(detail)
+        return details
+    
     def generate_comprehensive_report(self):
         """Generate comprehensive attack simulation report"""
         
@@ -381,11 +546,13 @@ class AutomatedAttackGenerator:
                 'blocked_attacks': blocked_attacks,
                 'effectiveness_percent': (blocked_attacks/total_attacks)*100 if total_attacks > 0 else 0
             },
-            'attack_details': self.attack_results
+            'attack_details': self.format_attack_details()
         }
         
-        with open('automated_attack_report.json', 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            write_atomic('automated_attack_report.json', orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            write_atomic('automated_attack_report.json', json.dumps(report, indent=2))
         
         print(f"\n📄 Detailed report saved: automated_attack_report.json")
         
@@ -396,8 +563,37 @@ class AutomatedAttackGenerator:
         else:
             print("🔴 POOR: Significant security gaps detected")
 
-def main():
-    """Run automated attack simulation"""
+def run_async(coro):
+    """Run a coroutine to completion, on a uvloop event loop when it is installed
+    
+    Only this run uses uvloop; the global event loop policy is left alone, since
+    main() may be called inside the long-lived Mininet CLI process.
+    """
+    if uvloop is None:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    
+    loop = uvloop.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+async def run_attack_campaigns(generator):
+    """Run both attack campaigns on a single event loop"""
+    lateral = await generator.run_lateral_movement_attacks()
+    insider = await generator.run_insider_threat_simulation()
+    return lateral, insider
+
+def main(net=None):
+    """Run automated attack simulation
+    
+    From the Mininet CLI pass the live network in:
+        mininet> py __import__('automated_attacks').main(net)
+    """
     
     print("🚀 AUTOMATED SDN ATTACK GENERATOR")
     print("=" * 50)
@@ -406,12 +602,10 @@ def main():
     print()
     
     # Check if running from within Mininet
-    use_api = False
-    if 'net' in globals():
-        use_api = True
+    if net is not None:
         print("✅ Running from within Mininet CLI - using direct API")
     
-    generator = AutomatedAttackGenerator(use_mininet_api=use_api)
+    generator = AutomatedAttackGenerator(net=net)
     
     # Setup Mininet connection
     if generator.setup_mininet_connection():
@@ -441,8 +635,9 @@ def main():
         print("   This will generate real network traffic and security events!")
         print()
         
-        lateral_blocked, lateral_total = generator.run_lateral_movement_attacks()
-        insider_blocked, insider_total = generator.run_insider_threat_simulation()
+        (lateral_blocked, lateral_total), (insider_blocked, insider_total) = \
+            run_async(run_attack_campaigns(generator))
+        generator.save_manual_commands()
         
         # Generate command files for execution
         generator.generate_attack_commands_file()
@@ -472,7 +667,6 @@ def main():
         print("\n\nAttack simulation interrupted by user")
     except Exception as e:
         print(f"\nError during attack simulation: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
@@ -4,41 +4,62 @@ Cloud Deployment Automation for SDN Micro-Segmentation
 Supports AWS, Azure, and GCP deployment with Infrastructure as Code
 """
 
+import functools
 import json
-import subprocess
-import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from string import Template
 
-class CloudDeploymentManager:
-    """
-    Manages cloud deployment across multiple cloud providers
-    """
-    
-    def __init__(self):
-        self.deployment_configs = {}
-        self.load_deployment_configs()
-    
-    def load_deployment_configs(self):
-        """Load cloud deployment configurations"""
-        
-        # AWS Deployment Configuration
-        self.deployment_configs["aws"] = {
-            "provider": "AWS",
-            "region": "us-east-1",
-            "instance_type": "t3.medium",
-            "ami_id": "ami-0c02fb55956c7d316",  # Ubuntu 20.04 LTS
-            "security_groups": [
-                {
-                    "name": "sdn-controller-sg",
-                    "description": "Security group for SDN controller",
-                    "rules": [
-                        {"protocol": "tcp", "port": 6653, "source": "0.0.0.0/0", "description": "OpenFlow"},
-                        {"protocol": "tcp", "port": 5000, "source": "0.0.0.0/0", "description": "Web Dashboard"},
-                        {"protocol": "tcp", "port": 22, "source": "0.0.0.0/0", "description": "SSH"}
-                    ]
-                }
-            ],
-            "user_data": """#!/bin/bash
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
+WRITE_BUFFER_SIZE = 1 << 16
+
+def write_bytes(path, data):
+    """Write pre-encoded bytes to path through one large binary buffer"""
+    with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(data)
+
+def serialize_json(obj):
+    """Serialize obj to indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def dump_json(obj, path):
+    """Write obj to path as indented JSON"""
+    write_bytes(path, serialize_json(obj))
+
+ServicePort = namedtuple('ServicePort', 'port name slug description')
+
+# Canonical port list every provider's firewall rules are built from
+CONTROLLER_PORTS = [
+    ServicePort(6653, "OpenFlow", "openflow", "OpenFlow"),
+    ServicePort(5000, "WebDashboard", "dashboard", "Web Dashboard")
+]
+SSH_PORT = ServicePort(22, "SSH", "ssh", "SSH")
+INGRESS_PORTS = CONTROLLER_PORTS + [SSH_PORT]
+
+# AWS Deployment Configuration
+AWS_DEPLOYMENT_CONFIG = {
+    "provider": "AWS",
+    "region": "us-east-1",
+    "instance_type": "t3.medium",
+    "ami_id": "ami-0c02fb55956c7d316",  # Ubuntu 20.04 LTS
+    "security_groups": [
+        {
+            "name": "sdn-controller-sg",
+            "description": "Security group for SDN controller",
+            "rules": [
+                {"protocol": "tcp", "port": p.port, "source": "0.0.0.0/0", "description": p.description}
+                for p in INGRESS_PORTS
+            ]
+        }
+    ],
+    "user_data": """#!/bin/bash
 apt-get update
 apt-get install -y python3 python3-pip docker.io docker-compose
 systemctl start docker
@@ -49,234 +70,75 @@ cd /opt/sdn
 pip3 install -r requirements.txt
 docker-compose up -d
 """
+}
+
+# Azure Deployment Configuration
+AZURE_DEPLOYMENT_CONFIG = {
+    "provider": "Azure",
+    "location": "East US",
+    "vm_size": "Standard_B2s",
+    "image": {
+        "publisher": "Canonical",
+        "offer": "0001-com-ubuntu-server-focal",
+        "sku": "20_04-lts-gen2",
+        "version": "latest"
+    },
+    "network_security_group": {
+        "name": "sdn-nsg",
+        "rules": [
+            {"name": p.name, "protocol": "Tcp", "port": str(p.port), "access": "Allow"}
+            for p in INGRESS_PORTS
+        ]
+    }
+}
+
+# GCP Deployment Configuration
+GCP_DEPLOYMENT_CONFIG = {
+    "provider": "GCP",
+    "zone": "us-central1-a",
+    "machine_type": "e2-medium",
+    "image_family": "ubuntu-2004-lts",
+    "image_project": "ubuntu-os-cloud",
+    "firewall_rules": [
+        {
+            "name": f"sdn-{p.slug}",
+            "direction": "INGRESS",
+            "ports": [str(p.port)],
+            "source_ranges": ["0.0.0.0/0"]
         }
-        
-        # Azure Deployment Configuration
-        self.deployment_configs["azure"] = {
-            "provider": "Azure",
-            "location": "East US",
-            "vm_size": "Standard_B2s",
-            "image": {
-                "publisher": "Canonical",
-                "offer": "0001-com-ubuntu-server-focal",
-                "sku": "20_04-lts-gen2",
-                "version": "latest"
-            },
-            "network_security_group": {
-                "name": "sdn-nsg",
-                "rules": [
-                    {"name": "OpenFlow", "protocol": "Tcp", "port": "6653", "access": "Allow"},
-                    {"name": "WebDashboard", "protocol": "Tcp", "port": "5000", "access": "Allow"},
-                    {"name": "SSH", "protocol": "Tcp", "port": "22", "access": "Allow"}
-                ]
-            }
-        }
-        
-        # GCP Deployment Configuration
-        self.deployment_configs["gcp"] = {
-            "provider": "GCP",
-            "zone": "us-central1-a",
-            "machine_type": "e2-medium",
-            "image_family": "ubuntu-2004-lts",
-            "image_project": "ubuntu-os-cloud",
-            "firewall_rules": [
-                {
-                    "name": "sdn-openflow",
-                    "direction": "INGRESS",
-                    "ports": ["6653"],
-                    "source_ranges": ["0.0.0.0/0"]
-                },
-                {
-                    "name": "sdn-dashboard",
-                    "direction": "INGRESS", 
-                    "ports": ["5000"],
-                    "source_ranges": ["0.0.0.0/0"]
-                }
-            ]
-        }
-    
-    def generate_aws_cloudformation(self):
-        """Generate AWS CloudFormation template"""
-        
-        template = {
-            "AWSTemplateFormatVersion": "2010-09-09",
-            "Description": "SDN Micro-Segmentation Cloud Security Infrastructure",
-            "Parameters": {
-                "KeyName": {
-                    "Type": "AWS::EC2::KeyPair::KeyName",
-                    "Description": "EC2 Key Pair for SSH access"
-                },
-                "InstanceType": {
-                    "Type": "String",
-                    "Default": "t3.medium",
-                    "Description": "EC2 instance type"
-                }
-            },
-            "Resources": {
-                "SDNSecurityGroup": {
-                    "Type": "AWS::EC2::SecurityGroup",
-                    "Properties": {
-                        "GroupDescription": "Security group for SDN Controller",
-                        "SecurityGroupIngress": [
-                            {
-                                "IpProtocol": "tcp",
-                                "FromPort": 6653,
-                                "ToPort": 6653,
-                                "CidrIp": "0.0.0.0/0",
-                                "Description": "OpenFlow Protocol"
-                            },
-                            {
-                                "IpProtocol": "tcp",
-                                "FromPort": 5000,
-                                "ToPort": 5000,
-                                "CidrIp": "0.0.0.0/0",
-                                "Description": "Web Dashboard"
-                            },
-                            {
-                                "IpProtocol": "tcp",
-                                "FromPort": 22,
-                                "ToPort": 22,
-                                "CidrIp": "0.0.0.0/0",
-                                "Description": "SSH Access"
-                            }
-                        ]
-                    }
-                },
-                "SDNControllerInstance": {
-                    "Type": "AWS::EC2::Instance",
-                    "Properties": {
-                        "ImageId": "ami-0c02fb55956c7d316",
-                        "InstanceType": {"Ref": "InstanceType"},
-                        "KeyName": {"Ref": "KeyName"},
-                        "SecurityGroupIds": [{"Ref": "SDNSecurityGroup"}],
-                        "UserData": {
-                            "Fn::Base64": {
-                                "Fn::Join": ["", [
-                                    "#!/bin/bash\n",
-                                    "apt-get update\n",
-                                    "apt-get install -y python3 python3-pip docker.io docker-compose git\n",
-                                    "systemctl start docker\n",
-                                    "systemctl enable docker\n",
-                                    "usermod -aG docker ubuntu\n",
-                                    "cd /opt\n",
-                                    "git clone https://github.com/your-repo/sdn-microsegmentation.git\n",
-                                    "cd sdn-microsegmentation\n",
-                                    "pip3 install -r requirements.txt\n",
-                                    "docker-compose up -d\n"
-                                ]]
-                            }
-                        },
-                        "Tags": [
-                            {"Key": "Name", "Value": "SDN-Controller"},
-                            {"Key": "Project", "Value": "Cloud-Security-Microsegmentation"}
-                        ]
-                    }
-                }
-            },
-            "Outputs": {
-                "InstanceId": {
-                    "Description": "Instance ID of the SDN Controller",
-                    "Value": {"Ref": "SDNControllerInstance"}
-                },
-                "PublicIP": {
-                    "Description": "Public IP address of the SDN Controller",
-                    "Value": {"Fn::GetAtt": ["SDNControllerInstance", "PublicIp"]}
-                },
-                "DashboardURL": {
-                    "Description": "URL for the Web Dashboard",
-                    "Value": {"Fn::Join": ["", ["http://", {"Fn::GetAtt": ["SDNControllerInstance", "PublicIp"]}, ":5000"]]}
-                }
-            }
-        }
-        
-        # Save CloudFormation template
-        with open('aws-cloudformation-template.json', 'w') as f:
-            json.dump(template, f, indent=2)
-        
-        print("✅ AWS CloudFormation template generated: aws-cloudformation-template.json")
-        return template
-    
-    def generate_azure_arm_template(self):
-        """Generate Azure ARM template"""
-        
-        template = {
-            "$schema": "https://schema.management.azure.com/schemas/2019-04-01/deploymentTemplate.json#",
-            "contentVersion": "1.0.0.0",
-            "parameters": {
-                "vmName": {
-                    "type": "string",
-                    "defaultValue": "sdn-controller-vm",
-                    "metadata": {"description": "Name of the virtual machine"}
-                },
-                "adminUsername": {
-                    "type": "string",
-                    "defaultValue": "azureuser",
-                    "metadata": {"description": "Admin username for the VM"}
-                },
-                "authenticationType": {
-                    "type": "string",
-                    "defaultValue": "sshPublicKey",
-                    "allowedValues": ["sshPublicKey", "password"]
-                }
-            },
-            "variables": {
-                "networkSecurityGroupName": "sdn-nsg",
-                "virtualNetworkName": "sdn-vnet",
-                "subnetName": "sdn-subnet",
-                "publicIPAddressName": "sdn-public-ip",
-                "networkInterfaceName": "sdn-nic"
-            },
-            "resources": [
-                {
-                    "type": "Microsoft.Network/networkSecurityGroups",
-                    "apiVersion": "2020-06-01",
-                    "name": "[variables('networkSecurityGroupName')]",
-                    "location": "[resourceGroup().location]",
-                    "properties": {
-                        "securityRules": [
-                            {
-                                "name": "OpenFlow",
-                                "properties": {
-                                    "protocol": "Tcp",
-                                    "sourcePortRange": "*",
-                                    "destinationPortRange": "6653",
-                                    "sourceAddressPrefix": "*",
-                                    "destinationAddressPrefix": "*",
-                                    "access": "Allow",
-                                    "priority": 1001,
-                                    "direction": "Inbound"
-                                }
-                            },
-                            {
-                                "name": "WebDashboard",
-                                "properties": {
-                                    "protocol": "Tcp",
-                                    "sourcePortRange": "*",
-                                    "destinationPortRange": "5000",
-                                    "sourceAddressPrefix": "*",
-                                    "destinationAddressPrefix": "*",
-                                    "access": "Allow",
-                                    "priority": 1002,
-                                    "direction": "Inbound"
-                                }
-                            }
-                        ]
-                    }
-                }
-            ]
-        }
-        
-        # Save ARM template
-        with open('azure-arm-template.json', 'w') as f:
-            json.dump(template, f, indent=2)
-        
-        print("✅ Azure ARM template generated: azure-arm-template.json")
-        return template
-    
-    def generate_terraform_config(self):
-        """Generate Terraform configuration for multi-cloud deployment"""
-        
-        terraform_config = '''# Terraform configuration for SDN Cloud Security
+        for p in CONTROLLER_PORTS
+    ]
+}
+
+REPO_URL = "https://github.com/your-repo/sdn-microsegmentation.git"
+CONTAINER_IMAGE = "sdn-microsegmentation:latest"
+
+# CloudFormation EC2 bootstrap, emitted as one string under Fn::Base64
+AWS_USER_DATA = f"""#!/bin/bash
+apt-get update
+apt-get install -y python3 python3-pip docker.io docker-compose git
+systemctl start docker
+systemctl enable docker
+usermod -aG docker ubuntu
+cd /opt
+git clone {REPO_URL}
+cd sdn-microsegmentation
+pip3 install -r requirements.txt
+docker-compose up -d
+"""
+
+# Text templates are compiled once at import and rendered per call
+TERRAFORM_INGRESS_TEMPLATE = Template('''  ingress {
+    from_port   = $port
+    to_port     = $port
+    protocol    = "tcp"
+    cidr_blocks = ["0.0.0.0/0"]
+    description = "$description"
+  }
+
+''')
+
+TERRAFORM_TEMPLATE = Template('''# Terraform configuration for SDN Cloud Security
 terraform {
   required_version = ">= 1.0"
   required_providers {
@@ -315,7 +177,7 @@ provider "google" {
 variable "aws_region" {
   description = "AWS region"
   type        = string
-  default     = "us-east-1"
+  default     = "$aws_region"
 }
 
 variable "gcp_project" {
@@ -334,23 +196,7 @@ resource "aws_security_group" "sdn_sg" {
   name_prefix = "sdn-controller-"
   description = "Security group for SDN Controller"
 
-  ingress {
-    from_port   = 6653
-    to_port     = 6653
-    protocol    = "tcp"
-    cidr_blocks = ["0.0.0.0/0"]
-    description = "OpenFlow"
-  }
-
-  ingress {
-    from_port   = 5000
-    to_port     = 5000
-    protocol    = "tcp"
-    cidr_blocks = ["0.0.0.0/0"]
-    description = "Web Dashboard"
-  }
-
-  egress {
+$ingress_rules  egress {
     from_port   = 0
     to_port     = 0
     protocol    = "-1"
@@ -364,12 +210,12 @@ resource "aws_security_group" "sdn_sg" {
 }
 
 resource "aws_instance" "sdn_controller" {
-  ami           = "ami-0c02fb55956c7d316"  # Ubuntu 20.04 LTS
-  instance_type = "t3.medium"
+  ami           = "$ami_id"  # Ubuntu 20.04 LTS
+  instance_type = "$instance_type"
   
   vpc_security_group_ids = [aws_security_group.sdn_sg.id]
   
-  user_data = base64encode(templatefile("${path.module}/user-data.sh", {}))
+  user_data = base64encode(templatefile("$${path.module}/user-data.sh", {}))
   
   tags = {
     Name    = "SDN-Controller"
@@ -385,16 +231,11 @@ output "aws_instance_ip" {
 
 output "dashboard_url" {
   description = "URL for the web dashboard"
-  value       = "http://${aws_instance.sdn_controller.public_ip}:5000"
+  value       = "http://$${aws_instance.sdn_controller.public_ip}:5000"
 }
-'''
-        
-        # Save Terraform configuration
-        with open('main.tf', 'w') as f:
-            f.write(terraform_config)
-        
-        # Create user data script
-        user_data_script = '''#!/bin/bash
+''')
+
+USER_DATA_TEMPLATE = Template('''#!/bin/bash
 set -e
 
 # Update system
@@ -411,7 +252,7 @@ usermod -aG docker ubuntu
 
 # Clone repository
 cd /opt
-git clone https://github.com/your-repo/sdn-microsegmentation.git
+git clone $repo_url
 cd sdn-microsegmentation
 
 # Install Python dependencies
@@ -443,19 +284,12 @@ systemctl enable sdn-controller.service
 systemctl start sdn-controller.service
 
 echo "SDN Controller deployment completed successfully!"
-'''
-        
-        with open('user-data.sh', 'w') as f:
-            f.write(user_data_script)
-        
-        print("✅ Terraform configuration generated: main.tf")
-        print("✅ User data script generated: user-data.sh")
-    
-    def generate_kubernetes_manifests(self):
-        """Generate Kubernetes manifests for container deployment"""
-        
-        # Deployment manifest
-        deployment_yaml = '''apiVersion: apps/v1
+''')
+
+# The user-data script depends only on module constants, so render and encode it once
+USER_DATA_BYTES = USER_DATA_TEMPLATE.substitute(repo_url=REPO_URL).encode('ascii')
+
+K8S_TEMPLATE = Template('''apiVersion: apps/v1
 kind: Deployment
 metadata:
   name: sdn-controller
@@ -474,7 +308,7 @@ spec:
     spec:
       containers:
       - name: sdn-controller
-        image: sdn-microsegmentation:latest
+        image: $image
         ports:
         - containerPort: 6653
           name: openflow
@@ -547,28 +381,273 @@ spec:
       port: 5000
   egress:
   - {}
-'''
+''')
+
+# CloudFormation and ARM templates are fully static: they are built and
+# serialized on first use, and the bytes are reused afterwards
+def build_aws_cloudformation():
+    """Build the AWS CloudFormation template"""
+    return {
+        "AWSTemplateFormatVersion": "2010-09-09",
+        "Description": "SDN Micro-Segmentation Cloud Security Infrastructure",
+        "Parameters": {
+            "KeyName": {
+                "Type": "AWS::EC2::KeyPair::KeyName",
+                "Description": "EC2 Key Pair for SSH access"
+            },
+            "InstanceType": {
+                "Type": "String",
+                "Default": AWS_DEPLOYMENT_CONFIG["instance_type"],
+                "Description": "EC2 instance type"
+            }
+        },
+        "Resources": {
+            "SDNSecurityGroup": {
+                "Type": "AWS::EC2::SecurityGroup",
+                "Properties": {
+                    "GroupDescription": "Security group for SDN Controller",
+                    "SecurityGroupIngress": [
+                        {
+                            "IpProtocol": "tcp",
+                            "FromPort": p.port,
+                            "ToPort": p.port,
+                            "CidrIp": "0.0.0.0/0",
+                            "Description": p.description
+                        }
+                        for p in INGRESS_PORTS
+                    ]
+                }
+            },
+            "SDNControllerInstance": {
+                "Type": "AWS::EC2::Instance",
+                "Properties": {
+                    "ImageId": AWS_DEPLOYMENT_CONFIG["ami_id"],
+                    "InstanceType": {"Ref": "InstanceType"},
+                    "KeyName": {"Ref": "KeyName"},
+                    "SecurityGroupIds": [{"Ref": "SDNSecurityGroup"}],
+                    "UserData": {"Fn::Base64": AWS_USER_DATA},
+                    "Tags": [
+                        {"Key": "Name", "Value": "SDN-Controller"},
+                        {"Key": "Project", "Value": "Cloud-Security-Microsegmentation"}
+                    ]
+                }
+            }
+        },
+        "Outputs": {
+            "InstanceId": {
+                "Description": "Instance ID of the SDN Controller",
+                "Value": {"Ref": "SDNControllerInstance"}
+            },
+            "PublicIP": {
+                "Description": "Public IP address of the SDN Controller",
+                "Value": {"Fn::GetAtt": ["SDNControllerInstance", "PublicIp"]}
+            },
+            "DashboardURL": {
+                "Description": "URL for the Web Dashboard",
+                "Value": {"Fn::Join": ["", ["http://", {"Fn::GetAtt": ["SDNControllerInstance", "PublicIp"]}, ":5000"]]}
+            }
+        }
+    }
+
+@functools.cache
+def aws_cloudformation_json():
+    """Serialized CloudFormation template, built once"""
+    return serialize_json(build_aws_cloudformation())
+
+def aws_cloudformation_dict():
+    """Parsed CloudFormation template, for callers that need the dict"""
+    return json.loads(aws_cloudformation_json())
+
+def build_azure_arm_template():
+    """Build the Azure ARM template"""
+    return {
+        "$schema": "https://schema.management.azure.com/schemas/2019-04-01/deploymentTemplate.json#",
+        "contentVersion": "1.0.0.0",
+        "parameters": {
+            "vmName": {
+                "type": "string",
+                "defaultValue": "sdn-controller-vm",
+                "metadata": {"description": "Name of the virtual machine"}
+            },
+            "adminUsername": {
+                "type": "string",
+                "defaultValue": "azureuser",
+                "metadata": {"description": "Admin username for the VM"}
+            },
+            "authenticationType": {
+                "type": "string",
+                "defaultValue": "sshPublicKey",
+                "allowedValues": ["sshPublicKey", "password"]
+            }
+        },
+        "variables": {
+            "networkSecurityGroupName": "sdn-nsg",
+            "virtualNetworkName": "sdn-vnet",
+            "subnetName": "sdn-subnet",
+            "publicIPAddressName": "sdn-public-ip",
+            "networkInterfaceName": "sdn-nic"
+        },
+        "resources": [
+            {
+                "type": "Microsoft.Network/networkSecurityGroups",
+                "apiVersion": "2020-06-01",
+                "name": "[variables('networkSecurityGroupName')]",
+                "location": "[resourceGroup().location]",
+                "properties": {
+                    "securityRules": [
+                        {
+                            "name": p.name,
+                            "properties": {
+                                "protocol": "Tcp",
+                                "sourcePortRange": "*",
+                                "destinationPortRange": str(p.port),
+                                "sourceAddressPrefix": "*",
+                                "destinationAddressPrefix": "*",
+                                "access": "Allow",
+                                "priority": 1000 + priority,
+                                "direction": "Inbound"
+                            }
+                        }
+                        for priority, p in enumerate(CONTROLLER_PORTS, 1)
+                    ]
+                }
+            }
+        ]
+    }
+
+@functools.cache
+def azure_arm_json():
+    """Serialized ARM template, built once"""
+    return serialize_json(build_azure_arm_template())
+
+def azure_arm_dict():
+    """Parsed ARM template, for callers that need the dict"""
+    return json.loads(azure_arm_json())
+
+# Deployment target -> CloudDeploymentManager generator method
+DEPLOYMENT_GENERATORS = {
+    "aws": "generate_aws_cloudformation",
+    "azure": "generate_azure_arm_template",
+    "terraform": "generate_terraform_config",
+    "kubernetes": "generate_kubernetes_manifests"
+}
+
+# Static console output, emitted with a single write each
+DEPLOYMENT_REPORT = """
+📋 DEPLOYMENT OPTIONS GENERATED:
+✅ AWS CloudFormation template
+✅ Azure ARM template
+✅ Terraform multi-cloud configuration
+✅ Kubernetes deployment manifests
+✅ Docker Compose configuration
+
+🎯 DEPLOYMENT INSTRUCTIONS:
+AWS: aws cloudformation create-stack --template-body file://aws-cloudformation-template.json
+Azure: az deployment group create --template-file azure-arm-template.json
+Terraform: terraform init && terraform apply
+Kubernetes: kubectl apply -f k8s-deployment.yaml
+Docker: docker-compose up -d"""
+
+DEPLOYMENT_TARGETS_BANNER = """
+🏆 CLOUD DEPLOYMENT READY!
+Your SDN micro-segmentation system can now be deployed to:
+☁️  AWS (CloudFormation)
+☁️  Azure (ARM Templates)
+☁️  GCP (Terraform)
+🐳 Kubernetes (Any cluster)
+🐳 Docker (Local development)"""
+
+class CloudDeploymentManager:
+    """
+    Manages cloud deployment across multiple cloud providers
+    """
+    
+    def __init__(self):
+        self.deployment_configs = {}
+        self.load_deployment_configs()
+    
+    def load_deployment_configs(self):
+        """Load cloud deployment configurations"""
+        
+        self.deployment_configs = {
+            "aws": AWS_DEPLOYMENT_CONFIG,
+            "azure": AZURE_DEPLOYMENT_CONFIG,
+            "gcp": GCP_DEPLOYMENT_CONFIG
+        }
+    
+    def generate_aws_cloudformation(self):
+        """Generate AWS CloudFormation template"""
         
-        with open('k8s-deployment.yaml', 'w') as f:
-            f.write(deployment_yaml)
+        # Save CloudFormation template
+        template_json = aws_cloudformation_json()
+        write_bytes('aws-cloudformation-template.json', template_json)
+        
+        print("✅ AWS CloudFormation template generated: aws-cloudformation-template.json")
+        return template_json
+    
+    def generate_azure_arm_template(self):
+        """Generate Azure ARM template"""
+        
+        # Save ARM template
+        template_json = azure_arm_json()
+        write_bytes('azure-arm-template.json', template_json)
+        
+        print("✅ Azure ARM template generated: azure-arm-template.json")
+        return template_json
+    
+    def generate_terraform_config(self):
+        """Generate Terraform configuration for multi-cloud deployment"""
+        
+        aws = self.deployment_configs["aws"]
+        ingress_rules = ''.join(
+            TERRAFORM_INGRESS_TEMPLATE.substitute(port=p.port, description=p.description)
+            for p in CONTROLLER_PORTS
+        )
+        terraform_config = TERRAFORM_TEMPLATE.substitute(
+            ingress_rules=ingress_rules,
+            aws_region=aws["region"],
+            ami_id=aws["ami_id"],
+            instance_type=aws["instance_type"]
+        )
+        
+        # Save Terraform configuration
+        write_bytes('main.tf', terraform_config.encode('ascii'))
+        
+        # Create user data script
+        write_bytes('user-data.sh', USER_DATA_BYTES)
+        
+        print("✅ Terraform configuration generated: main.tf")
+        print("✅ User data script generated: user-data.sh")
+    
+    def generate_kubernetes_manifests(self):
+        """Generate Kubernetes manifests for container deployment"""
+        
+        # Deployment manifest
+        deployment_yaml = K8S_TEMPLATE.substitute(image=CONTAINER_IMAGE)
+        
+        write_bytes('k8s-deployment.yaml', deployment_yaml.encode('ascii'))
         
         print("✅ Kubernetes manifests generated: k8s-deployment.yaml")
     
+    def generate(self, target):
+        """Generate the deployment artifacts for a single target"""
+        if target not in DEPLOYMENT_GENERATORS:
+            raise ValueError(f"Unknown deployment target: {target}")
+        return getattr(self, DEPLOYMENT_GENERATORS[target])()
+    
     def generate_deployment_scripts(self):
         """Generate all deployment configurations"""
         
-        print("🚀 GENERATING CLOUD DEPLOYMENT CONFIGURATIONS")
-        print("=" * 60)
+        generated_at = datetime.now().isoformat()
+        print("🚀 GENERATING CLOUD DEPLOYMENT CONFIGURATIONS\n" + "=" * 60)
         
-        # Generate all templates
-        self.generate_aws_cloudformation()
-        self.generate_azure_arm_template()
-        self.generate_terraform_config()
-        self.generate_kubernetes_manifests()
+        # Generate all templates; each writes its own files, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(DEPLOYMENT_GENERATORS)) as executor:
+            list(executor.map(self.generate, DEPLOYMENT_GENERATORS))
         
         # Create deployment summary
         summary = {
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": generated_at,
             "deployment_options": {
                 "aws": {
                     "template": "aws-cloudformation-template.json",
@@ -593,22 +672,9 @@ spec:
             }
         }
         
-        with open('deployment-summary.json', 'w') as f:
-            json.dump(summary, f, indent=2)
-        
-        print("\n📋 DEPLOYMENT OPTIONS GENERATED:")
-        print("✅ AWS CloudFormation template")
-        print("✅ Azure ARM template")
-        print("✅ Terraform multi-cloud configuration")
-        print("✅ Kubernetes deployment manifests")
-        print("✅ Docker Compose configuration")
+        dump_json(summary, 'deployment-summary.json')
         
-        print(f"\n🎯 DEPLOYMENT INSTRUCTIONS:")
-        print("AWS: aws cloudformation create-stack --template-body file://aws-cloudformation-template.json")
-        print("Azure: az deployment group create --template-file azure-arm-template.json")
-        print("Terraform: terraform init && terraform apply")
-        print("Kubernetes: kubectl apply -f k8s-deployment.yaml")
-        print("Docker: docker-compose up -d")
+        print(DEPLOYMENT_REPORT)
 
 def main():
     """Main function to generate cloud deployment configurations"""
@@ -616,13 +682,7 @@ def main():
     deployment_manager = CloudDeploymentManager()
     deployment_manager.generate_deployment_scripts()
     
-    print(f"\n🏆 CLOUD DEPLOYMENT READY!")
-    print("Your SDN micro-segmentation system can now be deployed to:")
-    print("☁️  AWS (CloudFormation)")
-    print("☁️  Azure (ARM Templates)")
-    print("☁️  GCP (Terraform)")
-    print("🐳 Kubernetes (Any cluster)")
-    print("🐳 Docker (Local development)")
+    print(DEPLOYMENT_TARGETS_BANNER)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
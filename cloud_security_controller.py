@@ -5,11 +5,295 @@ Implements cloud-specific security features including multi-tenancy,
 compliance automation, and container security policies.
 """
 
+import atexit
+import hashlib
+import io
 import json
+import os
 import time
 import logging
-from datetime import datetime
-from collections import defaultdict
+import queue
+import random
+import sys
+from collections import defaultdict, deque, namedtuple
+from dataclasses import dataclass
+from enum import IntEnum
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
+def json_default(obj):
+    """Serialize the bounded containers used for event history"""
+    if isinstance(obj, (deque, frozenset, set, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def serialize_json(obj):
+    """Serialize obj to indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=json_default, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, default=json_default, indent=2).encode('utf-8')
+
+# Event retention limits; totals are counted separately so they stay exact
+MAX_CLOUD_EVENTS = 10000
+MAX_POLICY_VIOLATIONS = 1000
+RECENT_EVENTS_IN_REPORT = 20
+
+class ComplianceFramework(IntEnum):
+    """Compliance frameworks with resource-level checks"""
+    HIPAA = 0
+    PCI_DSS = 1
+    SOC2 = 2
+
+class ResourceType(IntEnum):
+    """Resource types covered by compliance checks"""
+    PATIENT_DATA = 0
+    MEDICAL_RECORDS = 1
+    PAYMENT_DATA = 2
+    CARD_DATA = 3
+
+FRAMEWORK_IDS = {
+    "HIPAA": ComplianceFramework.HIPAA,
+    "PCI-DSS": ComplianceFramework.PCI_DSS,
+    "SOC2": ComplianceFramework.SOC2
+}
+RESOURCE_IDS = {resource.name.lower(): resource for resource in ResourceType}
+
+# Per-framework resource checks: (framework, resource types, [(requirement, violation message)])
+COMPLIANCE_RESOURCE_RULES = [
+    ("HIPAA", ("patient_data", "medical_records"), [
+        ("encryption_at_rest", "HIPAA: Encryption at rest required"),
+        ("audit_trail", "HIPAA: Audit trail required")
+    ]),
+    ("PCI-DSS", ("payment_data", "card_data"), [
+        ("network_segmentation", "PCI-DSS: Network segmentation required"),
+        ("access_control", "PCI-DSS: Access control required")
+    ])
+]
+
+# Cloud security events, kept as tuples and converted to dicts only for reports
+IsolationViolationEvent = namedtuple('IsolationViolationEvent', 'timestamp type source_tenant dest_tenant resource action severity')
+ComplianceViolationEvent = namedtuple('ComplianceViolationEvent', 'timestamp type compliance_framework violation tenant severity')
+ContainerScalingEvent = namedtuple('ContainerScalingEvent', 'timestamp type tenant application current_replicas target_replicas action')
+PolicyApplicationEvent = namedtuple('PolicyApplicationEvent', 'timestamp type tenant application security_group new_instances')
+ThreatDetectedEvent = namedtuple('ThreatDetectedEvent', 'timestamp type threat_name severity description action_taken')
+
+# Simulated threat signatures checked by detect_cloud_threats
+THREAT_PATTERNS = (
+    {
+        "name": "Unusual Cross-Tenant Access",
+        "pattern": "cross_tenant_access",
+        "severity": "HIGH",
+        "description": "Detected unusual cross-tenant communication"
+    },
+    {
+        "name": "Compliance Policy Violation",
+        "pattern": "compliance_violation", 
+        "severity": "HIGH",
+        "description": "Detected violation of compliance policies"
+    },
+    {
+        "name": "Container Escape Attempt",
+        "pattern": "container_escape",
+        "severity": "CRITICAL",
+        "description": "Detected potential container escape attempt"
+    },
+    {
+        "name": "Data Exfiltration",
+        "pattern": "data_exfiltration",
+        "severity": "CRITICAL",
+        "description": "Detected unusual data transfer patterns"
+    }
+)
+THREAT_DETECTION_RATE = 0.1
+
+# Access scenarios exercised by run_cloud_security_simulation
+SIMULATION_SCENARIOS = (
+    {
+        "name": "Multi-Tenant Isolation Test",
+        "source_tenant": "healthcare_tenant",
+        "dest_tenant": "finance_tenant",
+        "resource": "patient_data",
+        "expected": False
+    },
+    {
+        "name": "HIPAA Compliance Check",
+        "source_tenant": "healthcare_tenant",
+        "dest_tenant": "healthcare_tenant",
+        "resource": "patient_data",
+        "expected": True
+    },
+    {
+        "name": "PCI-DSS Compliance Check",
+        "source_tenant": "finance_tenant",
+        "dest_tenant": "finance_tenant", 
+        "resource": "payment_data",
+        "expected": True
+    },
+    {
+        "name": "Cross-Tenant Data Access",
+        "source_tenant": "retail_tenant",
+        "dest_tenant": "healthcare_tenant",
+        "resource": "medical_records",
+        "expected": False
+    }
+)
+
+def freeze(value):
+    """Recursively convert config dicts and lists into read-only mappings and tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+# Multi-tenant configuration (like AWS Organizations)
+TENANT_CONFIG = freeze({
+    "healthcare_tenant": {
+        "tenant_id": "tenant-001",
+        "compliance": ["HIPAA", "SOC2"],
+        "isolation_level": "strict",
+        "allowed_regions": ["us-east-1", "us-west-2"],
+        "security_groups": ["healthcare_sg", "hipaa_sg"],
+        "data_classification": "sensitive"
+    },
+    "finance_tenant": {
+        "tenant_id": "tenant-002", 
+        "compliance": ["PCI-DSS", "SOX"],
+        "isolation_level": "strict",
+        "allowed_regions": ["us-east-1"],
+        "security_groups": ["finance_sg", "pci_sg"],
+        "data_classification": "restricted"
+    },
+    "retail_tenant": {
+        "tenant_id": "tenant-003",
+        "compliance": ["PCI-DSS"],
+        "isolation_level": "standard",
+        "allowed_regions": ["us-east-1", "us-west-2", "eu-west-1"],
+        "security_groups": ["retail_sg"],
+        "data_classification": "internal"
+    }
+})
+
+# Cloud Security Groups (like AWS Security Groups)
+SECURITY_GROUP_CONFIG = freeze({
+    "web_tier_sg": {
+        "description": "Web tier security group",
+        "inbound_rules": [
+            {"protocol": "tcp", "port": 80, "source": "0.0.0.0/0", "description": "HTTP"},
+            {"protocol": "tcp", "port": 443, "source": "0.0.0.0/0", "description": "HTTPS"}
+        ],
+        "outbound_rules": [
+            {"protocol": "tcp", "port": 8080, "destination": "app_tier_sg", "description": "To App Tier"}
+        ]
+    },
+    "app_tier_sg": {
+        "description": "Application tier security group",
+        "inbound_rules": [
+            {"protocol": "tcp", "port": 8080, "source": "web_tier_sg", "description": "From Web Tier"}
+        ],
+        "outbound_rules": [
+            {"protocol": "tcp", "port": 3306, "destination": "db_tier_sg", "description": "To Database"},
+            {"protocol": "tcp", "port": 6379, "destination": "cache_tier_sg", "description": "To Cache"}
+        ]
+    },
+    "db_tier_sg": {
+        "description": "Database tier security group",
+        "inbound_rules": [
+            {"protocol": "tcp", "port": 3306, "source": "app_tier_sg", "description": "MySQL from App"}
+        ],
+        "outbound_rules": []
+    },
+    "healthcare_sg": {
+        "description": "HIPAA compliant security group",
+        "inbound_rules": [
+            {"protocol": "tcp", "port": 443, "source": "healthcare_vpc", "description": "HTTPS only"}
+        ],
+        "outbound_rules": [
+            {"protocol": "tcp", "port": 443, "destination": "healthcare_vpc", "description": "HTTPS only"}
+        ],
+        "encryption_required": True,
+        "audit_logging": True
+    }
+})
+
+# Compliance Policies (like AWS Config Rules)
+COMPLIANCE_POLICY_CONFIG = freeze({
+    "HIPAA": {
+        "name": "Health Insurance Portability and Accountability Act",
+        "requirements": {
+            "encryption_at_rest": True,
+            "encryption_in_transit": True,
+            "access_logging": True,
+            "data_residency": ["us-east-1", "us-west-2"],
+            "network_segmentation": True,
+            "audit_trail": True
+        }
+    },
+    "PCI-DSS": {
+        "name": "Payment Card Industry Data Security Standard",
+        "requirements": {
+            "network_segmentation": True,
+            "firewall_configuration": True,
+            "access_control": True,
+            "vulnerability_scanning": True,
+            "security_testing": True,
+            "audit_logging": True
+        }
+    },
+    "SOC2": {
+        "name": "Service Organization Control 2",
+        "requirements": {
+            "security_controls": True,
+            "availability_controls": True,
+            "processing_integrity": True,
+            "confidentiality": True,
+            "privacy": True
+        }
+    }
+})
+
+# Container Security Policies (like Kubernetes Network Policies)
+CONTAINER_POLICY_CONFIG = freeze({
+    "default_deny": {
+        "description": "Default deny all traffic",
+        "policy_type": "NetworkPolicy",
+        "spec": {
+            "podSelector": {},
+            "policyTypes": ["Ingress", "Egress"]
+        }
+    },
+    "web_to_api": {
+        "description": "Allow web pods to communicate with API pods",
+        "policy_type": "NetworkPolicy",
+        "spec": {
+            "podSelector": {"matchLabels": {"app": "web"}},
+            "egress": [
+                {
+                    "to": [{"podSelector": {"matchLabels": {"app": "api"}}}],
+                    "ports": [{"protocol": "TCP", "port": 8080}]
+                }
+            ]
+        }
+    }
+})
+
+@dataclass
+class TenantRecord:
+    """Compact, attribute-access view of a tenant's static configuration"""
+    __slots__ = ("tenant_id", "compliance", "isolation_level", "allowed_regions",
+                 "security_groups", "data_classification")
+    tenant_id: str
+    compliance: tuple
+    isolation_level: str
+    allowed_regions: frozenset
+    security_groups: tuple
+    data_classification: str
 
 class CloudSecurityController:
     """
@@ -21,9 +305,14 @@ class CloudSecurityController:
         self.tenants = {}
         self.security_groups = {}
         self.compliance_policies = {}
-        self.cloud_events = []
+        self.cloud_events = deque(maxlen=MAX_CLOUD_EVENTS)
+        self.event_count = 0
+        self.policy_violations = defaultdict(lambda: deque(maxlen=MAX_POLICY_VIOLATIONS))
+        self.violation_counts = defaultdict(int)
         self.container_policies = {}
         self.threat_intelligence = {}
+        self.timestamp_cache = (0, "")
+        self.last_report_hash = None
         
         # Setup logging
         self.setup_cloud_logging()
@@ -41,207 +330,183 @@ class CloudSecurityController:
         )
         self.logger = logging.getLogger('CloudSecurity')
         
-        # Create cloud security log file
+        # Create cloud security log file, written by a background listener thread
         cloud_handler = logging.FileHandler('cloud_security_events.log')
         cloud_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-        self.logger.addHandler(cloud_handler)
+        log_queue = queue.Queue(-1)
+        self.logger.addHandler(QueueHandler(log_queue))
+        self.log_listener = QueueListener(log_queue, cloud_handler, respect_handler_level=True)
+        self.log_listener.start()
+        atexit.register(self.log_listener.stop)
     
     def load_cloud_security_config(self):
         """Load cloud security configurations"""
         
-        # Multi-tenant configuration (like AWS Organizations)
-        self.tenants = {
-            "healthcare_tenant": {
-                "tenant_id": "tenant-001",
-                "compliance": ["HIPAA", "SOC2"],
-                "isolation_level": "strict",
-                "allowed_regions": ["us-east-1", "us-west-2"],
-                "security_groups": ["healthcare_sg", "hipaa_sg"],
-                "data_classification": "sensitive"
-            },
-            "finance_tenant": {
-                "tenant_id": "tenant-002", 
-                "compliance": ["PCI-DSS", "SOX"],
-                "isolation_level": "strict",
-                "allowed_regions": ["us-east-1"],
-                "security_groups": ["finance_sg", "pci_sg"],
-                "data_classification": "restricted"
-            },
-            "retail_tenant": {
-                "tenant_id": "tenant-003",
-                "compliance": ["PCI-DSS"],
-                "isolation_level": "standard",
-                "allowed_regions": ["us-east-1", "us-west-2", "eu-west-1"],
-                "security_groups": ["retail_sg"],
-                "data_classification": "internal"
-            }
-        }
-        
-        # Cloud Security Groups (like AWS Security Groups)
-        self.security_groups = {
-            "web_tier_sg": {
-                "description": "Web tier security group",
-                "inbound_rules": [
-                    {"protocol": "tcp", "port": 80, "source": "0.0.0.0/0", "description": "HTTP"},
-                    {"protocol": "tcp", "port": 443, "source": "0.0.0.0/0", "description": "HTTPS"}
-                ],
-                "outbound_rules": [
-                    {"protocol": "tcp", "port": 8080, "destination": "app_tier_sg", "description": "To App Tier"}
-                ]
-            },
-            "app_tier_sg": {
-                "description": "Application tier security group",
-                "inbound_rules": [
-                    {"protocol": "tcp", "port": 8080, "source": "web_tier_sg", "description": "From Web Tier"}
-                ],
-                "outbound_rules": [
-                    {"protocol": "tcp", "port": 3306, "destination": "db_tier_sg", "description": "To Database"},
-                    {"protocol": "tcp", "port": 6379, "destination": "cache_tier_sg", "description": "To Cache"}
-                ]
-            },
-            "db_tier_sg": {
-                "description": "Database tier security group",
-                "inbound_rules": [
-                    {"protocol": "tcp", "port": 3306, "source": "app_tier_sg", "description": "MySQL from App"}
-                ],
-                "outbound_rules": []
-            },
-            "healthcare_sg": {
-                "description": "HIPAA compliant security group",
-                "inbound_rules": [
-                    {"protocol": "tcp", "port": 443, "source": "healthcare_vpc", "description": "HTTPS only"}
-                ],
-                "outbound_rules": [
-                    {"protocol": "tcp", "port": 443, "destination": "healthcare_vpc", "description": "HTTPS only"}
-                ],
-                "encryption_required": True,
-                "audit_logging": True
-            }
-        }
+        # Static configuration is shared read-only across controller instances
+        self.tenants = TENANT_CONFIG
+        self.security_groups = SECURITY_GROUP_CONFIG
+        self.compliance_policies = COMPLIANCE_POLICY_CONFIG
+        self.container_policies = CONTAINER_POLICY_CONFIG
         
-        # Compliance Policies (like AWS Config Rules)
-        self.compliance_policies = {
-            "HIPAA": {
-                "name": "Health Insurance Portability and Accountability Act",
-                "requirements": {
-                    "encryption_at_rest": True,
-                    "encryption_in_transit": True,
-                    "access_logging": True,
-                    "data_residency": ["us-east-1", "us-west-2"],
-                    "network_segmentation": True,
-                    "audit_trail": True
-                },
-                "violations": []
-            },
-            "PCI-DSS": {
-                "name": "Payment Card Industry Data Security Standard",
-                "requirements": {
-                    "network_segmentation": True,
-                    "firewall_configuration": True,
-                    "access_control": True,
-                    "vulnerability_scanning": True,
-                    "security_testing": True,
-                    "audit_logging": True
-                },
-                "violations": []
-            },
-            "SOC2": {
-                "name": "Service Organization Control 2",
-                "requirements": {
-                    "security_controls": True,
-                    "availability_controls": True,
-                    "processing_integrity": True,
-                    "confidentiality": True,
-                    "privacy": True
-                },
-                "violations": []
-            }
+        self.build_tenant_records()
+        self.build_compliance_rules()
+        self.build_security_group_index()
+    
+    def build_tenant_records(self):
+        """Convert tenant config dicts into slotted records for the access-check paths"""
+        self.tenant_records = {
+            name: TenantRecord(
+                tenant_id=config["tenant_id"],
+                compliance=tuple(config["compliance"]),
+                isolation_level=config["isolation_level"],
+                allowed_regions=frozenset(config["allowed_regions"]),
+                security_groups=tuple(config["security_groups"]),
+                data_classification=config["data_classification"]
+            )
+            for name, config in self.tenants.items()
         }
         
-        # Container Security Policies (like Kubernetes Network Policies)
-        self.container_policies = {
-            "default_deny": {
-                "description": "Default deny all traffic",
-                "policy_type": "NetworkPolicy",
-                "spec": {
-                    "podSelector": {},
-                    "policyTypes": ["Ingress", "Egress"]
-                }
-            },
-            "web_to_api": {
-                "description": "Allow web pods to communicate with API pods",
-                "policy_type": "NetworkPolicy",
-                "spec": {
-                    "podSelector": {"matchLabels": {"app": "web"}},
-                    "egress": [
-                        {
-                            "to": [{"podSelector": {"matchLabels": {"app": "api"}}}],
-                            "ports": [{"protocol": "TCP", "port": 8080}]
-                        }
-                    ]
-                }
+        # Tenant config is static, so the report summary is built once here
+        self.tenant_summary = {
+            name: {
+                "compliance_frameworks": list(record.compliance),
+                "isolation_level": record.isolation_level,
+                "data_classification": record.data_classification,
+                "security_groups": len(record.security_groups)
             }
+            for name, record in self.tenant_records.items()
         }
     
+    def build_compliance_rules(self):
+        """Index compliance checks as a [framework][resource] table of integer ids"""
+        self.compliance_cache = {}
+        self.compliance_rule_table = [[() for _ in ResourceType] for _ in ComplianceFramework]
+        for framework, resources, rules in COMPLIANCE_RESOURCE_RULES:
+            for resource in resources:
+                self.compliance_rule_table[FRAMEWORK_IDS[framework]][RESOURCE_IDS[resource]] = tuple(rules)
+        
+        self.compliance_requirements = [{} for _ in ComplianceFramework]
+        for framework, policy in self.compliance_policies.items():
+            if framework in FRAMEWORK_IDS:
+                self.compliance_requirements[FRAMEWORK_IDS[framework]] = policy["requirements"]
+        self.build_isolation_table()
+    
+    def build_isolation_table(self):
+        """Precompute access decisions for every (source, destination, resource) triple"""
+        resources = list(RESOURCE_IDS)
+        self.isolation_table = {}
+        for source_tenant, record in self.tenant_records.items():
+            for dest_tenant in self.tenant_records:
+                for resource in resources:
+                    self.isolation_table[(source_tenant, dest_tenant, resource)] = (
+                        source_tenant == dest_tenant and
+                        not any(self.compliance_violations(framework, resource) for framework in record.compliance)
+                    )
+    
+    def build_security_group_index(self):
+        """Index security group rules by peer: sg -> direction -> peer -> {(protocol, port)}"""
+        self.security_group_index = {}
+        for sg_name, sg in self.security_groups.items():
+            index = {}
+            for direction, rules_key, peer_key in (("inbound", "inbound_rules", "source"),
+                                                   ("outbound", "outbound_rules", "destination")):
+                by_peer = defaultdict(set)
+                for rule in sg.get(rules_key, []):
+                    by_peer[rule[peer_key]].add((rule["protocol"], rule["port"]))
+                index[direction] = {peer: frozenset(flows) for peer, flows in by_peer.items()}
+            self.security_group_index[sg_name] = index
+    
+    def allows_traffic(self, sg_name, direction, protocol, port, peer):
+        """Check whether a security group has a rule matching the given flow"""
+        peers = self.security_group_index.get(sg_name, {}).get(direction, {})
+        return (protocol, port) in peers.get(peer, ())
+    
+    def now_iso(self):
+        """Current local time in ISO format, formatting the date part once per second"""
+        now = time.time()
+        second = int(now)
+        if second != self.timestamp_cache[0]:
+            self.timestamp_cache = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second)))
+        return f"{self.timestamp_cache[1]}.{int((now - second) * 1e6):06d}"
+    
+    def record_event(self, event):
+        """Append a cloud security event to the bounded event history"""
+        self.cloud_events.append(event)
+        self.event_count += 1
+    
     def validate_multi_tenant_isolation(self, source_tenant, dest_tenant, resource_type):
         """Validate multi-tenant isolation (like AWS Organizations SCPs)"""
         
+        if self.isolation_table.get((source_tenant, dest_tenant, resource_type)):
+            return True
+        
         if source_tenant == dest_tenant:
-            # Same tenant - check internal policies
+            # Same tenant - check internal policies (logs any compliance violations)
             return self.validate_intra_tenant_access(source_tenant, resource_type)
         
         # Cross-tenant access - generally blocked
-        violation = {
-            "timestamp": datetime.now().isoformat(),
-            "type": "TENANT_ISOLATION_VIOLATION",
-            "source_tenant": source_tenant,
-            "dest_tenant": dest_tenant,
-            "resource": resource_type,
-            "action": "BLOCKED",
-            "severity": "HIGH"
-        }
+        violation = IsolationViolationEvent(
+            timestamp=self.now_iso(),
+            type="TENANT_ISOLATION_VIOLATION",
+            source_tenant=source_tenant,
+            dest_tenant=dest_tenant,
+            resource=resource_type,
+            action="BLOCKED",
+            severity="HIGH"
+        )
         
-        self.cloud_events.append(violation)
-        self.logger.warning(f"Blocked cross-tenant access: {source_tenant} -> {dest_tenant}")
+        self.record_event(violation)
+        self.logger.warning("Blocked cross-tenant access: %s -> %s", source_tenant, dest_tenant)
         
         return False
     
+    def validate_access_batch(self, requests):
+        """Validate many (source, destination, resource) requests in one pass"""
+        
+        # Allowed entries are answered straight from the table; only denials and
+        # unknown triples take the full path, which records the events
+        allowed = self.isolation_table.get
+        validate = self.validate_multi_tenant_isolation
+        return [allowed(request) or validate(*request) for request in requests]
+    
     def validate_intra_tenant_access(self, tenant, resource_type):
         """Validate access within a tenant"""
         
-        tenant_config = self.tenants.get(tenant, {})
-        compliance_reqs = tenant_config.get("compliance", [])
+        record = self.tenant_records.get(tenant)
+        if record is None:
+            return True
         
         # Check compliance requirements
-        for compliance in compliance_reqs:
+        for compliance in record.compliance:
             if not self.check_compliance_policy(compliance, resource_type, tenant):
                 return False
         
         return True
     
+    def compliance_violations(self, compliance_type, resource_type):
+        """Return the unmet requirement messages for a framework and resource (memoized)"""
+        
+        key = (compliance_type, resource_type)
+        violations = self.compliance_cache.get(key)
+        if violations is not None:
+            return violations
+        
+        framework_id = FRAMEWORK_IDS.get(compliance_type)
+        resource_id = RESOURCE_IDS.get(resource_type)
+        if framework_id is None or resource_id is None:
+            violations = ()
+        else:
+            rules = self.compliance_rule_table[framework_id][resource_id]
+            requirements = self.compliance_requirements[framework_id]
+            violations = tuple(message for requirement, message in rules if not requirements.get(requirement))
+        
+        self.compliance_cache[key] = violations
+        return violations
+    
     def check_compliance_policy(self, compliance_type, resource_type, tenant):
         """Check compliance policy requirements"""
         
-        policy = self.compliance_policies.get(compliance_type, {})
-        requirements = policy.get("requirements", {})
-        
-        violations = []
-        
-        if compliance_type == "HIPAA":
-            # HIPAA specific checks
-            if resource_type in ["patient_data", "medical_records"]:
-                if not requirements.get("encryption_at_rest"):
-                    violations.append("HIPAA: Encryption at rest required")
-                if not requirements.get("audit_trail"):
-                    violations.append("HIPAA: Audit trail required")
-        
-        elif compliance_type == "PCI-DSS":
-            # PCI-DSS specific checks
-            if resource_type in ["payment_data", "card_data"]:
-                if not requirements.get("network_segmentation"):
-                    violations.append("PCI-DSS: Network segmentation required")
-                if not requirements.get("access_control"):
-                    violations.append("PCI-DSS: Access control required")
+        violations = self.compliance_violations(compliance_type, resource_type)
         
         # Log violations
         if violations:
@@ -254,109 +519,85 @@ class CloudSecurityController:
     def log_compliance_violation(self, compliance_type, violation, tenant):
         """Log compliance violations"""
         
-        event = {
-            "timestamp": datetime.now().isoformat(),
-            "type": "COMPLIANCE_VIOLATION",
-            "compliance_framework": compliance_type,
-            "violation": violation,
-            "tenant": tenant,
-            "severity": "HIGH"
-        }
+        event = ComplianceViolationEvent(
+            timestamp=self.now_iso(),
+            type="COMPLIANCE_VIOLATION",
+            compliance_framework=compliance_type,
+            violation=violation,
+            tenant=tenant,
+            severity="HIGH"
+        )
         
-        self.cloud_events.append(event)
-        self.compliance_policies[compliance_type]["violations"].append(event)
+        self.record_event(event)
+        self.policy_violations[compliance_type].append(event)
+        self.violation_counts[compliance_type] += 1
         
-        self.logger.error(f"Compliance Violation - {compliance_type}: {violation} (Tenant: {tenant})")
+        self.logger.error("Compliance Violation - %s: %s (Tenant: %s)", compliance_type, violation, tenant)
     
     def simulate_container_scaling(self, tenant, app_name, current_replicas, target_replicas):
         """Simulate container scaling events (like Kubernetes HPA)"""
         
-        scaling_event = {
-            "timestamp": datetime.now().isoformat(),
-            "type": "CONTAINER_SCALING",
-            "tenant": tenant,
-            "application": app_name,
-            "current_replicas": current_replicas,
-            "target_replicas": target_replicas,
-            "action": "scale_up" if target_replicas > current_replicas else "scale_down"
-        }
+        scaling_event = ContainerScalingEvent(
+            timestamp=self.now_iso(),
+            type="CONTAINER_SCALING",
+            tenant=tenant,
+            application=app_name,
+            current_replicas=current_replicas,
+            target_replicas=target_replicas,
+            action="scale_up" if target_replicas > current_replicas else "scale_down"
+        )
         
-        self.cloud_events.append(scaling_event)
+        self.record_event(scaling_event)
         
         # Apply security policies to new containers
         if target_replicas > current_replicas:
             self.apply_container_security_policies(tenant, app_name, target_replicas - current_replicas)
         
-        self.logger.info(f"Container scaling: {app_name} from {current_replicas} to {target_replicas} replicas")
+        self.logger.info("Container scaling: %s from %s to %s replicas", app_name, current_replicas, target_replicas)
     
     def apply_container_security_policies(self, tenant, app_name, new_replicas):
         """Apply security policies to new container instances"""
         
-        tenant_config = self.tenants.get(tenant, {})
-        security_groups = tenant_config.get("security_groups", [])
+        record = self.tenant_records.get(tenant)
+        security_groups = record.security_groups if record else ()
+        now_iso, record_event, info = self.now_iso, self.record_event, self.logger.info
         
         for sg in security_groups:
-            policy_event = {
-                "timestamp": datetime.now().isoformat(),
-                "type": "POLICY_APPLICATION",
-                "tenant": tenant,
-                "application": app_name,
-                "security_group": sg,
-                "new_instances": new_replicas
-            }
+            policy_event = PolicyApplicationEvent(
+                timestamp=now_iso(),
+                type="POLICY_APPLICATION",
+                tenant=tenant,
+                application=app_name,
+                security_group=sg,
+                new_instances=new_replicas
+            )
             
-            self.cloud_events.append(policy_event)
-            self.logger.info(f"Applied {sg} policies to {new_replicas} new {app_name} instances")
+            record_event(policy_event)
+            info("Applied %s policies to %s new %s instances", sg, new_replicas, app_name)
     
     def detect_cloud_threats(self, traffic_data):
         """Detect cloud-specific threats"""
         
         threats_detected = []
         
-        # Simulate threat detection
-        threat_patterns = [
-            {
-                "name": "Unusual Cross-Tenant Access",
-                "pattern": "cross_tenant_access",
-                "severity": "HIGH",
-                "description": "Detected unusual cross-tenant communication"
-            },
-            {
-                "name": "Compliance Policy Violation",
-                "pattern": "compliance_violation", 
-                "severity": "HIGH",
-                "description": "Detected violation of compliance policies"
-            },
-            {
-                "name": "Container Escape Attempt",
-                "pattern": "container_escape",
-                "severity": "CRITICAL",
-                "description": "Detected potential container escape attempt"
-            },
-            {
-                "name": "Data Exfiltration",
-                "pattern": "data_exfiltration",
-                "severity": "CRITICAL",
-                "description": "Detected unusual data transfer patterns"
-            }
-        ]
-        
-        # Simulate detection logic
-        import random
-        for pattern in threat_patterns:
-            if random.random() < 0.1:  # 10% chance of detection
-                threat = {
-                    "timestamp": datetime.now().isoformat(),
-                    "type": "THREAT_DETECTED",
-                    "threat_name": pattern["name"],
-                    "severity": pattern["severity"],
-                    "description": pattern["description"],
-                    "action_taken": "BLOCKED"
-                }
-                
-                threats_detected.append(threat)
-                self.cloud_events.append(threat)
-                self.logger.warning(f"Threat detected: {pattern['name']} - {pattern['description']}")
+        # Simulate detection logic: 10% chance per pattern, drawn in one pass
+        draw = random.random
+        detected = [pattern for pattern in THREAT_PATTERNS if draw() < THREAT_DETECTION_RATE]
+        
+        now_iso, record_event, warn = self.now_iso, self.record_event, self.logger.warning
+        for pattern in detected:
+            threat = ThreatDetectedEvent(
+                timestamp=now_iso(),
+                type="THREAT_DETECTED",
+                threat_name=pattern["name"],
+                severity=pattern["severity"],
+                description=pattern["description"],
+                action_taken="BLOCKED"
+            )
+            
+            threats_detected.append(threat)
+            record_event(threat)
+            warn("Threat detected: %s - %s", pattern["name"], pattern["description"])
         
         return threats_detected
     
@@ -364,17 +605,17 @@ class CloudSecurityController:
         """Generate compliance report for audit purposes"""
         
         report = {
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": self.now_iso(),
             "report_type": "Cloud Security Compliance Report",
             "tenants": len(self.tenants),
             "compliance_frameworks": list(self.compliance_policies.keys()),
-            "total_events": len(self.cloud_events),
+            "total_events": self.event_count,
             "compliance_status": {}
         }
         
         # Generate compliance status for each framework
         for framework, policy in self.compliance_policies.items():
-            violations = len(policy.get("violations", []))
+            violations = self.violation_counts[framework]
             report["compliance_status"][framework] = {
                 "status": "COMPLIANT" if violations == 0 else "NON_COMPLIANT",
                 "violations": violations,
@@ -382,21 +623,25 @@ class CloudSecurityController:
             }
         
         # Recent security events
-        report["recent_events"] = self.cloud_events[-20:]  # Last 20 events
+        recent_start = max(0, len(self.cloud_events) - RECENT_EVENTS_IN_REPORT)
+        report["recent_events"] = [event._asdict() for event in islice(self.cloud_events, recent_start, None)]
         
         # Tenant summary
-        report["tenant_summary"] = {}
-        for tenant_id, config in self.tenants.items():
-            report["tenant_summary"][tenant_id] = {
-                "compliance_frameworks": config["compliance"],
-                "isolation_level": config["isolation_level"],
-                "data_classification": config["data_classification"],
-                "security_groups": len(config["security_groups"])
-            }
-        
-        # Save report
-        with open('cloud_compliance_report.json', 'w') as f:
-            json.dump(report, f, indent=2)
+        report["tenant_summary"] = dict(self.tenant_summary)
+        
+        # Skip the write when nothing but the timestamp would change
+        content = {key: value for key, value in report.items() if key != "generated_at"}
+        content_hash = hashlib.blake2b(serialize_json(content), digest_size=16).digest()
+        if content_hash == self.last_report_hash:
+            self.logger.debug("Cloud compliance report unchanged, skipping write")
+            return report
+        
+        # Save report atomically so readers never see a partial file
+        report_path = 'cloud_compliance_report.json'
+        with open(report_path + '.tmp', 'wb') as f:
+            f.write(serialize_json(report))
+        os.replace(report_path + '.tmp', report_path)
+        self.last_report_hash = content_hash
         
         self.logger.info("Cloud compliance report generated: cloud_compliance_report.json")
         return report
@@ -404,88 +649,57 @@ class CloudSecurityController:
     def run_cloud_security_simulation(self):
         """Run comprehensive cloud security simulation"""
         
-        print("☁️  CLOUD SECURITY SIMULATION")
-        print("=" * 60)
-        print("Simulating cloud security scenarios with multi-tenancy and compliance")
-        print()
-        
-        # Test scenarios
-        scenarios = [
-            {
-                "name": "Multi-Tenant Isolation Test",
-                "source_tenant": "healthcare_tenant",
-                "dest_tenant": "finance_tenant",
-                "resource": "patient_data",
-                "expected": False
-            },
-            {
-                "name": "HIPAA Compliance Check",
-                "source_tenant": "healthcare_tenant",
-                "dest_tenant": "healthcare_tenant",
-                "resource": "patient_data",
-                "expected": True
-            },
-            {
-                "name": "PCI-DSS Compliance Check",
-                "source_tenant": "finance_tenant",
-                "dest_tenant": "finance_tenant", 
-                "resource": "payment_data",
-                "expected": True
-            },
-            {
-                "name": "Cross-Tenant Data Access",
-                "source_tenant": "retail_tenant",
-                "dest_tenant": "healthcare_tenant",
-                "resource": "medical_records",
-                "expected": False
-            }
-        ]
+        # Collect console output and write it in one go at the end
+        buf = io.StringIO()
         
-        passed_tests = 0
+        print("☁️  CLOUD SECURITY SIMULATION", file=buf)
+        print("=" * 60, file=buf)
+        print("Simulating cloud security scenarios with multi-tenancy and compliance", file=buf)
+        print(file=buf)
         
-        for scenario in scenarios:
-            print(f"🧪 Testing: {scenario['name']}")
-            
-            result = self.validate_multi_tenant_isolation(
-                scenario['source_tenant'],
-                scenario['dest_tenant'],
-                scenario['resource']
-            )
-            
+        # Evaluate every scenario first, then report the results
+        scenarios = SIMULATION_SCENARIOS
+        results = self.validate_access_batch(
+            (scenario['source_tenant'], scenario['dest_tenant'], scenario['resource'])
+            for scenario in scenarios
+        )
+        passed_tests = sum(result == scenario['expected'] for result, scenario in zip(results, scenarios))
+        
+        for scenario, result in zip(scenarios, results):
+            print(f"🧪 Testing: {scenario['name']}", file=buf)
             status = "✅ PASS" if result == scenario['expected'] else "❌ FAIL"
-            print(f"   Expected: {scenario['expected']}, Got: {result} - {status}")
-            
-            if result == scenario['expected']:
-                passed_tests += 1
+            print(f"   Expected: {scenario['expected']}, Got: {result} - {status}", file=buf)
         
         # Simulate container scaling
-        print(f"\n🐳 Simulating Container Scaling Events")
+        print(f"\n🐳 Simulating Container Scaling Events", file=buf)
         self.simulate_container_scaling("healthcare_tenant", "web-app", 3, 5)
         self.simulate_container_scaling("finance_tenant", "api-service", 2, 4)
         
         # Simulate threat detection
-        print(f"\n🔍 Running Threat Detection")
+        print(f"\n🔍 Running Threat Detection", file=buf)
         threats = self.detect_cloud_threats({"sample": "traffic_data"})
-        print(f"   Detected {len(threats)} potential threats")
+        print(f"   Detected {len(threats)} potential threats", file=buf)
         
         # Generate compliance report
-        print(f"\n📋 Generating Compliance Report")
+        print(f"\n📋 Generating Compliance Report", file=buf)
         report = self.generate_compliance_report()
         
         # Results summary
         success_rate = (passed_tests / len(scenarios)) * 100
-        print(f"\n📊 CLOUD SECURITY TEST RESULTS:")
-        print(f"   Tests Passed: {passed_tests}/{len(scenarios)}")
-        print(f"   Success Rate: {success_rate:.1f}%")
-        print(f"   Compliance Frameworks: {len(self.compliance_policies)}")
-        print(f"   Security Events: {len(self.cloud_events)}")
+        print(f"\n📊 CLOUD SECURITY TEST RESULTS:", file=buf)
+        print(f"   Tests Passed: {passed_tests}/{len(scenarios)}", file=buf)
+        print(f"   Success Rate: {success_rate:.1f}%", file=buf)
+        print(f"   Compliance Frameworks: {len(self.compliance_policies)}", file=buf)
+        print(f"   Security Events: {self.event_count}", file=buf)
         
         if success_rate >= 90:
-            print("🟢 EXCELLENT: Cloud security policies working effectively!")
+            print("🟢 EXCELLENT: Cloud security policies working effectively!", file=buf)
         elif success_rate >= 75:
-            print("🟡 GOOD: Most cloud security policies working")
+            print("🟡 GOOD: Most cloud security policies working", file=buf)
         else:
-            print("🔴 REVIEW: Cloud security policies need attention")
+            print("🔴 REVIEW: Cloud security policies need attention", file=buf)
+        
+        sys.stdout.write(buf.getvalue())
         
         return {
             "success_rate": success_rate,
@@ -15,35 +15,129 @@ Key Features:
 - Attack detection and blocking
 """
 
+import itertools
 import json
 import logging
-from collections import defaultdict
-from datetime import datetime
+import socket
+import struct
+import time
+from collections import OrderedDict, defaultdict, deque, namedtuple
+from logging.handlers import MemoryHandler, RotatingFileHandler
 
 from ryu.base import app_manager
 from ryu.controller import ofp_event
 from ryu.controller.handler import CONFIG_DISPATCHER, MAIN_DISPATCHER
 from ryu.controller.handler import set_ev_cls
 from ryu.ofproto import ofproto_v1_3
-from ryu.lib.packet import packet, ethernet, ipv4, tcp, udp, arp, icmp
+from ryu.lib import hub
+from ryu.lib.packet import packet, arp
 from ryu.lib.packet import ether_types
 
+try:
+    import orjson  # Optional: faster policy file parsing
+except ImportError:
+    orjson = None
+
+# Upper bound on memoized (src, dst, port) policy decisions
+DECISION_CACHE_SIZE = 4096
+
+# Traffic statistics bounds for long-running controllers
+MAX_TRAFFIC_FLOWS = 100000
+MAX_DEPENDENCIES_PER_HOST = 256
+MAX_POLICY_VIOLATIONS = 1000
+
+# Compact record of a blocked connection; expanded to a dict for stats and logs
+Violation = namedtuple('Violation', 'timestamp source_ip destination_ip destination_port '
+                                    'protocol source_role action')
+
+# Queued OpenFlow messages are written to the switch once this many pile up
+# or every FLOW_MOD_FLUSH_INTERVAL seconds, whichever comes first
+FLOW_MOD_BATCH_SIZE = 100
+FLOW_MOD_FLUSH_INTERVAL = 0.005
+
+# Security event records are buffered in memory and written to the log this often
+SECURITY_LOG_FLUSH_INTERVAL = 0.1
+SECURITY_LOG_BATCH_SIZE = 1024
+SECURITY_LOG_MAX_BYTES = 10 * 1024 * 1024
+SECURITY_LOG_BACKUP_COUNT = 3
+
+# Header layout used by parse_packet
+ETH_HEADER_LEN = 14
+IPV4_MIN_HEADER_LEN = 20
+IP_PROTO_ICMP = 1
+IP_PROTO_TCP = 6
+IP_PROTO_UDP = 17
+L4_PROTOCOLS = {IP_PROTO_TCP: 'tcp', IP_PROTO_UDP: 'udp'}
+
+# Precompiled big-endian 16-bit field reader for parse_packet
+UINT16 = struct.Struct('!H')
+
+# OpenFlow IP protocol number and destination-port match field per protocol
+PROTOCOL_MATCH_FIELDS = {
+    'tcp': (IP_PROTO_TCP, 'tcp_dst'),
+    'udp': (IP_PROTO_UDP, 'udp_dst'),
+    'icmp': (IP_PROTO_ICMP, None),
+}
+
+# Priorities of the rules installed proactively at switch connect
+STATIC_ALLOW_PRIORITY = 200
+STATIC_DROP_PRIORITY = 150
+
+def parse_packet(data):
+    """Decode the Ethernet, IPv4 and TCP/UDP fields the policy needs in one pass"""
+    eth_type, = UINT16.unpack_from(data, 12)
+    dst_mac = data[0:6].hex(':')
+    src_mac = data[6:12].hex(':')
+    
+    if eth_type != ether_types.ETH_TYPE_IP or len(data) < ETH_HEADER_LEN + IPV4_MIN_HEADER_LEN:
+        return eth_type, src_mac, dst_mac, None, None, None, None
+        
+    ip_proto = data[ETH_HEADER_LEN + 9]
+    src_ip = socket.inet_ntoa(data[ETH_HEADER_LEN + 12:ETH_HEADER_LEN + 16])
+    dst_ip = socket.inet_ntoa(data[ETH_HEADER_LEN + 16:ETH_HEADER_LEN + 20])
+    
+    # Destination port sits 2 bytes into both TCP and UDP headers
+    dst_port = None
+    l4_offset = ETH_HEADER_LEN + (data[ETH_HEADER_LEN] & 0x0f) * 4
+    if ip_proto in L4_PROTOCOLS and len(data) >= l4_offset + 4:
+        dst_port, = UINT16.unpack_from(data, l4_offset + 2)
+        
+    return eth_type, src_mac, dst_mac, ip_proto, src_ip, dst_ip, dst_port
+
 class MicroSegmentationController(app_manager.RyuApp):
     """
     Main SDN controller class for micro-segmentation
     """
     OFP_VERSIONS = [ofproto_v1_3.OFP_VERSION]
     
+    # Host groups used by the built-in user and ICMP policies
+    USER_IPS = frozenset({"10.0.0.100", "10.0.0.200"})  # HR and Admin
+    SERVER_IPS = frozenset({"10.0.0.10", "10.0.0.20", "10.0.0.30"})
+    
+    # ICMP destinations each source may ping
+    ICMP_RULES = {
+        "10.0.0.100": frozenset({"10.0.0.10"}),  # HR users: web server only
+        "10.0.0.200": SERVER_IPS,  # Admin users: all servers
+        # Servers: each other for diagnostics, plus replies to users
+        "10.0.0.10": SERVER_IPS | USER_IPS,
+        "10.0.0.20": SERVER_IPS | USER_IPS,
+        "10.0.0.30": SERVER_IPS | USER_IPS,
+    }
+    
     def __init__(self, *args, **kwargs):
         super(MicroSegmentationController, self).__init__(*args, **kwargs)
         
         # Initialize data structures
         self.mac_to_port = {}  # MAC address to switch port mapping
         self.ip_to_mac = {}    # IP to MAC address mapping
+        self.ip_to_port = {}   # IP to switch port, fusing the two lookups above
         self.traffic_flows = defaultdict(int)  # Traffic flow counters
         self.dependency_graph = defaultdict(set)  # Application dependencies
-        self.policy_violations = []  # Security violations log
+        self.policy_violations = deque(maxlen=MAX_POLICY_VIOLATIONS)  # Recent security violations
         self.active_connections = set()  # Track active connections for return traffic
+        self.datapaths = {}  # Connected switches by datapath ID
+        self.pending_msgs = defaultdict(list)  # Batched OpenFlow messages per datapath
+        self.timestamp_cache = (0, '', '')  # (second, log timestamp, ISO prefix)
         
         # Load role-based policies
         self.load_policies()
@@ -53,6 +147,9 @@ class MicroSegmentationController(app_manager.RyuApp):
         
         self.logger.info("Micro-Segmentation Controller Started")
         self.logger.info(f"Loaded {len(self.roles)} roles and {len(self.server_flows)} server flows")
+        
+        # Background writer for batched flow installs
+        self.flusher = hub.spawn(self.flush_loop)
 
     def setup_logging(self):
         """Configure logging for security events"""
@@ -62,52 +159,81 @@ class MicroSegmentationController(app_manager.RyuApp):
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.security_log_file),
-                logging.StreamHandler()
-            ]
+            handlers=[logging.StreamHandler()]
         )
         
-        # Also create a separate security events handler
+        # Security events get a single rotating file handler of their own,
+        # fed in batches by a memory buffer flushed from a background greenlet
         self.security_logger = logging.getLogger('security_events')
-        security_handler = logging.FileHandler(self.security_log_file)
-        security_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-        self.security_logger.addHandler(security_handler)
+        self.security_logger.setLevel(logging.INFO)
+        self.security_logger.propagate = False
+        file_handler = RotatingFileHandler(self.security_log_file,
+                                           maxBytes=SECURITY_LOG_MAX_BYTES,
+                                           backupCount=SECURITY_LOG_BACKUP_COUNT,
+                                           delay=True)
+        file_handler.setFormatter(logging.Formatter('%(message)s'))
+        self.security_log_handler = MemoryHandler(SECURITY_LOG_BATCH_SIZE,
+                                                  flushLevel=logging.CRITICAL,
+                                                  target=file_handler)
+        self.security_logger.addHandler(self.security_log_handler)
+        self.security_log_flusher = hub.spawn(self.flush_security_log_loop)
         
     def load_policies(self):
         """Load role definitions and policies from JSON file"""
         try:
-            with open('roles.json', 'r') as f:
-                policy_data = json.load(f)
+            with open('roles.json', 'rb') as f:
+                raw = f.read()
+            policy_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 
             self.roles = policy_data.get('roles', {})
             self.server_flows = policy_data.get('server_dependencies', {}).get('allowed_flows', [])
-            
-            # Create quick lookup dictionaries
-            self.ip_to_role = {}
-            self.allowed_connections = set()
+            self.security_settings = policy_data.get('security_settings', {})
             
             # Map IPs to roles
-            for role_name, role_data in self.roles.items():
-                for host_ip in role_data['hosts']:
-                    self.ip_to_role[host_ip] = role_name
-                    
-                # Build allowed connections set
-                for access in role_data['allowed_access']:
-                    connection = (host_ip, access['destination'], access['port'])
-                    self.allowed_connections.add(connection)
-            
-            # Add server-to-server flows
-            for flow in self.server_flows:
-                connection = (flow['source'], flow['destination'], flow['port'])
-                self.allowed_connections.add(connection)
+            self.ip_to_role = {host_ip: role_name
+                               for role_name, role_data in self.roles.items()
+                               for host_ip in role_data['hosts']}
                 
         except FileNotFoundError:
             self.logger.error("roles.json not found! Using default empty policies.")
             self.roles = {}
             self.server_flows = []
+            self.security_settings = {}
             self.ip_to_role = {}
-            self.allowed_connections = set()
+            
+        self.build_policy_index()
+
+    def build_policy_index(self):
+        """Precompute hashed forward and return-traffic policy lookups"""
+        role_access = [(host_ip, access)
+                       for role_data in self.roles.values()
+                       for host_ip in role_data['hosts']
+                       for access in role_data['allowed_access']]
+        
+        # Role-based and server-to-server (src, dst, port) connections
+        self.allowed_connections = frozenset(
+            [(host_ip, access['destination'], access['port']) for host_ip, access in role_access] +
+            [(flow['source'], flow['destination'], flow['port']) for flow in self.server_flows]
+        )
+        
+        # (responder, requester) pairs whose replies are allowed on any port
+        self.allowed_return_pairs = frozenset(
+            (access['destination'], host_ip) for host_ip, access in role_access
+        )
+        self.server_return_pairs = frozenset(
+            (flow['destination'], flow['source']) for flow in self.server_flows
+        )
+        
+        # (src, dst, port, protocol) rules that can be pushed to switches up front
+        self.static_flows = tuple(
+            [(host_ip, access['destination'], access['port'], access.get('protocol', 'tcp'))
+             for host_ip, access in role_access] +
+            [(flow['source'], flow['destination'], flow['port'], flow.get('protocol', 'tcp'))
+             for flow in self.server_flows]
+        )
+        
+        # Decisions derived from the previous policies are no longer valid
+        self.decision_cache = OrderedDict()
 
     @set_ev_cls(ofp_event.EventOFPSwitchFeatures, CONFIG_DISPATCHER)
     def switch_features_handler(self, ev):
@@ -129,9 +255,53 @@ class MicroSegmentationController(app_manager.RyuApp):
         actions = [parser.OFPActionOutput(ofproto.OFPP_CONTROLLER,
                                         ofproto.OFPCML_NO_BUFFER)]
         self.add_flow(datapath, 1000, match, actions)
+        
+        # Keep steady-state policy decisions in the switch unless every packet must be logged
+        if not self.security_settings.get('log_all_traffic', True):
+            self.install_static_policy(datapath)
+
+    def build_match(self, parser, src_ip, dst_ip, protocol, dst_port=None):
+        """Build an IPv4 match for a protocol, optionally pinned to a destination port"""
+        ip_proto, port_field = PROTOCOL_MATCH_FIELDS[protocol]
+        fields = {'eth_type': ether_types.ETH_TYPE_IP, 'ipv4_src': src_ip,
+                  'ipv4_dst': dst_ip, 'ip_proto': ip_proto}
+        if port_field and dst_port is not None:
+            fields[port_field] = dst_port
+        return parser.OFPMatch(**fields)
 
-    def add_flow(self, datapath, priority, match, actions, buffer_id=None, idle_timeout=0):
-        """Install a flow rule on the switch"""
+    def install_static_policy(self, datapath):
+        """Proactively install allow-list, return and user-to-user drop rules"""
+        parser = datapath.ofproto_parser
+        actions = [parser.OFPActionOutput(datapath.ofproto.OFPP_NORMAL)]
+        
+        # Forward direction pinned to the allowed port
+        rules = 0
+        for src_ip, dst_ip, dst_port, protocol in self.static_flows:
+            match = self.build_match(parser, src_ip, dst_ip, protocol, dst_port)
+            self.add_flow(datapath, STATIC_ALLOW_PRIORITY, match, actions, batch=True)
+            rules += 1
+            
+        # Replies on any port, one rule per responder/requester pair
+        for src_ip, dst_ip, protocol in {(dst, src, proto) for src, dst, _, proto in self.static_flows}:
+            match = self.build_match(parser, src_ip, dst_ip, protocol)
+            self.add_flow(datapath, STATIC_ALLOW_PRIORITY, match, actions, batch=True)
+            rules += 1
+            
+        # Drop user-to-user traffic outright (no actions), between role hosts
+        # that are users as in evaluate_policy, so servers given a role keep
+        # their non-port traffic such as ICMP
+        if self.security_settings.get('block_user_to_user', True):
+            user_ips = sorted(ip for ip in self.ip_to_role if ip in self.USER_IPS)
+            for src_ip, dst_ip in itertools.permutations(user_ips, 2):
+                match = parser.OFPMatch(eth_type=ether_types.ETH_TYPE_IP,
+                                        ipv4_src=src_ip, ipv4_dst=dst_ip)
+                self.add_flow(datapath, STATIC_DROP_PRIORITY, match, [], batch=True)
+                rules += 1
+            
+        self.logger.info("Installed %d static policy rules on switch %s", rules, datapath.id)
+
+    def add_flow(self, datapath, priority, match, actions, buffer_id=None, idle_timeout=0, batch=False):
+        """Install a flow rule on the switch, optionally via the batched send queue"""
         ofproto = datapath.ofproto
         parser = datapath.ofproto_parser
         
@@ -145,7 +315,40 @@ class MicroSegmentationController(app_manager.RyuApp):
             mod = parser.OFPFlowMod(datapath=datapath, priority=priority,
                                   match=match, instructions=inst, 
                                   idle_timeout=idle_timeout)
-        datapath.send_msg(mod)
+        if batch:
+            self.queue_msg(datapath, mod)
+        else:
+            datapath.send_msg(mod)
+
+    def queue_msg(self, datapath, msg):
+        """Queue an OpenFlow message for the next batched write to its switch"""
+        self.datapaths[datapath.id] = datapath
+        pending = self.pending_msgs[datapath.id]
+        pending.append(msg)
+        if len(pending) >= FLOW_MOD_BATCH_SIZE:
+            self.flush_msgs(datapath.id)
+
+    def flush_msgs(self, dpid):
+        """Serialize queued messages and write them to the switch in one send"""
+        msgs = self.pending_msgs.pop(dpid, None)
+        if not msgs:
+            return
+        datapath = self.datapaths[dpid]
+        
+        # OpenFlow 1.3 has no bundles, so concatenate the wire messages instead
+        bufs = []
+        for msg in msgs:
+            datapath.set_xid(msg)
+            msg.serialize()
+            bufs.append(msg.buf)
+        datapath.send(b''.join(bufs))
+
+    def flush_loop(self):
+        """Periodically flush batched OpenFlow messages for every switch"""
+        while True:
+            hub.sleep(FLOW_MOD_FLUSH_INTERVAL)
+            for dpid in list(self.pending_msgs):
+                self.flush_msgs(dpid)
 
     @set_ev_cls(ofp_event.EventOFPPacketIn, MAIN_DISPATCHER)
     def packet_in_handler(self, ev):
@@ -156,95 +359,75 @@ class MicroSegmentationController(app_manager.RyuApp):
         parser = datapath.ofproto_parser
         in_port = msg.match['in_port']
         
-        # Parse packet
-        pkt = packet.Packet(msg.data)
-        eth_pkt = pkt.get_protocols(ethernet.ethernet)[0]
+        # Parse headers straight from the packet bytes
+        eth_type, src_mac, dst_mac, ip_proto, src_ip, dst_ip, dst_port = parse_packet(msg.data)
         
-        if eth_pkt.ethertype == ether_types.ETH_TYPE_LLDP:
+        if eth_type == ether_types.ETH_TYPE_LLDP:
             return  # Ignore LLDP packets
-            
-        dst_mac = eth_pkt.dst
-        src_mac = eth_pkt.src
         
         # Learn MAC addresses
         self.mac_to_port[src_mac] = in_port
         
-        # Handle ARP packets
-        if eth_pkt.ethertype == ether_types.ETH_TYPE_ARP:
-            self.handle_arp(datapath, pkt, eth_pkt, in_port)
+        # Handle ARP packets (rare enough to use the full Ryu parser)
+        if eth_type == ether_types.ETH_TYPE_ARP:
+            self.handle_arp(datapath, packet.Packet(msg.data), in_port)
             return
             
         # Handle IP packets
-        if eth_pkt.ethertype == ether_types.ETH_TYPE_IP:
-            ip_pkt = pkt.get_protocol(ipv4.ipv4)
-            if ip_pkt:
-                self.handle_ip_packet(datapath, pkt, eth_pkt, ip_pkt, in_port)
-                return
+        if ip_proto is not None:
+            self.handle_ip_packet(datapath, msg.data, src_mac, dst_mac, in_port,
+                                  ip_proto, src_ip, dst_ip, dst_port)
+            return
         
         # Default forwarding for other packets
-        self.flood_packet(datapath, msg, in_port)
+        self.flood_packet(datapath, msg.data, msg.buffer_id, in_port)
 
-    def handle_arp(self, datapath, pkt, eth_pkt, in_port):
+    def handle_arp(self, datapath, pkt, in_port):
         """Handle ARP packets for IP-MAC learning"""
         arp_pkt = pkt.get_protocol(arp.arp)
         if arp_pkt:
             # Learn IP to MAC mapping
             self.ip_to_mac[arp_pkt.src_ip] = arp_pkt.src_mac
-            self.logger.debug(f"Learned: {arp_pkt.src_ip} -> {arp_pkt.src_mac}")
+            self.ip_to_port[arp_pkt.src_ip] = in_port
+            self.logger.debug("Learned: %s -> %s", arp_pkt.src_ip, arp_pkt.src_mac)
             
         # Flood ARP packets
-        self.flood_packet(datapath, datapath.ofproto_parser.OFPPacketIn(
-            buffer_id=datapath.ofproto.OFP_NO_BUFFER,
-            data=pkt.data
-        ), in_port)
+        self.flood_packet(datapath, pkt.data, datapath.ofproto.OFP_NO_BUFFER, in_port)
 
-    def handle_ip_packet(self, datapath, pkt, eth_pkt, ip_pkt, in_port):
+    def handle_ip_packet(self, datapath, data, src_mac, dst_mac, in_port,
+                         ip_proto, src_ip, dst_ip, dst_port):
         """Handle IP packets and apply security policies"""
-        src_ip = ip_pkt.src
-        dst_ip = ip_pkt.dst
-        
         # Learn IP to MAC mapping
-        self.ip_to_mac[src_ip] = eth_pkt.src
-        
-        # Extract port information for TCP/UDP
-        dst_port = None
-        protocol = None
-        
-        tcp_pkt = pkt.get_protocol(tcp.tcp)
-        udp_pkt = pkt.get_protocol(udp.udp)
-        
-        if tcp_pkt:
-            dst_port = tcp_pkt.dst_port
-            protocol = 'tcp'
-        elif udp_pkt:
-            dst_port = udp_pkt.dst_port  
-            protocol = 'udp'
+        self.ip_to_mac[src_ip] = src_mac
+        self.ip_to_port[src_ip] = in_port
+        
+        # Classify TCP/UDP by port, ICMP has none
+        if dst_port is not None:
+            protocol = L4_PROTOCOLS[ip_proto]
+        elif ip_proto == IP_PROTO_ICMP:
+            dst_port = 0  # ICMP doesn't have ports
+            protocol = 'icmp'
         else:
-            # Handle ICMP and other protocols
-            if ip_pkt.proto == 1:  # ICMP
-                dst_port = 0  # ICMP doesn't have ports
-                protocol = 'icmp'
-            else:
-                # Allow other protocols (like ARP responses)
-                self.forward_packet(datapath, pkt, eth_pkt, in_port)
-                return
+            # Allow other protocols (like ARP responses)
+            self.forward_packet(datapath, data, dst_mac, in_port)
+            return
             
-        # Log traffic flow
-        flow_key = f"{src_ip}:{dst_ip}:{dst_port}"
-        self.traffic_flows[flow_key] += 1
+        # Log traffic flow, aging counters once the table is full
+        self.traffic_flows[(src_ip, dst_ip, dst_port)] += 1
+        if len(self.traffic_flows) > MAX_TRAFFIC_FLOWS:
+            self.decay_traffic_flows()
         
         # Update dependency graph
         if dst_port:
-            self.dependency_graph[src_ip].add((dst_ip, dst_port))
+            dependencies = self.dependency_graph[src_ip]
+            if len(dependencies) < MAX_DEPENDENCIES_PER_HOST:
+                dependencies.add((dst_ip, dst_port))
             
-        self.logger.debug(f"Traffic: {src_ip} -> {dst_ip}:{dst_port} ({protocol})")
-        
-        # Debug logging
-        self.logger.debug(f"Processing packet: {src_ip} -> {dst_ip}:{dst_port} ({protocol})")
+        self.logger.debug("Traffic: %s -> %s:%s (%s)", src_ip, dst_ip, dst_port, protocol)
         
         # Apply security policy
         if self.is_connection_allowed(src_ip, dst_ip, dst_port):
-            self.logger.info(f"ALLOWED: {src_ip} -> {dst_ip}:{dst_port} ({protocol})")
+            self.logger.info("ALLOWED: %s -> %s:%s (%s)", src_ip, dst_ip, dst_port, protocol)
             
             # Log to security events file
             self.log_security_event("ALLOWED", src_ip, dst_ip, dst_port, protocol)
@@ -252,13 +435,14 @@ class MicroSegmentationController(app_manager.RyuApp):
             # Track the connection for return traffic
             self.active_connections.add((src_ip, dst_ip, dst_port))
             
-            self.forward_packet(datapath, pkt, eth_pkt, in_port)
+            # Packet-out and both flow-mods go out in the same batched write
+            self.forward_packet(datapath, data, dst_mac, in_port, batch=True)
             self.install_flow_rule(datapath, src_ip, dst_ip, dst_port, protocol, in_port)
             
             # Install return flow rule for all protocols
             self.install_return_flow_rule(datapath, src_ip, dst_ip, dst_port, protocol)
         else:
-            self.logger.warning(f"BLOCKED: {src_ip} -> {dst_ip}:{dst_port} ({protocol})")
+            self.logger.warning("BLOCKED: %s -> %s:%s (%s)", src_ip, dst_ip, dst_port, protocol)
             
             # Log to security events file
             self.log_security_event("BLOCKED", src_ip, dst_ip, dst_port, protocol)
@@ -267,7 +451,22 @@ class MicroSegmentationController(app_manager.RyuApp):
             # Drop packet (do nothing)
 
     def is_connection_allowed(self, src_ip, dst_ip, dst_port):
-        """Check if connection is allowed by policy"""
+        """Check if connection is allowed by policy, using the LRU decision cache"""
+        key = (src_ip, dst_ip, dst_port)
+        cache = self.decision_cache
+        allowed = cache.get(key)
+        if allowed is not None:
+            cache.move_to_end(key)
+            return allowed
+            
+        allowed = self.evaluate_policy(src_ip, dst_ip, dst_port)
+        cache[key] = allowed
+        if len(cache) > DECISION_CACHE_SIZE:
+            cache.popitem(last=False)
+        return allowed
+
+    def evaluate_policy(self, src_ip, dst_ip, dst_port):
+        """Evaluate role, return-traffic and ICMP policies for a connection"""
         # Special handling for ICMP (ping)
         if dst_port == 0:  # ICMP traffic
             # Temporarily allow all ICMP for debugging
@@ -283,93 +482,39 @@ class MicroSegmentationController(app_manager.RyuApp):
         # Allow return traffic for established connections
         if self.is_return_traffic_allowed(src_ip, dst_ip, dst_port):
             return True
-            
-        # Check if it's a server-to-server communication
-        for flow in self.server_flows:
-            if (flow['source'] == src_ip and 
-                flow['destination'] == dst_ip and 
-                flow['port'] == dst_port):
-                return True
         
         # Block user-to-user communication (enhanced security)
-        user_ips = ["10.0.0.100", "10.0.0.200"]  # HR and Admin
-        if src_ip in user_ips and dst_ip in user_ips:
-            self.logger.warning(f"BLOCKED: User-to-user communication {src_ip} -> {dst_ip}")
+        if src_ip in self.USER_IPS and dst_ip in self.USER_IPS:
+            self.logger.warning("BLOCKED: User-to-user communication %s -> %s", src_ip, dst_ip)
             return False
                 
         return False
     
     def is_icmp_allowed(self, src_ip, dst_ip):
         """Check if ICMP (ping) is allowed based on role policies"""
-        # Get source role
-        src_role = self.ip_to_role.get(src_ip, 'UNKNOWN')
-        
-        self.logger.debug(f"ICMP check: {src_ip} ({src_role}) -> {dst_ip}")
-        
-        # HR users (10.0.0.100) can only ping web server (10.0.0.10)
-        if src_ip == "10.0.0.100":  # HR user
-            if dst_ip == "10.0.0.10":  # Web server
-                self.logger.debug("ICMP ALLOWED: HR user to Web server")
-                return True
-            else:
-                self.logger.debug(f"ICMP BLOCKED: HR user to {dst_ip}")
-                return False
-        
-        # Admin users (10.0.0.200) can ping all servers
-        elif src_ip == "10.0.0.200":  # Admin user
-            server_ips = ["10.0.0.10", "10.0.0.20", "10.0.0.30"]
-            if dst_ip in server_ips:
-                self.logger.debug(f"ICMP ALLOWED: Admin user to server {dst_ip}")
-                return True
-            else:
-                self.logger.debug(f"ICMP BLOCKED: Admin user to non-server {dst_ip}")
-                return False
-        
-        # Server-to-server ICMP (for network diagnostics)
-        server_ips = ["10.0.0.10", "10.0.0.20", "10.0.0.30"]
-        if src_ip in server_ips and dst_ip in server_ips:
-            self.logger.debug(f"ICMP ALLOWED: Server-to-server {src_ip} -> {dst_ip}")
-            return True
-        
-        # ICMP replies (return traffic)
-        if src_ip in server_ips and dst_ip in ["10.0.0.100", "10.0.0.200"]:
-            self.logger.debug(f"ICMP ALLOWED: Server reply {src_ip} -> {dst_ip}")
-            return True
-        
-        # Default deny for unknown sources
-        self.logger.debug(f"ICMP BLOCKED: Default deny {src_ip} -> {dst_ip}")
-        return False
+        # Unknown sources get an empty set (default deny)
+        allowed = dst_ip in self.ICMP_RULES.get(src_ip, ())
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("ICMP %s: %s (%s) -> %s", "ALLOWED" if allowed else "BLOCKED",
+                              src_ip, self.ip_to_role.get(src_ip, 'UNKNOWN'), dst_ip)
+        return allowed
     
     def is_return_traffic_allowed(self, src_ip, dst_ip, dst_port):
         """Check if this is allowed return traffic (response to a legitimate request)"""
-        # Server IPs
-        server_ips = ["10.0.0.10", "10.0.0.20", "10.0.0.30"]
-        user_ips = ["10.0.0.100", "10.0.0.200"]
-        
-        # If source is a server and destination is a user
-        if src_ip in server_ips and dst_ip in user_ips:
-            # Check if the reverse connection (user -> server) is allowed
-            # Look for allowed connections where user can reach this server
-            for allowed_src, allowed_dst, allowed_port in self.allowed_connections:
-                if allowed_src == dst_ip and allowed_dst == src_ip:
-                    # This is return traffic for an allowed connection
-                    self.logger.debug(f"Allowing return traffic: {src_ip} -> {dst_ip}:{dst_port}")
-                    return True
-        
-        # If source is a server and destination is another server (return traffic)
-        if src_ip in server_ips and dst_ip in server_ips:
-            # Check if reverse server-to-server flow exists
-            for flow in self.server_flows:
-                if flow['destination'] == src_ip and flow['source'] == dst_ip:
-                    self.logger.debug(f"Allowing server return traffic: {src_ip} -> {dst_ip}:{dst_port}")
-                    return True
+        # Server replying to a user that may reach it
+        if (src_ip, dst_ip) in self.allowed_return_pairs:
+            self.logger.debug("Allowing return traffic: %s -> %s:%s", src_ip, dst_ip, dst_port)
+            return True
+        
+        # Server replying to another server along an allowed flow
+        if (src_ip, dst_ip) in self.server_return_pairs:
+            self.logger.debug("Allowing server return traffic: %s -> %s:%s", src_ip, dst_ip, dst_port)
+            return True
         
         return False
 
-    def forward_packet(self, datapath, pkt, eth_pkt, in_port):
+    def forward_packet(self, datapath, data, dst_mac, in_port, batch=False):
         """Forward packet to destination"""
-        dst_mac = eth_pkt.dst
-        
         if dst_mac in self.mac_to_port:
             out_port = self.mac_to_port[dst_mac]
         else:
@@ -382,21 +527,24 @@ class MicroSegmentationController(app_manager.RyuApp):
             buffer_id=datapath.ofproto.OFP_NO_BUFFER,
             in_port=in_port,
             actions=actions,
-            data=pkt.data
+            data=data
         )
-        datapath.send_msg(out)
+        if batch:
+            self.queue_msg(datapath, out)
+        else:
+            datapath.send_msg(out)
 
-    def flood_packet(self, datapath, msg, in_port):
+    def flood_packet(self, datapath, data, buffer_id, in_port):
         """Flood packet to all ports except input port"""
         actions = [datapath.ofproto_parser.OFPActionOutput(
             datapath.ofproto.OFPP_FLOOD)]
             
         out = datapath.ofproto_parser.OFPPacketOut(
             datapath=datapath,
-            buffer_id=msg.buffer_id,
+            buffer_id=buffer_id,
             in_port=in_port,
             actions=actions,
-            data=msg.data
+            data=data
         )
         datapath.send_msg(out)
 
@@ -404,124 +552,94 @@ class MicroSegmentationController(app_manager.RyuApp):
         """Install flow rule for allowed connections"""
         parser = datapath.ofproto_parser
         
-        # Match specific connection
-        if protocol == 'tcp':
-            match = parser.OFPMatch(
-                eth_type=ether_types.ETH_TYPE_IP,
-                ipv4_src=src_ip,
-                ipv4_dst=dst_ip,
-                ip_proto=6,  # TCP
-                tcp_dst=dst_port
-            )
-        elif protocol == 'udp':
-            match = parser.OFPMatch(
-                eth_type=ether_types.ETH_TYPE_IP,
-                ipv4_src=src_ip,
-                ipv4_dst=dst_ip,
-                ip_proto=17,  # UDP
-                udp_dst=dst_port
-            )
-        elif protocol == 'icmp':
-            match = parser.OFPMatch(
-                eth_type=ether_types.ETH_TYPE_IP,
-                ipv4_src=src_ip,
-                ipv4_dst=dst_ip,
-                ip_proto=1  # ICMP
-            )
-        else:
+        # Only TCP, UDP and ICMP connections get flow rules
+        if protocol not in PROTOCOL_MATCH_FIELDS:
             return
             
         # Forward to destination
-        dst_mac = self.ip_to_mac.get(dst_ip)
-        if dst_mac and dst_mac in self.mac_to_port:
-            out_port = self.mac_to_port[dst_mac]
+        out_port = self.ip_to_port.get(dst_ip)
+        if out_port is not None:
+            match = self.build_match(parser, src_ip, dst_ip, protocol, dst_port)
             actions = [parser.OFPActionOutput(out_port)]
             
             # Install flow with timeout
-            self.add_flow(datapath, 100, match, actions, idle_timeout=30)
-            self.logger.debug(f"Installed flow rule: {src_ip} -> {dst_ip}:{dst_port} ({protocol})")
+            self.add_flow(datapath, 100, match, actions, idle_timeout=30, batch=True)
+            self.logger.debug("Installed flow rule: %s -> %s:%s (%s)", src_ip, dst_ip, dst_port, protocol)
     
     def install_return_flow_rule(self, datapath, original_src, original_dst, original_port, protocol):
         """Install flow rule for return traffic (stateful connection)"""
         parser = datapath.ofproto_parser
         
-        # Install a more permissive return rule (any port from server back to client)
-        if protocol == 'tcp':
-            match = parser.OFPMatch(
-                eth_type=ether_types.ETH_TYPE_IP,
-                ipv4_src=original_dst,  # Server responding back
-                ipv4_dst=original_src,  # To original client
-                ip_proto=6  # TCP (any port)
-            )
-        elif protocol == 'udp':
-            match = parser.OFPMatch(
-                eth_type=ether_types.ETH_TYPE_IP,
-                ipv4_src=original_dst,  # Server responding back
-                ipv4_dst=original_src,  # To original client
-                ip_proto=17  # UDP (any port)
-            )
-        elif protocol == 'icmp':
-            # For ICMP, install bidirectional rule
-            match = parser.OFPMatch(
-                eth_type=ether_types.ETH_TYPE_IP,
-                ipv4_src=original_dst,  # Server responding back
-                ipv4_dst=original_src,  # To original client
-                ip_proto=1  # ICMP
-            )
-        else:
+        if protocol not in PROTOCOL_MATCH_FIELDS:
             return
         
         # Forward return traffic to original client
-        src_mac = self.ip_to_mac.get(original_src)
-        if src_mac and src_mac in self.mac_to_port:
-            out_port = self.mac_to_port[src_mac]
+        out_port = self.ip_to_port.get(original_src)
+        if out_port is not None:
+            # More permissive match: any port from server back to client
+            match = self.build_match(parser, original_dst, original_src, protocol)
             actions = [parser.OFPActionOutput(out_port)]
             
             # Install return flow with shorter timeout (stateful)
-            self.add_flow(datapath, 90, match, actions, idle_timeout=60)
-            self.logger.debug(f"Installed return flow rule: {original_dst} -> {original_src} ({protocol} return traffic)")
+            self.add_flow(datapath, 90, match, actions, idle_timeout=60, batch=True)
+            self.logger.debug("Installed return flow rule: %s -> %s (%s return traffic)", original_dst, original_src, protocol)
+
+    def local_time_strings(self, second):
+        """Log and ISO timestamps for a second, formatted only when the second changes"""
+        if second != self.timestamp_cache[0]:
+            local = time.localtime(second)
+            self.timestamp_cache = (second,
+                                    time.strftime('%Y-%m-%d %H:%M:%S', local),
+                                    time.strftime('%Y-%m-%dT%H:%M:%S', local))
+        return self.timestamp_cache
+
+    def now_iso(self):
+        """Current local time in ISO format with microseconds"""
+        now = time.time()
+        second = int(now)
+        return f"{self.local_time_strings(second)[2]}.{int((now - second) * 1e6):06d}"
 
     def log_security_event(self, action, src_ip, dst_ip, dst_port, protocol):
         """Log security events to file for GUI consumption"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = self.local_time_strings(int(time.time()))[1]
         src_role = self.ip_to_role.get(src_ip, 'UNKNOWN')
         
-        # Create log entry
-        log_entry = f"{timestamp} - {action}: {src_ip} ({src_role}) -> {dst_ip}:{dst_port} ({protocol})"
-        
-        # Write to security events log file
-        try:
-            with open(self.security_log_file, 'a') as f:
-                f.write(log_entry + '\n')
-        except Exception as e:
-            self.logger.error(f"Failed to write security log: {e}")
+        self.security_logger.info("%s - %s: %s (%s) -> %s:%s (%s)",
+                                  timestamp, action, src_ip, src_role, dst_ip, dst_port, protocol)
+
+    def flush_security_log_loop(self):
+        """Periodically flush buffered security events to the log file"""
+        while True:
+            hub.sleep(SECURITY_LOG_FLUSH_INTERVAL)
+            self.security_log_handler.flush()
     
     def log_security_violation(self, src_ip, dst_ip, dst_port, protocol):
         """Log security policy violations"""
-        violation = {
-            'timestamp': datetime.now().isoformat(),
-            'source_ip': src_ip,
-            'destination_ip': dst_ip,
-            'destination_port': dst_port,
-            'protocol': protocol,
-            'source_role': self.ip_to_role.get(src_ip, 'UNKNOWN'),
-            'action': 'BLOCKED'
-        }
+        violation = Violation(self.now_iso(), src_ip, dst_ip, dst_port, protocol,
+                              self.ip_to_role.get(src_ip, 'UNKNOWN'), 'BLOCKED')
         
+        # The deque drops the oldest violation once full
         self.policy_violations.append(violation)
         
-        # Log to file
-        self.logger.error(f"SECURITY VIOLATION: {violation}")
-        
-        # Keep only last 1000 violations
-        if len(self.policy_violations) > 1000:
-            self.policy_violations = self.policy_violations[-1000:]
+        # Log to the security events file
+        self.security_logger.error("%s - SECURITY VIOLATION: %s",
+                                   self.local_time_strings(int(time.time()))[1], violation._asdict())
+
+    def decay_traffic_flows(self):
+        """Halve every flow counter and forget flows that drop to zero"""
+        self.traffic_flows = defaultdict(int, {
+            flow: count >> 1 for flow, count in self.traffic_flows.items() if count > 1
+        })
 
     def get_traffic_stats(self):
         """Return current traffic statistics"""
         return {
-            'traffic_flows': dict(self.traffic_flows),
+            'traffic_flows': {f"{src}:{dst}:{port}": count
+                              for (src, dst, port), count in self.traffic_flows.items()},
             'dependency_graph': {k: list(v) for k, v in self.dependency_graph.items()},
-            'policy_violations': self.policy_violations[-10:],  # Last 10 violations
+            'policy_violations': [  # Last 10 violations
+                v._asdict() for v in itertools.islice(
+                    self.policy_violations, max(len(self.policy_violations) - 10, 0), None)
+            ],
             'learned_hosts': dict(self.ip_to_mac)
         }
\ No newline at end of file
@@ -6,13 +6,60 @@ Cross-platform desktop interface using Tkinter
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
+import errno
 import json
+import mmap
 import os
+import queue
+import re
+import selectors
 import subprocess
 import threading
 import time
+from collections import deque
 from datetime import datetime
 
+try:
+    import psutil  # Optional: scan processes without forking pgrep
+except ImportError:
+    psutil = None
+
+try:
+    import ijson  # Optional: stream the summary out of large test reports
+except ImportError:
+    ijson = None
+
+# Process scan results are reused for this many seconds
+STATUS_CACHE_TTL = 2.0
+
+# Command-line pattern identifying each monitored component
+PROCESS_PATTERNS = {'controller': 'ryu-manager', 'topology': 'mininet'}
+PROCESS_REGEX = re.compile(b'|'.join(re.escape(p.encode()) for p in PROCESS_PATTERNS.values()))
+PATTERN_COMPONENTS = {p.encode(): component for component, p in PROCESS_PATTERNS.items()}
+
+# Security events log tailed by the events pane
+SECURITY_EVENTS_LOG = 'security_events.log'
+RECENT_EVENTS_SHOWN = 30
+
+# Lines of test output kept in the test pane
+TEST_OUTPUT_LINES = 500
+
+# Report written by the security test scripts
+TEST_REPORT_FILE = 'security_test_report.json'
+
+# Topology diagram (text-based)
+TOPOLOGY_DIAGRAM = """
+        Controller (Ryu)
+             🎛️
+             ↕️
+        OpenFlow Switch
+             🔀
+             ↕️
+    🌐      ⚙️      🗄️      👤      👨‍💼
+   Web     App      DB      HR     Admin
+  (.10)   (.20)   (.30)   (.100)  (.200)
+        """
+
 class SDNDesktopGUI:
     def __init__(self, root):
         self.root = root
@@ -24,9 +71,31 @@ class SDNDesktopGUI:
         self.controller_status = tk.StringVar(value="Unknown")
         self.topology_status = tk.StringVar(value="Unknown")
         self.test_results = {}
+        self.status_cache = (0.0, None)  # (monotonic time, (controller, topology))
+        self.displayed_status = None  # (controller, topology) currently shown
+        self.recent_events = deque(maxlen=RECENT_EVENTS_SHOWN)
+        self.test_lines = deque(maxlen=TEST_OUTPUT_LINES)
+        self.test_render_pending = False
+        self.report_cache = None  # (st_mtime_ns, summary) of the last parsed report
+        
+        # One long-lived worker serves all status refreshes
+        self.status_requests = queue.Queue()
+        self.refresh_lock = threading.Lock()  # Held while a refresh is queued or running
+        threading.Thread(target=self.status_worker, daemon=True).start()
+        self.events_offset = 0  # Bytes of the events log already read
+        
+        # Exit notifications for running components via pidfds (Linux 5.3+)
+        self.watched_pids = {}  # pid -> component
+        self.watch_lock = threading.Lock()
+        self.closing = False
+        self.process_selector = None
+        if hasattr(os, 'pidfd_open'):
+            self.process_selector = selectors.DefaultSelector()
+            threading.Thread(target=self.process_watch_loop, daemon=True).start()
         
         self.create_widgets()
         self.start_auto_refresh()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
     
     def create_widgets(self):
         """Create all GUI widgets"""
@@ -71,15 +140,15 @@ class SDNDesktopGUI:
         
         # Controller status
         tk.Label(status_frame, text="Ryu Controller:", font=('Arial', 10), bg='white').grid(row=0, column=0, sticky='w', pady=2)
-        controller_label = tk.Label(status_frame, textvariable=self.controller_status, 
-                                  font=('Arial', 10, 'bold'), bg='white', fg='red')
-        controller_label.grid(row=0, column=1, sticky='w', padx=(10, 0), pady=2)
+        self.controller_label = tk.Label(status_frame, textvariable=self.controller_status, 
+                                       font=('Arial', 10, 'bold'), bg='white', fg='red')
+        self.controller_label.grid(row=0, column=1, sticky='w', padx=(10, 0), pady=2)
         
         # Topology status
         tk.Label(status_frame, text="Mininet Topology:", font=('Arial', 10), bg='white').grid(row=1, column=0, sticky='w', pady=2)
-        topology_label = tk.Label(status_frame, textvariable=self.topology_status, 
-                                font=('Arial', 10, 'bold'), bg='white', fg='red')
-        topology_label.grid(row=1, column=1, sticky='w', padx=(10, 0), pady=2)
+        self.topology_label = tk.Label(status_frame, textvariable=self.topology_status, 
+                                     font=('Arial', 10, 'bold'), bg='white', fg='red')
+        self.topology_label.grid(row=1, column=1, sticky='w', padx=(10, 0), pady=2)
         
         # Refresh button
         refresh_btn = tk.Button(status_frame, text="🔄 Refresh Status", 
@@ -135,149 +204,300 @@ class SDNDesktopGUI:
                                      font=('Arial', 12, 'bold'), bg='white', padx=10, pady=10)
         topology_frame.pack(fill='x')
         
-        # Topology diagram (text-based)
-        topology_text = """
-        Controller (Ryu)
-             🎛️
-             ↕️
-        OpenFlow Switch
-             🔀
-             ↕️
-    🌐      ⚙️      🗄️      👤      👨‍💼
-   Web     App      DB      HR     Admin
-  (.10)   (.20)   (.30)   (.100)  (.200)
-        """
-        
-        tk.Label(topology_frame, text=topology_text, font=('Courier', 10), 
+        tk.Label(topology_frame, text=TOPOLOGY_DIAGRAM, font=('Courier', 10), 
                bg='white', justify='center').pack()
     
     def refresh_status(self):
         """Refresh system status"""
-        def check_status():
+        # Ignore clicks while a refresh is already queued or running
+        if not self.refresh_lock.acquire(blocking=False):
+            return
+        self.status_requests.put(None)
+    
+    def status_worker(self):
+        """Check process status off the Tk thread whenever a refresh is requested"""
+        while True:
+            self.status_requests.get()
             try:
-                # Check Ryu controller
-                result = subprocess.run(['pgrep', '-f', 'ryu-manager'], 
-                                      capture_output=True, text=True)
-                controller_running = result.returncode == 0
-                
-                # Check Mininet
-                result = subprocess.run(['pgrep', '-f', 'mininet'], 
-                                      capture_output=True, text=True)
-                topology_running = result.returncode == 0
+                controller_running, topology_running = self.check_processes()
                 
                 # Update GUI in main thread
-                self.root.after(0, lambda: self.update_status(controller_running, topology_running))
+                self.root.after_idle(self.update_status, controller_running, topology_running)
                 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Status check failed: {e}"))
+                self.root.after_idle(messagebox.showerror, "Error", f"Status check failed: {e}")
+            finally:
+                self.refresh_lock.release()
+    
+    def check_processes(self):
+        """Return (controller_running, topology_running), cached for STATUS_CACHE_TTL seconds"""
+        checked_at, status = self.status_cache
+        if status is not None and time.monotonic() - checked_at < STATUS_CACHE_TTL:
+            return status
+            
+        pids = self.find_process_pids()
+        self.watch_processes(pids)
+        
+        status = (bool(pids['controller']), bool(pids['topology']))
+        self.status_cache = (time.monotonic(), status)
+        return status
+    
+    def find_process_pids(self):
+        """Find PIDs whose command line matches each component pattern"""
+        pids = {component: [] for component in PROCESS_PATTERNS}
+        if psutil is not None:
+            # One pass over the process table instead of two pgrep forks,
+            # stopping as soon as one process of each component is found
+            remaining = dict(PROCESS_PATTERNS)
+            for proc in psutil.process_iter(['cmdline']):
+                cmdline = ' '.join(proc.info['cmdline'] or ())
+                for component, pattern in list(remaining.items()):
+                    if pattern in cmdline:
+                        pids[component].append(proc.pid)
+                        del remaining[component]
+                if not remaining:
+                    break
+        elif os.path.isdir('/proc'):
+            self.scan_proc(pids)
+        else:
+            for component, pattern in PROCESS_PATTERNS.items():
+                result = subprocess.run(['pgrep', '-f', pattern], 
+                                      capture_output=True, text=True)
+                pids[component] = [int(pid) for pid in result.stdout.split()]
+        return pids
+    
+    def scan_proc(self, pids):
+        """Match every /proc/<pid>/cmdline against all patterns in one pass"""
+        remaining = set(PROCESS_PATTERNS)
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{entry.name}/cmdline', 'rb') as f:
+                        cmdline = f.read()
+                except OSError:
+                    continue  # Exited or not readable
+                    
+                for match in PROCESS_REGEX.finditer(cmdline):
+                    component = PATTERN_COMPONENTS[match.group()]
+                    if component in remaining:
+                        pids[component].append(int(entry.name))
+                        remaining.discard(component)
+                if not remaining:
+                    break
+    
+    def watch_processes(self, pids):
+        """Register pidfds for newly found processes so their exit is reported immediately"""
+        if self.process_selector is None:
+            return
+            
+        with self.watch_lock:
+            if self.closing:
+                return
+            for component, component_pids in pids.items():
+                for pid in component_pids:
+                    if pid in self.watched_pids:
+                        continue
+                    try:
+                        pidfd = os.pidfd_open(pid)
+                    except OSError as e:
+                        if e.errno == errno.ESRCH:
+                            continue  # Exited since the scan
+                        # pidfds unsupported by this kernel; keep polling
+                        self.process_selector = None
+                        return
+                    self.process_selector.register(pidfd, selectors.EVENT_READ, pid)
+                    self.watched_pids[pid] = component
+    
+    def process_watch_loop(self):
+        """Wait on watched pidfds and refresh status as soon as a process exits
+        
+        This thread owns the selector and closes it, with any pidfds still
+        registered, once the window is closing or pidfds turn out unsupported.
+        """
+        selector = self.process_selector
+        while not self.closing and self.process_selector is not None:
+            exited = False
+            for key, _ in selector.select(timeout=0.5):
+                with self.watch_lock:
+                    if key.fd not in selector.get_map():
+                        continue  # Unregistered since select() returned it
+                    selector.unregister(key.fd)
+                    os.close(key.fd)
+                    self.watched_pids.pop(key.data, None)
+                exited = True
+                
+            if exited and not self.closing:
+                self.status_cache = (0.0, None)
+                self.root.after_idle(self.refresh_status)
         
-        threading.Thread(target=check_status, daemon=True).start()
+        with self.watch_lock:
+            for key in list(selector.get_map().values()):
+                selector.unregister(key.fd)
+                os.close(key.fd)
+            self.watched_pids.clear()
+            selector.close()
+    
+    def components_watched(self):
+        """Check if every component is running and watched through a pidfd"""
+        return set(self.watched_pids.values()) >= set(PROCESS_PATTERNS)
+    
+    def on_close(self):
+        """Stop the pidfd watcher, which closes its pidfds, and exit"""
+        with self.watch_lock:
+            self.closing = True
+        self.root.destroy()
     
     def update_status(self, controller_running, topology_running):
         """Update status display"""
+        # Unchanged status needs no Tcl calls at all
+        if self.displayed_status == (controller_running, topology_running):
+            return
+        self.displayed_status = (controller_running, topology_running)
+        
         self.controller_status.set("Running" if controller_running else "Stopped")
         self.topology_status.set("Running" if topology_running else "Stopped")
         
         # Update colors
-        for widget in self.root.winfo_children():
-            self.update_status_colors(widget, controller_running, topology_running)
-    
-    def update_status_colors(self, widget, controller_running, topology_running):
-        """Recursively update status label colors"""
-        if isinstance(widget, tk.Label):
-            if widget['textvariable'] == str(self.controller_status):
-                widget.config(fg='green' if controller_running else 'red')
-            elif widget['textvariable'] == str(self.topology_status):
-                widget.config(fg='green' if topology_running else 'red')
-        
-        for child in widget.winfo_children():
-            self.update_status_colors(child, controller_running, topology_running)
+        self.controller_label.config(fg='green' if controller_running else 'red')
+        self.topology_label.config(fg='green' if topology_running else 'red')
     
     def run_basic_test(self):
         """Run basic security tests"""
-        def run_test():
-            try:
-                self.root.after(0, lambda: self.test_text.insert(tk.END, "Running basic tests...\n"))
-                result = subprocess.run(['python3', 'test_attacks.py'], 
-                                      capture_output=True, text=True, timeout=30)
-                
-                if result.returncode == 0:
-                    self.root.after(0, lambda: self.test_text.insert(tk.END, "✅ Basic tests completed!\n"))
-                    self.root.after(0, self.load_test_results)
-                else:
-                    self.root.after(0, lambda: self.test_text.insert(tk.END, f"❌ Test failed: {result.stderr}\n"))
-                    
-            except Exception as e:
-                self.root.after(0, lambda: self.test_text.insert(tk.END, f"❌ Error: {e}\n"))
-        
-        threading.Thread(target=run_test, daemon=True).start()
+        self.run_test_script('test_attacks.py', 'Basic')
     
     def run_advanced_test(self):
         """Run advanced security tests"""
+        self.run_test_script('advanced_attacks.py', 'Advanced')
+    
+    def run_test_script(self, script, name):
+        """Run a test script, streaming its output into the test pane line by line"""
         def run_test():
             try:
-                self.root.after(0, lambda: self.test_text.insert(tk.END, "Running advanced tests...\n"))
-                result = subprocess.run(['python3', 'advanced_attacks.py'], 
-                                      capture_output=True, text=True, timeout=30)
+                self.root.after_idle(self.append_test_line, f"Running {name.lower()} tests...\n")
+                # -u so the child flushes each line instead of buffering until exit
+                proc = subprocess.Popen(['python3', '-u', script], stdout=subprocess.PIPE,
+                                        stderr=subprocess.STDOUT, text=True, bufsize=1)
+                with proc.stdout:
+                    for line in proc.stdout:
+                        self.root.after_idle(self.append_test_line, line)
                 
-                if result.returncode == 0:
-                    self.root.after(0, lambda: self.test_text.insert(tk.END, "✅ Advanced tests completed!\n"))
-                    self.root.after(0, self.load_test_results)
+                if proc.wait() == 0:
+                    self.root.after_idle(self.append_test_line, f"✅ {name} tests completed!\n")
+                    self.root.after_idle(self.load_test_results)
                 else:
-                    self.root.after(0, lambda: self.test_text.insert(tk.END, f"❌ Test failed: {result.stderr}\n"))
+                    self.root.after_idle(self.append_test_line, f"❌ Test failed with exit code {proc.returncode}\n")
                     
             except Exception as e:
-                self.root.after(0, lambda: self.test_text.insert(tk.END, f"❌ Error: {e}\n"))
+                self.root.after_idle(self.append_test_line, f"❌ Error: {e}\n")
         
         threading.Thread(target=run_test, daemon=True).start()
     
+    def append_test_line(self, line):
+        """Add test output to the bounded buffer and schedule one redraw for the batch"""
+        self.test_lines.append(line)
+        if not self.test_render_pending:
+            self.test_render_pending = True
+            self.root.after_idle(self.render_test_lines)
+    
+    def render_test_lines(self):
+        """Replace the test pane with the buffered output in a single update"""
+        self.test_render_pending = False
+        self.test_text.delete(1.0, tk.END)
+        self.test_text.insert(tk.END, ''.join(self.test_lines))
+        self.test_text.see(tk.END)
+    
     def load_test_results(self):
         """Load and display test results"""
         try:
-            if os.path.exists('security_test_report.json'):
-                with open('security_test_report.json', 'r') as f:
-                    data = json.load(f)
+            if os.path.exists(TEST_REPORT_FILE):
+                summary = self.read_report_summary()
                     
-                if 'summary' in data:
-                    summary = data['summary']
+                if summary is not None:
                     result_text = f"""
 📊 Test Results Summary:
 Total Tests: {summary.get('total_tests', 0)}
 Passed Tests: {summary.get('passed_tests', 0)}
 Success Rate: {summary.get('success_rate', 0):.1f}%
-Duration: {summary.get('duration', 0):.2f}s
+Duration: {summary.get('duration_seconds', summary.get('duration', 0)):.2f}s
 
 """
-                    self.test_text.insert(tk.END, result_text)
-                    self.test_text.see(tk.END)
+                    self.append_test_line(result_text)
         except Exception as e:
-            self.test_text.insert(tk.END, f"Error loading results: {e}\n")
+            self.append_test_line(f"Error loading results: {e}\n")
+    
+    def read_report_summary(self):
+        """Read only the summary section of the test report, reparsing only when it changes"""
+        mtime_ns = os.stat(TEST_REPORT_FILE).st_mtime_ns
+        if self.report_cache and self.report_cache[0] == mtime_ns:
+            return self.report_cache[1]
+            
+        with open(TEST_REPORT_FILE, 'rb') as f:
+            if ijson is None:
+                summary = json.load(f).get('summary')
+            else:
+                # The summary precedes the detailed results, so stop once it is parsed
+                summary = next(ijson.items(f, 'summary', use_float=True), None)
+                
+        self.report_cache = (mtime_ns, summary)
+        return summary
     
     def refresh_events(self):
-        """Refresh security events"""
+        """Refresh security events, reading only what was appended since last time"""
         try:
-            self.events_text.delete(1.0, tk.END)
-            
-            if os.path.exists('security_events.log'):
-                with open('security_events.log', 'r') as f:
-                    lines = f.readlines()
-                    recent_events = lines[-30:]  # Last 30 events
-                    
-                for event in recent_events:
-                    self.events_text.insert(tk.END, event)
+            if os.path.exists(SECURITY_EVENTS_LOG):
+                self.read_new_events()
+                events_text = ''.join(self.recent_events)
             else:
-                self.events_text.insert(tk.END, "No security events logged yet.\n")
-                self.events_text.insert(tk.END, "Start the controller and run tests to generate events.\n")
+                events_text = ("No security events logged yet.\n"
+                               "Start the controller and run tests to generate events.\n")
                 
+            self.events_text.delete(1.0, tk.END)
+            self.events_text.insert(tk.END, events_text)
             self.events_text.see(tk.END)
             
         except Exception as e:
             self.events_text.insert(tk.END, f"Error loading events: {e}\n")
     
+    def read_new_events(self):
+        """Append complete lines written to the events log since the last read"""
+        size = os.stat(SECURITY_EVENTS_LOG).st_size
+        if size < self.events_offset:
+            # Log was rotated or truncated; start over
+            self.events_offset = 0
+            self.recent_events.clear()
+        if size == self.events_offset:
+            return
+            
+        with open(SECURITY_EVENTS_LOG, 'rb') as f:
+            if self.events_offset == 0:
+                # First load only needs the lines that will be shown
+                self.events_offset = self.find_tail_start(f)
+            f.seek(self.events_offset)
+            data = f.read()
+            
+        # Leave a partially written last line for the next read
+        end = data.rfind(b'\n') + 1
+        self.events_offset += end
+        self.recent_events.extend(data[:end].decode('utf-8', 'replace').splitlines(keepends=True))
+    
+    def find_tail_start(self, f):
+        """Offset of the last RECENT_EVENTS_SHOWN complete lines, found by scanning backwards"""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            idx = mm.rfind(b'\n')
+            for _ in range(RECENT_EVENTS_SHOWN):
+                if idx <= 0:
+                    return 0
+                idx = mm.rfind(b'\n', 0, idx)
+            return idx + 1
+    
     def start_auto_refresh(self):
         """Start automatic refresh of data"""
         def auto_refresh():
-            self.refresh_status()
+            # Running components watched via pidfd report their own exit
+            if not self.components_watched():
+                self.refresh_status()
             self.refresh_events()
             # Schedule next refresh
             self.root.after(5000, auto_refresh)  # Every 5 seconds
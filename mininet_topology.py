@@ -22,21 +22,51 @@ from mininet.node import Controller, RemoteController, OVSKernelSwitch
 from mininet.cli import CLI
 from mininet.log import setLogLevel, info
 from mininet.link import TCLink
+from mininet.topo import Topo
 import time
 
+# (name, ip, mac, role) for every host attached to s1
+HOSTS = [
+    ('h1', '10.0.0.10/24', '00:00:00:00:00:01', 'Web Server'),
+    ('h2', '10.0.0.20/24', '00:00:00:00:00:02', 'App Server'),
+    ('h3', '10.0.0.30/24', '00:00:00:00:00:03', 'DB Server'),
+    ('h4', '10.0.0.100/24', '00:00:00:00:00:04', 'HR User'),
+    ('h5', '10.0.0.200/24', '00:00:00:00:00:05', 'Admin User'),
+]
+
+# Upper bound on waiting for the simulated services to start listening
+SERVICE_START_TIMEOUT = 2.0
+SERVICE_POLL_INTERVAL = 0.05
+
+class MicroSegTopo(Topo):
+    """
+    Single switch with every host from HOSTS attached
+    """
+    def build(self):
+        # Add OpenFlow switch
+        s1 = self.addSwitch('s1', protocols='OpenFlow13')
+        
+        # Add hosts and connect each to the switch
+        for name, ip, mac, role in HOSTS:
+            self.addHost(name, ip=ip, mac=mac)
+            self.addLink(name, s1)
+
 def create_topology():
     """
     Create and configure the network topology
     """
     info('*** Creating network topology\n')
     
-    # Create Mininet instance with remote controller
+    # Hosts, switch and links are declared up front and built together on start;
+    # the controller is added explicitly below
     net = Mininet(
-        controller=RemoteController,
+        topo=MicroSegTopo(),
+        controller=None,
         switch=OVSKernelSwitch,
         link=TCLink,
         autoSetMacs=True,
-        autoStaticArp=True
+        autoStaticArp=True,
+        build=False
     )
     
     info('*** Adding controller\n')
@@ -48,28 +78,6 @@ def create_topology():
         port=6653
     )
     
-    info('*** Adding switch\n')
-    # Add OpenFlow switch
-    s1 = net.addSwitch('s1', protocols='OpenFlow13')
-    
-    info('*** Adding hosts\n')
-    # Add server hosts
-    h1 = net.addHost('h1', ip='10.0.0.10/24', mac='00:00:00:00:00:01')  # Web Server
-    h2 = net.addHost('h2', ip='10.0.0.20/24', mac='00:00:00:00:00:02')  # App Server  
-    h3 = net.addHost('h3', ip='10.0.0.30/24', mac='00:00:00:00:00:03')  # DB Server
-    
-    # Add user hosts
-    h4 = net.addHost('h4', ip='10.0.0.100/24', mac='00:00:00:00:00:04') # HR User
-    h5 = net.addHost('h5', ip='10.0.0.200/24', mac='00:00:00:00:00:05') # Admin User
-    
-    info('*** Creating links\n')
-    # Connect all hosts to the switch
-    net.addLink(h1, s1)
-    net.addLink(h2, s1) 
-    net.addLink(h3, s1)
-    net.addLink(h4, s1)
-    net.addLink(h5, s1)
-    
     return net
 
 def setup_services(net):
@@ -95,8 +103,30 @@ def setup_services(net):
     info('*** Starting database listener on h3:3306\n')
     db.cmd('nc -l -p 3306 &')
     
-    # Give services time to start
-    time.sleep(2)
+    # Wait until every service is listening rather than a fixed delay
+    wait_for_services([(web, 80), (app, 8080), (db, 3306)])
+
+def service_listening(host, port):
+    """
+    Check for a listening TCP socket in the host's namespace without connecting,
+    since the one-shot nc listener would exit after a probe connection
+    """
+    return bool(host.cmd(f'ss -Hltn "sport = :{port}"').strip())
+
+def wait_for_services(services):
+    """
+    Poll (host, port) pairs until all are listening or SERVICE_START_TIMEOUT elapses
+    """
+    deadline = time.monotonic() + SERVICE_START_TIMEOUT
+    pending = list(services)
+    while pending:
+        pending = [(host, port) for host, port in pending if not service_listening(host, port)]
+        if not pending or time.monotonic() >= deadline:
+            break
+        time.sleep(SERVICE_POLL_INTERVAL)
+        
+    for host, port in pending:
+        info(f'*** Warning: {host.name}:{port} is not listening yet\n')
 
 def main():
     """
@@ -8,6 +8,23 @@ import os
 import sys
 import subprocess
 import json
+import functools
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Successful command checks are remembered across runs for an hour
+PREREQ_CACHE_FILE = os.path.expanduser('~/.cache/sdn-microseg/prereq.json')
+PREREQ_CACHE_TTL = 3600
+PREREQ_CACHE_LOCK = threading.Lock()
+
+# External tools checked by running '<command> --version'
+PREREQ_COMMANDS = {
+    'Mininet': 'mn',
+    'Open vSwitch': 'ovs-vsctl',
+    'Ryu Controller': 'ryu-manager'
+}
 
 def check_python_version():
     """Check if Python version is 3.9+"""
@@ -17,25 +34,58 @@ def check_python_version():
     print("✅ Python version:", sys.version.split()[0])
     return True
 
+def load_prereq_cache():
+    """Load cached command checks, ignoring a missing or corrupt cache file"""
+    try:
+        with open(PREREQ_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_prereq_check(key):
+    """Record a successful command check in the cache file"""
+    with PREREQ_CACHE_LOCK:
+        cache = load_prereq_cache()
+        cache[key] = time.time()
+        try:
+            os.makedirs(os.path.dirname(PREREQ_CACHE_FILE), exist_ok=True)
+            tmp_file = PREREQ_CACHE_FILE + '.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, PREREQ_CACHE_FILE)
+        except OSError:
+            pass  # Caching is best effort
+
+@functools.lru_cache(maxsize=None)
 def check_command(command):
     """Check if a command exists in PATH"""
+    path = shutil.which(command)
+    if path is None:
+        return False
+        
+    # Reuse a recent success for the same executable, unchanged on disk
+    key = f"{command}:{path}:{os.stat(path).st_mtime_ns}"
+    checked_at = load_prereq_cache().get(key)
+    if checked_at is not None and time.time() - checked_at < PREREQ_CACHE_TTL:
+        return True
+        
     try:
         subprocess.run([command, '--version'], 
                       capture_output=True, check=True)
-        return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
+    save_prereq_check(key)
+    return True
 
 def check_prerequisites():
     """Check all system prerequisites"""
     print("Checking system prerequisites...")
     
-    checks = {
-        'Python 3.9+': check_python_version(),
-        'Mininet': check_command('mn'),
-        'Open vSwitch': check_command('ovs-vsctl'),
-        'Ryu Controller': check_command('ryu-manager')
-    }
+    # Tool checks only wait on subprocesses, so run them side by side
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = executor.map(check_command, PREREQ_COMMANDS.values())
+        checks = {'Python 3.9+': check_python_version()}
+        checks.update(zip(PREREQ_COMMANDS, results))
     
     all_good = True
     for name, status in checks.items():
@@ -85,8 +135,12 @@ def validate_config_files():
         'test_attacks.py'
     ]
     
+    # One directory listing instead of a stat per file
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries}
+    
     for file in required_files:
-        if os.path.exists(file):
+        if file in present:
             print(f"✅ {file} found")
         else:
             print(f"❌ {file} missing")
@@ -11,89 +11,237 @@ This script tests the security of the micro-segmentation system by:
 Run this after starting the controller and topology.
 """
 
+import argparse
+import asyncio
+import functools
+import shlex
 import subprocess
+import threading
 import time
 import json
-from datetime import datetime
+import os
+from datetime import datetime, timedelta
+
+# Written by generate_report; the summary comes first so readers can stop early
+REPORT_FILE = 'security_test_report.json'
+
+# Host number -> IP address
+HOST_IPS = {
+    1: "10.0.0.10",  # Web server
+    2: "10.0.0.20",  # App server
+    3: "10.0.0.30",  # DB server
+    4: "10.0.0.100", # HR user
+    5: "10.0.0.200"  # Admin user
+}
+IP_TO_HOST = {ip: host for host, ip in HOST_IPS.items()}
+
+# Flows allowed by the SDN policy (mirrors roles.json): (source host, dest IP, dest port)
+ALLOWED_FLOWS = frozenset({
+    (4, "10.0.0.10", 80),     # HR can access web server
+    (4, "10.0.0.10", 443),
+    (1, "10.0.0.20", 8080),   # Web to App
+    (2, "10.0.0.30", 3306),   # App to DB
+})
+
+# Admin (h5) can access servers on any port, but not other users
+ALLOWED_HOST_PAIRS = frozenset({
+    (5, "10.0.0.10"),
+    (5, "10.0.0.20"),
+    (5, "10.0.0.30"),
+})
+
+# Connection tests: (source host, dest IP, dest port, expected result, description)
+LEGIT_TESTS = (
+    # HR user access
+    (4, "10.0.0.10", 80, "ALLOWED", "HR user accessing web server HTTP"),
+    (4, "10.0.0.10", 443, "ALLOWED", "HR user accessing web server HTTPS"),
+    
+    # Admin user access  
+    (5, "10.0.0.10", 80, "ALLOWED", "Admin accessing web server HTTP"),
+    (5, "10.0.0.10", 443, "ALLOWED", "Admin accessing web server HTTPS"),
+    (5, "10.0.0.10", 22, "ALLOWED", "Admin SSH to web server"),
+    (5, "10.0.0.20", 8080, "ALLOWED", "Admin accessing app server"),
+    (5, "10.0.0.30", 3306, "ALLOWED", "Admin accessing database"),
+    
+    # Server-to-server communication
+    (1, "10.0.0.20", 8080, "ALLOWED", "Web server to app server"),
+    (2, "10.0.0.30", 3306, "ALLOWED", "App server to database"),
+)
+
+ATTACK_TESTS = (
+    # HR user trying unauthorized access
+    (4, "10.0.0.20", 8080, "BLOCKED", "HR user attacking app server"),
+    (4, "10.0.0.30", 3306, "BLOCKED", "HR user attacking database"),
+    (4, "10.0.0.10", 22, "BLOCKED", "HR user trying SSH to web server"),
+    
+    # Cross-server attacks
+    (1, "10.0.0.30", 3306, "BLOCKED", "Web server attacking database directly"),
+    (3, "10.0.0.10", 80, "BLOCKED", "Database attacking web server"),
+    (3, "10.0.0.20", 8080, "BLOCKED", "Database attacking app server"),
+    
+    # User-to-user attacks
+    (4, "10.0.0.200", 22, "BLOCKED", "HR user attacking admin user"),
+    (5, "10.0.0.100", 22, "BLOCKED", "Admin attacking HR user"),
+)
+
+# Ryu's OpenFlow listener (see mininet_topology.py); polled in live mode until it answers
+CONTROLLER_ADDRESS = ('127.0.0.1', 6653)
+CONTROLLER_WAIT_TIMEOUT = 5.0
+CONTROLLER_POLL_INTERVAL = 0.1
+
+# Printed after each command sent to a host shell, followed by its exit status
+SHELL_SENTINEL = '__END__'
+
+def probe_argv(dest_ip, dest_port):
+    """Return the argv probing dest_ip:dest_port (no /bin/sh involved)"""
+    # Test using curl for HTTP ports
+    if dest_port in [80, 8080]:
+        return ['curl', '-s', '-o', '/dev/null', '-m', '3', '--connect-timeout', '3',
+                f'http://{dest_ip}:{dest_port}']
+    if dest_port == 443:
+        return ['curl', '-s', '-o', '/dev/null', '-m', '3', '--connect-timeout', '3', '-k',
+                f'https://{dest_ip}:{dest_port}']
+    if dest_port in [22, 3306]:
+        # Use netcat for other ports
+        return ['nc', '-z', '-w', '3', dest_ip, str(dest_port)]
+    # Default ping test
+    return ['ping', '-q', '-c', '1', '-W', '1', dest_ip]
+
+def find_host_pid(host):
+    """Return the pid of a running Mininet host's shell (e.g. "h4"), or None"""
+    # Mininet starts each host as `bash ... mininet:<name>`
+    result = subprocess.run(['pgrep', '-f', f'mininet:{host}$'],
+                            capture_output=True, text=True)
+    pids = result.stdout.split()
+    return int(pids[0]) if pids else None
+
+class HostShell:
+    """Long-lived bash inside a Mininet host's namespaces, fed commands over stdin"""
+    
+    def __init__(self, pid):
+        self.proc = subprocess.Popen(
+            ['sudo', '-n', 'mnexec', '-a', str(pid), '/bin/bash'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True
+        )
+        self.lock = threading.Lock()  # One command at a time per shell
+        
+    def run(self, command, timeout=10):
+        """Run a command (argv list or shell line) in the shell and return (success, output)"""
+        if isinstance(command, list):
+            command = shlex.join(command)
+        with self.lock:
+            # The leading newline keeps the sentinel on its own line even if the
+            # command's output does not end with one
+            self.proc.stdin.write(f"timeout {timeout} {command}\n"
+                                  f"printf '\\n{SHELL_SENTINEL}:%s\\n' $?\n")
+            self.proc.stdin.flush()
+            
+            lines = []
+            for line in self.proc.stdout:
+                if line.startswith(f"{SHELL_SENTINEL}:"):
+                    output = ''.join(lines)[:-1]
+                    return line.split(':', 1)[1].strip() == '0', output
+                lines.append(line)
+            raise RuntimeError("Host shell exited")
+            
+    def close(self):
+        """Exit the shell"""
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self.proc.kill()
 
 class SecurityTester:
     """Class to test security policies and simulate attacks"""
     
-    def __init__(self):
+    def __init__(self, live_probe=False):
         self.test_results = []
+        self.live_probe = live_probe  # Also send real probes, not just simulate verdicts
         self.start_time = datetime.now()
+        self.mono_start = time.monotonic()  # Result times are offsets from here
+        self.shells = {}  # Mininet host name -> HostShell, or None if not running
+        self.shells_lock = threading.Lock()
+        
+    async def run_command(self, command, timeout=10):
+        """Execute a command given as an argv list (no shell involved) and return result
         
-    def run_command(self, command, timeout=10):
-        """Execute a command and return result"""
+        Only the exit status and stderr are used, so stdout is discarded and
+        returned as an empty string.
+        """
         try:
-            result = subprocess.run(
-                command, 
-                shell=True, 
-                capture_output=True, 
-                text=True, 
-                timeout=timeout
-            )
-            return result.returncode == 0, result.stdout, result.stderr
-        except subprocess.TimeoutExpired:
+            proc = await asyncio.create_subprocess_exec(
+                *command, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE)
+        except OSError as e:
+            # Without a shell, a missing binary raises instead of exiting 127
+            return False, "", str(e)
+            
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
             return False, "", "Command timed out"
+        return proc.returncode == 0, "", stderr.decode(errors='replace')
+    
+    def get_shell(self, host):
+        """Return the cached HostShell for a Mininet host, or None if it is not running"""
+        with self.shells_lock:
+            if host not in self.shells:
+                pid = find_host_pid(host)
+                self.shells[host] = HostShell(pid) if pid else None
+            return self.shells[host]
+    
+    def close_shells(self):
+        """Exit every open host shell"""
+        for shell in self.shells.values():
+            if shell:
+                shell.close()
+        self.shells.clear()
     
-    def execute_mininet_command(self, mininet_cmd, timeout=10):
-        """Execute command directly in Mininet network namespace"""
+    async def execute_mininet_command(self, host, command, timeout=10):
+        """Execute a command (argv list or shell line) in a Mininet host's namespaces"""
         try:
-            # Use Mininet's mn command to execute in network namespace
-            full_command = f"sudo mn --custom mininet_topology.py --topo mytopo --test none --controller remote -x '{mininet_cmd}'"
+            # Host shells are blocking pipes, so drive them from worker threads
+            shell = await asyncio.to_thread(self.get_shell, host)
+            if shell:
+                success, output = await asyncio.to_thread(shell.run, command, timeout)
+                return success, output, ""
+        except (OSError, RuntimeError) as e:
+            print(f"⚠️  Host shell for {host} failed: {e}")
+            with self.shells_lock:
+                self.shells[host] = None  # Don't retry a broken shell
             
-            # Alternative: Use direct namespace execution
-            # This works if Mininet is already running
-            ns_command = f"sudo ip netns exec {mininet_cmd}"
-            
-            print(f"🔄 Executing: {mininet_cmd}")
+        # Fallback: Try direct execution
+        return await self.run_command(command, timeout)
+    
+    async def run_tests(self, tests):
+        """Run independent connection tests concurrently, recording results in order"""
+        results = await asyncio.gather(*(self.test_connection(*test) for test in tests))
             
-            result = subprocess.run(
-                ns_command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+        passed = 0
+        for result in results:
+            self.test_results.append(result)
             
-            return result.returncode == 0, result.stdout, result.stderr
+            print(f"\n[TEST] {result['test']}")
+            print(f"Testing: {result['source']} -> {result['destination']}")
+            status = "✓ PASS" if result['passed'] else "✗ FAIL"
+            print(f"Expected: {result['expected']}, Got: {result['actual']} - {status}")
             
-        except subprocess.TimeoutExpired:
-            return False, "", "Command timed out"
-        except Exception as e:
-            # Fallback: Try direct execution
-            try:
-                result = subprocess.run(
-                    mininet_cmd.split()[1:],  # Remove host prefix
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout
-                )
-                return result.returncode == 0, result.stdout, result.stderr
-            except:
-                return False, "", str(e)
+            if result['passed']:
+                passed += 1
+        return passed
     
-    def test_connection(self, source_host, dest_ip, dest_port, expected_result, description):
-        """Test a specific connection and record result"""
-        print(f"\n[TEST] {description}")
-        print(f"Testing: h{source_host} -> {dest_ip}:{dest_port}")
-        
-        # Test using curl for HTTP ports
-        if dest_port in [80, 8080]:
-            command = f"curl -m 3 --connect-timeout 3 http://{dest_ip}:{dest_port} >/dev/null 2>&1"
-        elif dest_port == 443:
-            command = f"curl -m 3 --connect-timeout 3 -k https://{dest_ip}:{dest_port} >/dev/null 2>&1"
-        elif dest_port in [22, 3306]:
-            # Use netcat for other ports
-            command = f"nc -z -w 3 {dest_ip} {dest_port}"
-        else:
-            # Default ping test
-            command = f"ping -c 1 -W 1 {dest_ip} >/dev/null 2>&1"
-        
-        # Execute command (simulating network test)
-        success, stdout, stderr = self.run_command(command, timeout=5)
+    async def test_connection(self, source_host, dest_ip, dest_port, expected_result, description):
+        """Test a specific connection and return its result"""
+        # Only probe the network in live mode; the verdict below is simulated either way
+        if self.live_probe:
+            # Execute command from the source host (simulating network test)
+            success, stdout, stderr = await self.execute_mininet_command(
+                f"h{source_host}", probe_argv(dest_ip, dest_port), timeout=5)
         
         # For this demo, we'll simulate the expected behavior based on policies
         # In a real test, this would actually test through the network
@@ -103,156 +251,111 @@ class SecurityTester:
         result = {
             'test': description,
             'source': f"h{source_host}",
+            'source_ip': HOST_IPS.get(source_host),
             'destination': f"{dest_ip}:{dest_port}",
+            'destination_host': f"h{IP_TO_HOST[dest_ip]}" if dest_ip in IP_TO_HOST else None,
             'expected': expected_result,
             'actual': actual_result,
             'passed': test_passed,
-            'timestamp': datetime.now().isoformat()
+            'ts_us': int((time.monotonic() - self.mono_start) * 1e6)
         }
         
-        self.test_results.append(result)
-        
-        status = "✓ PASS" if test_passed else "✗ FAIL"
-        print(f"Expected: {expected_result}, Got: {actual_result} - {status}")
-        
-        return test_passed
+        return result
     
-    def simulate_policy_result(self, source_host, dest_ip, dest_port):
-        """Simulate policy enforcement based on our rules"""
-        # Map host numbers to IPs
-        host_ips = {
-            1: "10.0.0.10",  # Web server
-            2: "10.0.0.20",  # App server  
-            3: "10.0.0.30",  # DB server
-            4: "10.0.0.100", # HR user
-            5: "10.0.0.200"  # Admin user
-        }
-        
-        source_ip = host_ips.get(source_host, "unknown")
-        
-        # HR user (h4) policies
-        if source_host == 4:  # HR user
-            if dest_ip == "10.0.0.10" and dest_port in [80, 443]:
-                return "ALLOWED"  # HR can access web server
-            else:
-                return "BLOCKED"  # HR blocked from everything else
-        
-        # Admin user (h5) policies  
-        elif source_host == 5:  # Admin user
-            # Admin can access servers but not other users
-            if dest_ip in ["10.0.0.10", "10.0.0.20", "10.0.0.30"]:
-                return "ALLOWED"  # Admin can access servers
-            else:
-                return "BLOCKED"  # Admin blocked from user hosts
-        
-        # Server-to-server communication
-        elif source_host == 1 and dest_ip == "10.0.0.20" and dest_port == 8080:
-            return "ALLOWED"  # Web to App
-        elif source_host == 2 and dest_ip == "10.0.0.30" and dest_port == 3306:
-            return "ALLOWED"  # App to DB
-        
-        # Default deny
-        else:
-            return "BLOCKED"
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def simulate_policy_result(source_host, dest_ip, dest_port):
+        """Simulate policy enforcement based on our rules (default deny)"""
+        if ((source_host, dest_ip, dest_port) in ALLOWED_FLOWS or
+                (source_host, dest_ip) in ALLOWED_HOST_PAIRS):
+            return "ALLOWED"
+        return "BLOCKED"
     
-    def test_legitimate_access(self):
+    async def test_legitimate_access(self):
         """Test legitimate access patterns that should be allowed"""
         print("\n" + "="*60)
         print("TESTING LEGITIMATE ACCESS (Should be ALLOWED)")
         print("="*60)
         
-        tests = [
-            # HR user access
-            (4, "10.0.0.10", 80, "ALLOWED", "HR user accessing web server HTTP"),
-            (4, "10.0.0.10", 443, "ALLOWED", "HR user accessing web server HTTPS"),
-            
-            # Admin user access  
-            (5, "10.0.0.10", 80, "ALLOWED", "Admin accessing web server HTTP"),
-            (5, "10.0.0.10", 443, "ALLOWED", "Admin accessing web server HTTPS"),
-            (5, "10.0.0.10", 22, "ALLOWED", "Admin SSH to web server"),
-            (5, "10.0.0.20", 8080, "ALLOWED", "Admin accessing app server"),
-            (5, "10.0.0.30", 3306, "ALLOWED", "Admin accessing database"),
-            
-            # Server-to-server communication
-            (1, "10.0.0.20", 8080, "ALLOWED", "Web server to app server"),
-            (2, "10.0.0.30", 3306, "ALLOWED", "App server to database"),
-        ]
+        tests = LEGIT_TESTS
         
-        passed = 0
-        for test in tests:
-            if self.test_connection(*test):
-                passed += 1
+        passed = await self.run_tests(tests)
                 
         print(f"\nLegitimate Access Tests: {passed}/{len(tests)} passed")
         return passed, len(tests)
     
-    def test_lateral_movement_attacks(self):
+    async def test_lateral_movement_attacks(self):
         """Test lateral movement attacks that should be blocked"""
         print("\n" + "="*60)
         print("TESTING LATERAL MOVEMENT ATTACKS (Should be BLOCKED)")
         print("="*60)
         
-        attacks = [
-            # HR user trying unauthorized access
-            (4, "10.0.0.20", 8080, "BLOCKED", "HR user attacking app server"),
-            (4, "10.0.0.30", 3306, "BLOCKED", "HR user attacking database"),
-            (4, "10.0.0.10", 22, "BLOCKED", "HR user trying SSH to web server"),
-            
-            # Cross-server attacks
-            (1, "10.0.0.30", 3306, "BLOCKED", "Web server attacking database directly"),
-            (3, "10.0.0.10", 80, "BLOCKED", "Database attacking web server"),
-            (3, "10.0.0.20", 8080, "BLOCKED", "Database attacking app server"),
-            
-            # User-to-user attacks
-            (4, "10.0.0.200", 22, "BLOCKED", "HR user attacking admin user"),
-            (5, "10.0.0.100", 22, "BLOCKED", "Admin attacking HR user"),
-        ]
+        attacks = ATTACK_TESTS
         
-        blocked = 0
-        for attack in attacks:
-            if self.test_connection(*attack):
-                blocked += 1
+        blocked = await self.run_tests(attacks)
                 
         print(f"\nLateral Movement Tests: {blocked}/{len(attacks)} properly blocked")
         return blocked, len(attacks)
     
-    def generate_traffic_patterns(self):
+    async def generate_traffic_patterns(self):
         """Generate various traffic patterns to test dependency discovery"""
         print("\n" + "="*60)
         print("GENERATING TRAFFIC PATTERNS FOR DEPENDENCY DISCOVERY")
         print("="*60)
         
         patterns = [
-            ("h4", "10.0.0.10", "curl -m 3 http://10.0.0.10 || true"),
-            ("h5", "10.0.0.10", "curl -m 3 http://10.0.0.10 || true"),
-            ("h5", "10.0.0.20", "curl -m 3 http://10.0.0.20:8080 || true"),
-            ("h1", "10.0.0.20", "curl -m 3 http://10.0.0.20:8080 || true"),
-            ("h2", "10.0.0.30", "nc -z -w 3 10.0.0.30 3306 || true"),
+            ("h4", "10.0.0.10", 80),
+            ("h5", "10.0.0.10", 80),
+            ("h5", "10.0.0.20", 8080),
+            ("h1", "10.0.0.20", 8080),
+            ("h2", "10.0.0.30", 3306),
         ]
         
-        for host, target, command in patterns:
+        for host, target, port in patterns:
             print(f"Generating traffic: {host} -> {target}")
-            full_command = f"mininet -c '{host} {command}'"
-            self.run_command(full_command, timeout=5)
-            time.sleep(1)
+            
+        # Send all patterns at once; each host's shell still runs its own commands in turn
+        await asyncio.gather(*(
+            self.execute_mininet_command(host, probe_argv(target, port), timeout=5)
+            for host, target, port in patterns))
     
-    def run_comprehensive_test(self):
+    async def wait_for_controller(self):
+        """Poll the controller's OpenFlow port until it accepts a connection or time runs out"""
+        deadline = time.monotonic() + CONTROLLER_WAIT_TIMEOUT
+        while True:
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(*CONTROLLER_ADDRESS), timeout=CONTROLLER_POLL_INTERVAL)
+                writer.close()
+                return True
+            except (OSError, asyncio.TimeoutError):
+                pass
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(CONTROLLER_POLL_INTERVAL)
+    
+    async def run_comprehensive_test(self):
         """Run all security tests"""
         print("Starting Comprehensive Security Test Suite")
         print(f"Test started at: {self.start_time}")
         
-        # Wait for network to stabilize
-        print("\nWaiting for network to stabilize...")
-        time.sleep(5)
-        
-        # Generate some traffic first
-        self.generate_traffic_patterns()
-        
-        # Test legitimate access
-        legit_passed, legit_total = self.test_legitimate_access()
+        # Only live probes need the network up; simulated verdicts don't wait on it
+        if self.live_probe:
+            print("\nWaiting for network to stabilize...")
+            if not await self.wait_for_controller():
+                print("⚠️  Controller is not answering, continuing anyway")
         
-        # Test attacks
-        attacks_blocked, attacks_total = self.test_lateral_movement_attacks()
+        try:
+            # Generate some traffic first
+            await self.generate_traffic_patterns()
+            
+            # Test legitimate access
+            legit_passed, legit_total = await self.test_legitimate_access()
+            
+            # Test attacks
+            attacks_blocked, attacks_total = await self.test_lateral_movement_attacks()
+        finally:
+            self.close_shells()
         
         # Generate final report
         self.generate_report(legit_passed, legit_total, attacks_blocked, attacks_total)
@@ -277,6 +380,9 @@ class SecurityTester:
         
         print(f"\nOverall Success Rate: {success_rate:.1f}%")
         
+        cache_info = self.simulate_policy_result.cache_info()
+        print(f"Policy Cache: {cache_info.hits} hits, {cache_info.misses} misses")
+        
         if success_rate >= 90:
             print("🟢 EXCELLENT: Micro-segmentation is working effectively!")
         elif success_rate >= 75:
@@ -285,22 +391,18 @@ class SecurityTester:
             print("🔴 POOR: Significant security issues detected")
         
         # Save detailed results
-        report = {
-            'summary': {
-                'start_time': self.start_time.isoformat(),
-                'end_time': end_time.isoformat(),
-                'duration_seconds': duration,
-                'total_tests': len(self.test_results),
-                'passed_tests': total_passed,
-                'success_rate': success_rate
-            },
-            'detailed_results': self.test_results
+        summary = {
+            'start_time': self.start_time.isoformat(),
+            'end_time': end_time.isoformat(),
+            'duration_seconds': duration,
+            'total_tests': len(self.test_results),
+            'passed_tests': total_passed,
+            'success_rate': success_rate,
+            'policy_cache': cache_info._asdict()
         }
-        
-        with open('security_test_report.json', 'w') as f:
-            json.dump(report, f, indent=2)
+        self.write_report(summary)
             
-        print(f"\nDetailed report saved to: security_test_report.json")
+        print(f"\nDetailed report saved to: {REPORT_FILE}")
         
         # Show failed tests
         failed_tests = [r for r in self.test_results if not r['passed']]
@@ -309,16 +411,38 @@ class SecurityTester:
             for test in failed_tests:
                 print(f"  ✗ {test['test']}: Expected {test['expected']}, got {test['actual']}")
 
+    def write_report(self, summary):
+        """Stream the report to disk one result at a time, replacing the old file atomically"""
+        tmp_path = f"{REPORT_FILE}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write('{"summary": ')
+            json.dump(summary, f)
+            f.write(',\n"detailed_results": [')
+            for i, result in enumerate(self.test_results):
+                f.write(',\n' if i else '\n')
+                # Turn the monotonic offset into wall-clock time only when writing
+                result = dict(result)
+                ts_us = result.pop('ts_us')
+                result['timestamp'] = (self.start_time + timedelta(microseconds=ts_us)).isoformat()
+                json.dump(result, f)
+            f.write('\n]}\n')
+        os.replace(tmp_path, REPORT_FILE)
+
 def main():
     """Main function to run security tests"""
+    parser = argparse.ArgumentParser(description="SDN Micro-Segmentation Security Tester")
+    parser.add_argument('--live', action='store_true',
+                        help="also send real probes from the Mininet hosts")
+    args = parser.parse_args()
+    
     print("SDN Micro-Segmentation Security Tester")
     print("Testing policy enforcement simulation...")
     print("Note: This simulates the expected behavior based on your security policies")
     
-    tester = SecurityTester()
+    tester = SecurityTester(live_probe=args.live)
     
     try:
-        tester.run_comprehensive_test()
+        asyncio.run(tester.run_comprehensive_test())
     except KeyboardInterrupt:
         print("\n\nTest interrupted by user")
     except Exception as e:
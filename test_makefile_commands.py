@@ -5,33 +5,39 @@ Test script to verify all Makefile commands work correctly
 
 import subprocess
 import os
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Targets run in parallel; each one's report is printed whole under this lock
+PRINT_LOCK = threading.Lock()
 
 def test_command(command, description, timeout=10):
     """Test a make command"""
-    print(f"Testing: {description}")
-    print(f"Command: make {command}")
+    lines = [f"Testing: {description}", f"Command: make {command}"]
     
     try:
-        result = subprocess.run(['make', command], 
-                              capture_output=True, text=True, timeout=timeout)
+        # Only stderr is reported on failure
+        result = subprocess.run(['make', command], stdout=subprocess.DEVNULL,
+                              stderr=subprocess.PIPE, text=True, timeout=timeout)
         
         if result.returncode == 0:
-            print("✅ PASS")
+            lines.append("✅ PASS")
             return True
         else:
-            print(f"❌ FAIL - Return code: {result.returncode}")
+            lines.append(f"❌ FAIL - Return code: {result.returncode}")
             if result.stderr:
-                print(f"Error: {result.stderr}")
+                lines.append(f"Error: {result.stderr}")
             return False
     except subprocess.TimeoutExpired:
-        print("⏰ TIMEOUT")
+        lines.append("⏰ TIMEOUT")
         return False
     except Exception as e:
-        print(f"❌ ERROR: {e}")
+        lines.append(f"❌ ERROR: {e}")
         return False
     finally:
-        print("-" * 50)
+        lines.append("-" * 50)
+        with PRINT_LOCK:
+            print("\n".join(lines))
 
 def main():
     """Test all Makefile commands"""
@@ -47,13 +53,12 @@ def main():
         ("sample-logs", "Create sample logs message"),
     ]
     
-    passed = 0
     total = len(commands_to_test)
     
-    for command, description in commands_to_test:
-        if test_command(command, description):
-            passed += 1
-        time.sleep(1)  # Brief pause between tests
+    # The targets are independent, so run them all at once
+    with ThreadPoolExecutor(max_workers=total) as executor:
+        results = list(executor.map(lambda test: test_command(*test), commands_to_test))
+    passed = sum(results)
     
     print(f"📊 TEST RESULTS:")
     print(f"Passed: {passed}/{total}")
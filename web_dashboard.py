@@ -4,80 +4,532 @@ Web-based GUI Dashboard for SDN Micro-Segmentation
 Real-time monitoring with interactive web interface
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, jsonify, request, send_from_directory, stream_with_context
+import argparse
+import gzip
+import hashlib
+import html
+import itertools
 import json
 import os
+import re
 import threading
 import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import subprocess
 
+try:
+    from waitress import serve  # Optional: multi-threaded production WSGI server
+except ImportError:
+    serve = None
+
+try:
+    import orjson  # Optional: faster JSON encoding and decoding
+except ImportError:
+    orjson = None
+
+try:
+    import brotli  # Optional: smaller compressed responses than gzip
+except ImportError:
+    brotli = None
+
+try:
+    from inotify_simple import INotify, flags  # Optional: change notifications instead of stat()
+except ImportError:
+    INotify = None
+
+try:
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    DefaultJSONProvider = None  # Flask < 2.2 has no pluggable JSON provider
+
 app = Flask(__name__)
 
+if orjson is not None and DefaultJSONProvider is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider serializing responses with orjson (keys sorted, as by default)"""
+        
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode('utf-8')
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+        
+        def response(self, *args, **kwargs):
+            # Hand orjson's bytes straight to the response, skipping a str round trip
+            obj = self._prepare_response_obj(args, kwargs)
+            body = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+            return self._app.response_class(body, mimetype=self.mimetype)
+    
+    # jsonify() now goes through orjson
+    app.json = OrjsonProvider(app)
+
+def compress(body, encoding, best=False):
+    """Compress bytes with 'br' or 'gzip', at the highest level if best is set"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=11 if best else BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=9 if best else GZIP_LEVEL)
+
+def preferred_encoding():
+    """Best compression the client accepts ('br', 'gzip'), or None"""
+    if brotli is not None and 'br' in request.accept_encodings:
+        return 'br'
+    if 'gzip' in request.accept_encodings:
+        return 'gzip'
+    return None
+
+def parse_json(raw):
+    """Decode JSON bytes, with orjson when it is installed"""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+# Worker threads and open connections allowed when serving with waitress
+SERVER_THREADS = 8
+SERVER_CONNECTION_LIMIT = 200
+
+# Event logs tailed by the dashboard, and the markers that make a line an event
+SECURITY_EVENTS_LOG = 'security_events.log'
+SECURITY_EVENT_MARKERS = (b'ALLOWED:', b'BLOCKED:')
+CLOUD_EVENTS_LOG = 'cloud_security_events.log'
+CLOUD_EVENT_MARKERS = (b'BLOCKED', b'ALLOWED', b'VIOLATION')
+EVENTS_KEPT = 50
+EVENTS_SHOWN = 20  # Most recent events sent to the page
+LOG_TAIL_BYTES = 64 * 1024  # How far back the first read of a log starts
+
+# Text colour of an event line, from the first group of markers it contains
+SECURITY_EVENT_COLORS = (
+    (('BLOCKED',), '#dc3545'),
+    (('ALLOWED',), '#28a745'),
+)
+CLOUD_EVENT_COLORS = (
+    (('BLOCKED', 'VIOLATION'), '#dc3545'),
+    (('ALLOWED', 'COMPLIANT'), '#28a745'),
+    (('WARNING',), '#ffc107'),
+)
+DEFAULT_EVENT_COLOR = '#333'
+
+# Written by test_attacks.py
+TEST_REPORT_FILE = 'security_test_report.json'
+
+# Written by cloud_security_controller.py
+COMPLIANCE_REPORT_FILE = 'cloud_compliance_report.json'
+
+# Generated dashboard page, plus a sidecar holding its SHA-256 so an unchanged
+# page is not rewritten on every start
+TEMPLATE_DIR = 'templates'
+TEMPLATE_NAME = 'dashboard.html'
+TEMPLATE_FILE = os.path.join(TEMPLATE_DIR, TEMPLATE_NAME)
+TEMPLATE_DIGEST_FILE = f"{TEMPLATE_FILE}.sha256"
+
+# Precompressed copies of the page written next to it, by Content-Encoding
+PAGE_SUFFIXES = {'gzip': '.gz'}
+if brotli is not None:
+    PAGE_SUFFIXES['br'] = '.br'
+
+# Browsers may reuse the dashboard page for this long before revalidating its ETag
+PAGE_MAX_AGE = 60
+
+# Scripts the dashboard can run, by the name used in /api/run/<kind>
+SCRIPTS = {
+    'basic': 'test_attacks.py',
+    'advanced': 'cloud_security_controller.py',
+    'cloud': 'cloud_security_controller.py',
+}
+
+# Script runs requested from the dashboard execute in the background
+SCRIPT_TIMEOUT = 30
+SCRIPT_WORKERS = 2
+JOBS_KEPT = 20  # Finished jobs beyond this many are forgotten, oldest first
+
+# API responses smaller than this are not worth compressing
+COMPRESSED_MIMETYPES = ('application/json', 'text/html')
+COMPRESS_MIN_SIZE = 500
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# The event stream checks for changed data this often, and sends a comment line
+# when idle so closed connections are noticed
+STREAM_POLL_INTERVAL = 1.0
+STREAM_KEEPALIVE = 5.0
+
+# Each open stream holds a server thread, so only this many may be open at once,
+# leaving the remaining threads for page loads and API calls; further clients
+# are refused and fall back to polling
+STREAM_LIMIT = max(1, SERVER_THREADS // 2)
+
+# Streams end after this many seconds so their threads are recycled; the
+# browser reconnects after STREAM_RETRY_MS
+STREAM_MAX_AGE = 300.0
+STREAM_RETRY_MS = 2000
+
+# Command-line pattern identifying each monitored component
+PROCESS_PATTERNS = {'controller': b'ryu-manager', 'topology': b'mininet'}
+
+# Process scan results are reused for this many seconds
+STATUS_CACHE_TTL = 2.0
+
+def find_running_components():
+    """Return the set of PROCESS_PATTERNS components with a running process"""
+    if not os.path.isdir('/proc'):
+        # No procfs: fall back to pgrep
+        return {component for component, pattern in PROCESS_PATTERNS.items()
+                if subprocess.run(['pgrep', '-f', pattern], capture_output=True).returncode == 0}
+    
+    # One pass over /proc checks every pattern, stopping once all are found
+    running = set()
+    own_pid = str(os.getpid())
+    for pid in os.listdir('/proc'):
+        if not pid.isdigit() or pid == own_pid:
+            continue
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                cmdline = f.read()
+        except OSError:
+            continue  # Process exited or is not readable
+        
+        running.update(component for component, pattern in PROCESS_PATTERNS.items()
+                       if pattern in cmdline)
+        if len(running) == len(PROCESS_PATTERNS):
+            break
+    return running
+
+class FileWatcher:
+    """Counts changes to a set of files as inotify reports them
+    
+    Callers remember the count they last handled and skip stat() and reads
+    while it is unchanged. Without inotify every count is None, meaning the
+    caller has to check the file itself.
+    """
+    
+    # Writes, plus files being created, replaced, removed or renamed away
+    EVENT_MASK = (flags.MODIFY | flags.CLOSE_WRITE | flags.CREATE | flags.DELETE |
+                  flags.MOVED_TO | flags.MOVED_FROM) if INotify is not None else 0
+    
+    def __init__(self, paths):
+        self.generations = dict.fromkeys(paths, 0)
+        self.watched = {}  # (watch descriptor, file name) -> path
+        self.inotify = None
+        if INotify is None:
+            return
+        
+        try:
+            inotify = INotify()
+            # Watch the containing directories so files that are replaced or
+            # do not exist yet are still seen
+            for path in paths:
+                directory, name = os.path.split(os.path.abspath(path))
+                wd = inotify.add_watch(directory, self.EVENT_MASK)
+                self.watched[(wd, name)] = path
+        except OSError as e:
+            print(f"⚠️  inotify unavailable, checking files with stat(): {e}")
+            return
+        
+        self.inotify = inotify
+        threading.Thread(target=self.watch, daemon=True).start()
+    
+    def watch(self):
+        """Bump the count of each watched file an event arrives for"""
+        while True:
+            for event in self.inotify.read():
+                path = self.watched.get((event.wd, event.name))
+                if path is not None:
+                    self.generations[path] += 1
+    
+    def generation(self, path):
+        """Return the change count of path, or None when changes are not being tracked"""
+        if self.inotify is None:
+            return None
+        return self.generations[path]
+
+# Shared by every cache of a watched file
+file_watcher = FileWatcher([SECURITY_EVENTS_LOG, CLOUD_EVENTS_LOG,
+                            TEST_REPORT_FILE, COMPLIANCE_REPORT_FILE])
+
+class LogTail:
+    """Most recent event lines of a log, read incrementally as the log grows"""
+    
+    def __init__(self, path, markers, maxlen=EVENTS_KEPT):
+        self.path = path
+        # All markers in one alternation, so each line is scanned once
+        self.marker_pattern = re.compile(b'|'.join(re.escape(marker) for marker in markers))
+        self.events = deque(maxlen=maxlen)
+        self.count = 0  # Events read since the dashboard started following the log
+        self.offset = 0  # Byte offset just past the last complete line read
+        self.stat_key = None  # (st_mtime_ns, st_size) when last read
+        self.generation = None  # file_watcher change count when last read
+        self.version = 0  # Bumped whenever the events kept change
+        self.fd = None  # Kept open between reads
+        self.inode = None  # (st_dev, st_ino) of the file self.fd refers to
+        self.lock = threading.Lock()
+    
+    def reset(self):
+        """Forget everything read so far"""
+        if self.events:
+            self.version += 1
+        self.events.clear()
+        self.count = 0
+        self.offset = 0
+        self.stat_key = None
+        self.generation = None
+        self.close()
+    
+    def close(self):
+        """Close the log's file descriptor, if open"""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+            self.inode = None
+    
+    def refresh(self):
+        """Read lines appended since the last call; a no-op if the file is unchanged"""
+        with self.lock:
+            # Taken before looking at the file, so a change made meanwhile is caught next time
+            generation = file_watcher.generation(self.path)
+            if generation is not None and generation == self.generation:
+                return
+            self.read_appended()
+            self.generation = generation
+    
+    def read_appended(self):
+        """Stat the log and read any complete lines added since the last read"""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self.reset()
+            return
+        
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if stat_key == self.stat_key:
+            return
+        if (st.st_dev, st.st_ino) != self.inode or st.st_size < self.offset:
+            # Log was rotated, replaced or truncated; start over on the current file
+            self.reset()
+            self.fd = os.open(self.path, os.O_RDONLY)
+            # Describe the file actually opened, in case it was replaced after the stat
+            st = os.fstat(self.fd)
+            stat_key = (st.st_mtime_ns, st.st_size)
+            self.inode = (st.st_dev, st.st_ino)
+        
+        start = self.offset
+        if start == 0 and st.st_size > LOG_TAIL_BYTES:
+            # Only the end of a large log can hold the events kept
+            start = st.st_size - LOG_TAIL_BYTES - 1
+        # Positional read on the open descriptor: no open, seek or close per refresh
+        data = os.pread(self.fd, st.st_size - start, start)
+        
+        if start != self.offset:
+            # Drop the line the tail starts in the middle of; reading one byte
+            # early keeps it whole when the tail starts right after a newline
+            skip = data.find(b'\n') + 1 or len(data)
+            data = data[skip:]
+            start += skip
+            self.offset = start
+        
+        # Leave a partially written last line for the next read
+        end = data.rfind(b'\n') + 1
+        
+        # Search the whole buffer for markers and cut out just the lines they
+        # fall in, so lines without an event cost no Python work at all
+        count = self.count
+        pos = 0
+        while True:
+            match = self.marker_pattern.search(data, pos, end)
+            if match is None:
+                break
+            line_start = data.rfind(b'\n', 0, match.start()) + 1
+            line_end = data.find(b'\n', match.end(), end)
+            self.events.append(data[line_start:line_end].strip().decode('utf-8', 'replace'))
+            self.count += 1
+            pos = line_end + 1
+        if self.count != count:
+            self.version += 1
+        self.offset += end
+        self.stat_key = stat_key
+    
+    def recent(self, n):
+        """Return the last n events, oldest first"""
+        with self.lock:
+            # Walk back from the newest end so only the n events returned are copied
+            events = list(itertools.islice(reversed(self.events), n))
+        events.reverse()
+        return events
+
 class SDNDashboard:
     def __init__(self):
         self.traffic_stats = {}
-        self.security_events = []
+        self.security_log = LogTail(SECURITY_EVENTS_LOG, SECURITY_EVENT_MARKERS)
+        self.cloud_log = LogTail(CLOUD_EVENTS_LOG, CLOUD_EVENT_MARKERS)
+        self.security_events = self.security_log.events
         self.test_results = {}
+        self.test_results_generation = None  # file_watcher change count when last loaded
         self.system_status = {
             'controller': 'Unknown',
             'topology': 'Unknown',
             'last_update': datetime.now().isoformat()
         }
+        self.status_checked = 0.0  # Monotonic time of the last process scan
+        self.events_html = {}  # log path -> (LogTail.version, rendered recent events)
+        self.compliance_cache = (None, None)  # (st_mtime_ns, serialized report)
+        self.compliance_generation = None  # file_watcher change count when last checked
     
     def load_test_results(self):
         """Load test results from JSON files"""
+        generation = file_watcher.generation(TEST_REPORT_FILE)
+        if generation is not None and generation == self.test_results_generation:
+            return
+        
         try:
-            if os.path.exists('security_test_report.json'):
-                with open('security_test_report.json', 'r') as f:
-                    self.test_results = json.load(f)
+            if os.path.exists(TEST_REPORT_FILE):
+                with open(TEST_REPORT_FILE, 'rb') as f:
+                    self.test_results = parse_json(f.read())
         except:
             pass
+        self.test_results_generation = generation
     
     def load_security_events(self):
-        """Load recent security events"""
+        """Load recent security events, reading only what was appended since last time"""
         try:
-            if os.path.exists('security_events.log'):
-                with open('security_events.log', 'r') as f:
-                    lines = f.readlines()
-                    # Filter and format security events
-                    events = []
-                    for line in lines:
-                        line = line.strip()
-                        if line and ('ALLOWED:' in line or 'BLOCKED:' in line):
-                            events.append(line)
-                    self.security_events = events[-50:]  # Last 50 events
-            else:
-                self.security_events = []
+            self.security_log.refresh()
         except Exception as e:
             print(f"Error loading security events: {e}")
-            self.security_events = []
+            self.security_log.reset()
+    
+    def load_cloud_events(self):
+        """Load recent cloud security events, reading only what was appended since last time"""
+        try:
+            self.cloud_log.refresh()
+        except Exception as e:
+            print(f"Error loading cloud security events: {e}")
+            self.cloud_log.reset()
+    
+    def render_events(self, log, colors, empty_message):
+        """Return the recent events of log as coloured HTML, rebuilt only when they change"""
+        version = log.version
+        cached = self.events_html.get(log.path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        rows = []
+        for event in log.recent(EVENTS_SHOWN):
+            color = next((color for markers, color in colors
+                          if any(marker in event for marker in markers)), DEFAULT_EVENT_COLOR)
+            rows.append(f'<div style="color: {color}; margin: 2px 0;">{html.escape(event)}</div>')
+        fragment = ''.join(rows) or f'<div class="loading">{empty_message}</div>'
+        
+        self.events_html[log.path] = (version, fragment)
+        return fragment
+    
+    def load_compliance_report(self):
+        """Return the compliance report as JSON bytes, or None if there is none
+        
+        The report is reparsed only when the file changes.
+        """
+        generation = file_watcher.generation(COMPLIANCE_REPORT_FILE)
+        if generation is not None and generation == self.compliance_generation:
+            return self.compliance_cache[1]
+        
+        try:
+            mtime_ns = os.stat(COMPLIANCE_REPORT_FILE).st_mtime_ns
+        except FileNotFoundError:
+            self.compliance_cache = (None, None)
+        else:
+            if self.compliance_cache[0] != mtime_ns:
+                with open(COMPLIANCE_REPORT_FILE, 'rb') as f:
+                    report = parse_json(f.read())
+                self.compliance_cache = (mtime_ns, jsonify(report).get_data())
+        self.compliance_generation = generation
+        return self.compliance_cache[1]
     
     def check_system_status(self):
-        """Check if controller and topology are running"""
+        """Check if controller and topology are running, at most once per STATUS_CACHE_TTL"""
+        now = time.monotonic()
+        if now - self.status_checked < STATUS_CACHE_TTL:
+            return
+        self.status_checked = now
+        
+        previous = self.system_status
         try:
-            # Check for Ryu controller process
-            result = subprocess.run(['pgrep', '-f', 'ryu-manager'], 
-                                  capture_output=True, text=True)
-            self.system_status['controller'] = 'Running' if result.returncode == 0 else 'Stopped'
-            
-            # Check for Mininet process
-            result = subprocess.run(['pgrep', '-f', 'mininet'], 
-                                  capture_output=True, text=True)
-            self.system_status['topology'] = 'Running' if result.returncode == 0 else 'Stopped'
-            
+            running = find_running_components()
+            controller = 'Running' if 'controller' in running else 'Stopped'
+            topology = 'Running' if 'topology' in running else 'Stopped'
         except:
-            pass
+            controller, topology = previous['controller'], previous['topology']
         
-        self.system_status['last_update'] = datetime.now().isoformat()
+        # Publish a new dict with one assignment instead of updating the shared one,
+        # so request threads never see a half-updated status and need no lock
+        self.system_status = {
+            'controller': controller,
+            'topology': topology,
+            'last_update': datetime.now().isoformat()
+        }
 
 # Global dashboard instance
 dashboard = SDNDashboard()
 
+# Background script runs: job id -> Future, oldest first
+script_executor = ThreadPoolExecutor(max_workers=SCRIPT_WORKERS)
+jobs = OrderedDict()
+jobs_lock = threading.Lock()
+
+def run_script(script):
+    """Run a Python script and return its outcome as a JSON-ready dict"""
+    try:
+        result = subprocess.run(['python3', script], 
+                              capture_output=True, text=True, timeout=SCRIPT_TIMEOUT)
+        return {
+            'success': result.returncode == 0,
+            'output': result.stdout,
+            'error': result.stderr
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+def submit_script(script):
+    """Start a script run in the background and return its job id"""
+    job_id = uuid.uuid4().hex
+    with jobs_lock:
+        jobs[job_id] = script_executor.submit(run_script, script)
+        
+        # Forget the oldest finished jobs once too many are kept
+        excess = len(jobs) - JOBS_KEPT
+        if excess > 0:
+            finished = [jid for jid, future in jobs.items() if future.done()]
+            for old_id in finished[:excess]:
+                del jobs[old_id]
+    return job_id
+
 @app.route('/')
 def index():
     """Main dashboard page"""
-    return render_template('dashboard.html')
+    # Serve the precompressed copy of the page when the client accepts one
+    encoding = preferred_encoding()
+    response = send_from_directory(os.path.abspath(TEMPLATE_DIR),
+                                   TEMPLATE_NAME + PAGE_SUFFIXES.get(encoding, ''),
+                                   mimetype='text/html', max_age=PAGE_MAX_AGE, conditional=True)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+@app.after_request
+def compress_response(response):
+    """Compress sizeable API responses for clients that accept it"""
+    if (response.mimetype not in COMPRESSED_MIMETYPES or response.status_code != 200 or
+            response.direct_passthrough or 'Content-Encoding' in response.headers):
+        return response
+    
+    body = response.get_data()
+    encoding = preferred_encoding()
+    if encoding and len(body) >= COMPRESS_MIN_SIZE:
+        response.set_data(compress(body, encoding))
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
 
 @app.route('/api/status')
 def get_status():
@@ -96,77 +548,49 @@ def get_security_events():
     """API endpoint for security events"""
     dashboard.load_security_events()
     return jsonify({
-        'events': dashboard.security_events[-20:],  # Last 20 events
+        'events': dashboard.security_log.recent(EVENTS_SHOWN),
         'count': len(dashboard.security_events)
     })
 
-@app.route('/api/run-test')
-def run_test():
-    """API endpoint to run security tests"""
-    try:
-        result = subprocess.run(['python3', 'test_attacks.py'], 
-                              capture_output=True, text=True, timeout=30)
-        return jsonify({
-            'success': result.returncode == 0,
-            'output': result.stdout,
-            'error': result.stderr
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        })
+@app.route('/api/security-events.html')
+def get_security_events_html():
+    """API endpoint for security events, rendered as an HTML fragment"""
+    dashboard.load_security_events()
+    fragment = dashboard.render_events(dashboard.security_log, SECURITY_EVENT_COLORS,
+                                       'No security events logged yet')
+    return Response(fragment, mimetype='text/html')
 
-@app.route('/api/run-advanced-test')
-def run_advanced_test():
-    """API endpoint to run cloud security tests"""
-    try:
-        result = subprocess.run(['python3', 'cloud_security_controller.py'], 
-                              capture_output=True, text=True, timeout=30)
-        return jsonify({
-            'success': result.returncode == 0,
-            'output': result.stdout,
-            'error': result.stderr
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        })
+@app.route('/api/run/<kind>')
+def run_named_script(kind):
+    """API endpoint to start one of the SCRIPTS in the background"""
+    script = SCRIPTS.get(kind)
+    if script is None:
+        return jsonify({'error': 'Unknown script'}), 404
+    return jsonify({'job_id': submit_script(script)})
 
-@app.route('/api/run-cloud-security')
-def run_cloud_security():
-    """API endpoint to run cloud security simulation"""
-    try:
-        result = subprocess.run(['python3', 'cloud_security_controller.py'], 
-                              capture_output=True, text=True, timeout=30)
-        return jsonify({
-            'success': result.returncode == 0,
-            'output': result.stdout,
-            'error': result.stderr
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        })
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """API endpoint reporting whether a script run has finished, and its result"""
+    with jobs_lock:
+        future = jobs.get(job_id)
+    if future is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    
+    done = future.done()
+    return jsonify({
+        'done': done,
+        'result': future.result() if done else None
+    })
 
 @app.route('/api/cloud-events')
 def get_cloud_events():
     """API endpoint for cloud security events"""
     try:
-        cloud_events = []
-        if os.path.exists('cloud_security_events.log'):
-            with open('cloud_security_events.log', 'r') as f:
-                lines = f.readlines()
-                for line in lines:
-                    line = line.strip()
-                    if line and ('BLOCKED' in line or 'ALLOWED' in line or 'VIOLATION' in line):
-                        cloud_events.append(line)
+        dashboard.cloud_log.refresh()
         
         return jsonify({
-            'events': cloud_events[-20:],  # Last 20 events
-            'count': len(cloud_events)
+            'events': dashboard.cloud_log.recent(EVENTS_SHOWN),
+            'count': dashboard.cloud_log.count
         })
     except Exception as e:
         return jsonify({
@@ -175,21 +599,136 @@ def get_cloud_events():
             'error': str(e)
         })
 
+@app.route('/api/cloud-events.html')
+def get_cloud_events_html():
+    """API endpoint for cloud security events, rendered as an HTML fragment"""
+    dashboard.load_cloud_events()
+    fragment = dashboard.render_events(dashboard.cloud_log, CLOUD_EVENT_COLORS,
+                                       'No cloud security events logged yet')
+    return Response(fragment, mimetype='text/html')
+
 @app.route('/api/compliance-report')
 def get_compliance_report():
     """API endpoint for compliance report"""
     try:
-        if os.path.exists('cloud_compliance_report.json'):
-            with open('cloud_compliance_report.json', 'r') as f:
-                report = json.load(f)
-            return jsonify(report)
+        report = dashboard.load_compliance_report()
+        if report is not None:
+            return Response(report, mimetype='application/json')
         else:
             return jsonify({'error': 'No compliance report found'})
     except Exception as e:
         return jsonify({'error': str(e)})
 
+def file_version(path):
+    """Return (st_mtime_ns, st_size) of path, or None if it does not exist"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def watched_version(path):
+    """Return a change marker for path: its inotify change count, or its stat() result"""
+    generation = file_watcher.generation(path)
+    return generation if generation is not None else file_version(path)
+
+def section_versions():
+    """Return a change marker per streamed section; a section is resent when its marker changes"""
+    dashboard.check_system_status()
+    dashboard.load_security_events()
+    dashboard.load_cloud_events()
+    
+    status = dashboard.system_status
+    return {
+        'status': (status['controller'], status['topology']),
+        'events': dashboard.security_log.stat_key,
+        'cloud_events': dashboard.cloud_log.stat_key,
+        'test_results': watched_version(TEST_REPORT_FILE),
+        'compliance': watched_version(COMPLIANCE_REPORT_FILE),
+    }
+
+# Free slots for open event streams
+stream_slots = threading.BoundedSemaphore(STREAM_LIMIT)
+
+# Endpoint producing the data of each dashboard section
+DASHBOARD_SECTIONS = {
+    'status': get_status,
+    'events': get_security_events_html,
+    'cloud_events': get_cloud_events_html,
+    'test_results': get_test_results,
+    'compliance': get_compliance_report,
+}
+
+def section_json(name):
+    """Return a section's current data as JSON text; HTML fragments become JSON strings"""
+    response = DASHBOARD_SECTIONS[name]()
+    body = response.get_data(as_text=True)
+    if response.mimetype != 'application/json':
+        return app.json.dumps(body)
+    return body.strip()
+
+def snapshot_json():
+    """Return every section in one JSON object, keyed by section name"""
+    # Section bodies are already JSON text, so they are spliced in rather than re-encoded
+    return '{' + ','.join(f'"{name}":{section_json(name)}' for name in DASHBOARD_SECTIONS) + '}'
+
+@app.route('/api/snapshot')
+def get_snapshot():
+    """API endpoint returning all dashboard sections in one response"""
+    return Response(snapshot_json(), mimetype='application/json')
+
+def sse_message(event, data):
+    """Format one Server-Sent Events message; each line of data gets its own field"""
+    lines = ''.join(f"data: {line}\n" for line in data.splitlines())
+    return f"event: {event}\n{lines}\n"
+
+@app.route('/api/stream')
+def stream():
+    """Server-Sent Events endpoint pushing each section only when its data changes"""
+    if not stream_slots.acquire(blocking=False):
+        # Not a 200 event stream, so the page's EventSource closes and it polls instead
+        return jsonify({'error': 'Too many open event streams'}), 503
+    
+    def generate():
+        versions = section_versions()
+        yield f"retry: {STREAM_RETRY_MS}\n"
+        yield sse_message('snapshot', snapshot_json())
+        last_sent = started = time.monotonic()
+        while time.monotonic() - started < STREAM_MAX_AGE:
+            time.sleep(STREAM_POLL_INTERVAL)
+            current = section_versions()
+            changed = [name for name, version in current.items() if versions[name] != version]
+            versions = current
+            
+            for name in changed:
+                yield sse_message(name, section_json(name))
+            
+            now = time.monotonic()
+            if changed:
+                last_sent = now
+            elif now - last_sent >= STREAM_KEEPALIVE:
+                yield ": keepalive\n\n"
+                last_sent = now
+    
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+    # Runs when the server closes the response, whether the stream ended or the client left
+    response.call_on_close(stream_slots.release)
+    return response
+
+def write_atomic(path, data):
+    """Write bytes to path via a temp file so readers never see a partial file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def minify_html(text):
+    """Drop indentation and blank lines; line breaks stay, since the script relies on them"""
+    return '\n'.join(line.strip() for line in text.splitlines() if line.strip())
+
 def create_html_template():
-    """Create HTML template for dashboard"""
+    """Create HTML template for dashboard, unless the one on disk is already current"""
     os.makedirs('templates', exist_ok=True)
     
     html_content = '''<!DOCTYPE html>
@@ -332,94 +871,136 @@ def create_html_template():
     </div>
 
     <script>
-        // Auto-refresh data every 5 seconds
-        setInterval(() => {
-            refreshStatus();
-            refreshEvents();
-            refreshCloudEvents();
-            loadTestResults();
-            refreshCompliance();
-        }, 5000);
-        
-        // Initial load
+        const sections = {
+            status: applyStatus,
+            events: applyEvents,
+            cloud_events: applyCloudEvents,
+            test_results: applyTestResults,
+            compliance: applyCompliance
+        };
+        
+        function applySnapshot(data) {
+            for (const [name, apply] of Object.entries(sections)) {
+                apply(data[name]);
+            }
+        }
+        
+        // Every section in one request
+        function refreshAll() {
+            fetch('/api/snapshot')
+                .then(response => response.json())
+                .then(applySnapshot)
+                .catch(error => console.error('Error:', error));
+        }
+        
+        // Fall back to refreshing every 5 seconds when the event stream is unavailable
+        let pollTimer = null;
+        function startPolling() {
+            refreshAll();
+            if (!pollTimer) {
+                pollTimer = setInterval(refreshAll, 5000);
+            }
+        }
+        
+        // The server pushes a snapshot of every section, then each section when its data changes
         window.onload = () => {
-            refreshStatus();
-            refreshEvents();
-            refreshCloudEvents();
-            loadTestResults();
-            refreshCompliance();
+            if (!window.EventSource) {
+                startPolling();
+                return;
+            }
+            const es = new EventSource('/api/stream');
+            es.addEventListener('snapshot', e => applySnapshot(JSON.parse(e.data)));
+            for (const [name, apply] of Object.entries(sections)) {
+                es.addEventListener(name, e => apply(JSON.parse(e.data)));
+            }
+            es.onerror = () => {
+                // The browser reconnects by itself unless the stream was refused outright
+                if (es.readyState === EventSource.CLOSED) {
+                    startPolling();
+                }
+            };
         };
         
         function refreshStatus() {
             fetch('/api/status')
                 .then(response => response.json())
-                .then(data => {
-                    document.getElementById('controller-status').textContent = data.controller;
-                    document.getElementById('controller-status').className = 
-                        data.controller === 'Running' ? 'status-running' : 'status-stopped';
-                    
-                    document.getElementById('topology-status').textContent = data.topology;
-                    document.getElementById('topology-status').className = 
-                        data.topology === 'Running' ? 'status-running' : 'status-stopped';
-                    
-                    document.getElementById('last-update').textContent = 
-                        new Date(data.last_update).toLocaleString();
-                })
+                .then(applyStatus)
                 .catch(error => console.error('Error:', error));
         }
         
+        function applyStatus(data) {
+            document.getElementById('controller-status').textContent = data.controller;
+            document.getElementById('controller-status').className = 
+                data.controller === 'Running' ? 'status-running' : 'status-stopped';
+            
+            document.getElementById('topology-status').textContent = data.topology;
+            document.getElementById('topology-status').className = 
+                data.topology === 'Running' ? 'status-running' : 'status-stopped';
+            
+            document.getElementById('last-update').textContent = 
+                new Date(data.last_update).toLocaleString();
+        }
+        
         function loadTestResults() {
             fetch('/api/test-results')
                 .then(response => response.json())
-                .then(data => {
-                    if (data.summary) {
-                        const summary = data.summary;
-                        const successRate = summary.success_rate || 0;
-                        
-                        document.getElementById('test-results').innerHTML = `
-                            <div class="metric">
-                                <span>Total Tests:</span>
-                                <span class="metric-value">${summary.total_tests || 0}</span>
-                            </div>
-                            <div class="metric">
-                                <span>Passed Tests:</span>
-                                <span class="metric-value">${summary.passed_tests || 0}</span>
-                            </div>
-                            <div class="metric">
-                                <span>Success Rate:</span>
-                                <span class="metric-value">${successRate.toFixed(1)}%</span>
-                            </div>
-                            <div class="progress-bar">
-                                <div class="progress-fill" style="width: ${successRate}%"></div>
-                            </div>
-                        `;
-                    }
-                })
+                .then(applyTestResults)
                 .catch(error => console.error('Error:', error));
         }
         
+        function applyTestResults(data) {
+            if (data.summary) {
+                const summary = data.summary;
+                const successRate = summary.success_rate || 0;
+                
+                document.getElementById('test-results').innerHTML = `
+                    <div class="metric">
+                        <span>Total Tests:</span>
+                        <span class="metric-value">${summary.total_tests || 0}</span>
+                    </div>
+                    <div class="metric">
+                        <span>Passed Tests:</span>
+                        <span class="metric-value">${summary.passed_tests || 0}</span>
+                    </div>
+                    <div class="metric">
+                        <span>Success Rate:</span>
+                        <span class="metric-value">${successRate.toFixed(1)}%</span>
+                    </div>
+                    <div class="progress-bar">
+                        <div class="progress-fill" style="width: ${successRate}%"></div>
+                    </div>
+                `;
+            }
+        }
+        
+        // Event lists arrive as HTML already coloured and escaped by the server
         function refreshEvents() {
-            fetch('/api/security-events')
-                .then(response => response.json())
-                .then(data => {
-                    const eventsDiv = document.getElementById('security-events');
-                    if (data.events && data.events.length > 0) {
-                        eventsDiv.innerHTML = data.events.map(event => {
-                            const color = event.includes('BLOCKED') ? '#dc3545' : 
-                                         event.includes('ALLOWED') ? '#28a745' : '#333';
-                            return `<div style="color: ${color}; margin: 2px 0;">${event.trim()}</div>`;
-                        }).join('');
-                    } else {
-                        eventsDiv.innerHTML = '<div class="loading">No security events logged yet</div>';
-                    }
-                })
+            fetch('/api/security-events.html')
+                .then(response => response.text())
+                .then(applyEvents)
                 .catch(error => console.error('Error:', error));
         }
         
+        function applyEvents(html) {
+            document.getElementById('security-events').innerHTML = html;
+        }
+        
+        // Start a script run and resolve with its result once the job has finished
+        function runJob(url) {
+            return fetch(url)
+                .then(response => response.json())
+                .then(job => new Promise((resolve, reject) => {
+                    const poll = () => fetch(`/api/jobs/${job.job_id}`)
+                        .then(response => response.json())
+                        .then(status => status.done ? resolve(status.result) : setTimeout(poll, 1000))
+                        .catch(reject);
+                    poll();
+                }));
+        }
+        
         function runBasicTest() {
             document.getElementById('test-results').innerHTML = '<div class="loading">Running basic tests...</div>';
-            fetch('/api/run-test')
-                .then(response => response.json())
+            runJob('/api/run/basic')
                 .then(data => {
                     if (data.success) {
                         setTimeout(loadTestResults, 1000);
@@ -436,8 +1017,7 @@ def create_html_template():
         
         function runAdvancedTest() {
             document.getElementById('test-results').innerHTML = '<div class="loading">Running advanced tests...</div>';
-            fetch('/api/run-advanced-test')
-                .then(response => response.json())
+            runJob('/api/run/advanced')
                 .then(data => {
                     if (data.success) {
                         setTimeout(loadTestResults, 1000);
@@ -454,8 +1034,7 @@ def create_html_template():
         
         function runCloudSecurity() {
             document.getElementById('test-results').innerHTML = '<div class="loading">Running cloud security simulation...</div>';
-            fetch('/api/run-cloud-security')
-                .then(response => response.json())
+            runJob('/api/run/cloud')
                 .then(data => {
                     if (data.success) {
                         setTimeout(() => {
@@ -477,65 +1056,76 @@ def create_html_template():
         }
         
         function refreshCloudEvents() {
-            fetch('/api/cloud-events')
-                .then(response => response.json())
-                .then(data => {
-                    const eventsDiv = document.getElementById('cloud-events');
-                    if (data.events && data.events.length > 0) {
-                        eventsDiv.innerHTML = data.events.map(event => {
-                            let color = '#333';
-                            if (event.includes('BLOCKED') || event.includes('VIOLATION')) {
-                                color = '#dc3545';
-                            } else if (event.includes('ALLOWED') || event.includes('COMPLIANT')) {
-                                color = '#28a745';
-                            } else if (event.includes('WARNING')) {
-                                color = '#ffc107';
-                            }
-                            return `<div style="color: ${color}; margin: 2px 0;">${event.trim()}</div>`;
-                        }).join('');
-                    } else {
-                        eventsDiv.innerHTML = '<div class="loading">No cloud security events logged yet</div>';
-                    }
-                })
+            fetch('/api/cloud-events.html')
+                .then(response => response.text())
+                .then(applyCloudEvents)
                 .catch(error => console.error('Error:', error));
         }
         
+        function applyCloudEvents(html) {
+            document.getElementById('cloud-events').innerHTML = html;
+        }
+        
         function refreshCompliance() {
             fetch('/api/compliance-report')
                 .then(response => response.json())
-                .then(data => {
-                    const complianceDiv = document.getElementById('compliance-status');
-                    if (data.compliance_status) {
-                        let html = '';
-                        for (const [framework, status] of Object.entries(data.compliance_status)) {
-                            const statusColor = status.status === 'COMPLIANT' ? '#28a745' : '#dc3545';
-                            const statusIcon = status.status === 'COMPLIANT' ? '✅' : '❌';
-                            html += `
-                                <div class="metric">
-                                    <span>${statusIcon} ${framework}:</span>
-                                    <span style="color: ${statusColor}; font-weight: bold;">${status.status}</span>
-                                </div>
-                            `;
-                        }
-                        complianceDiv.innerHTML = html;
-                    } else {
-                        complianceDiv.innerHTML = '<div class="loading">No compliance data available</div>';
-                    }
-                })
+                .then(applyCompliance)
                 .catch(error => {
                     document.getElementById('compliance-status').innerHTML = 
                         '<div class="loading">Run cloud security simulation to generate compliance report</div>';
                 });
         }
+        
+        function applyCompliance(data) {
+            const complianceDiv = document.getElementById('compliance-status');
+            if (data.compliance_status) {
+                let html = '';
+                for (const [framework, status] of Object.entries(data.compliance_status)) {
+                    const statusColor = status.status === 'COMPLIANT' ? '#28a745' : '#dc3545';
+                    const statusIcon = status.status === 'COMPLIANT' ? '✅' : '❌';
+                    html += `
+                        <div class="metric">
+                            <span>${statusIcon} ${framework}:</span>
+                            <span style="color: ${statusColor}; font-weight: bold;">${status.status}</span>
+                        </div>
+                    `;
+                }
+                complianceDiv.innerHTML = html;
+            } else {
+                complianceDiv.innerHTML = '<div class="loading">No compliance data available</div>';
+            }
+        }
     </script>
 </body>
 </html>'''
     
-    with open('templates/dashboard.html', 'w') as f:
-        f.write(html_content)
+    html_bytes = minify_html(html_content).encode('utf-8')
+    digest = hashlib.sha256(html_bytes).digest()
+    page_files = [TEMPLATE_FILE] + [TEMPLATE_FILE + suffix for suffix in PAGE_SUFFIXES.values()]
+    try:
+        with open(TEMPLATE_DIGEST_FILE, 'rb') as f:
+            if f.read() == digest and all(os.path.exists(path) for path in page_files):
+                return
+    except FileNotFoundError:
+        pass
+    
+    write_atomic(TEMPLATE_FILE, html_bytes)
+    for encoding, suffix in PAGE_SUFFIXES.items():
+        write_atomic(TEMPLATE_FILE + suffix, compress(html_bytes, encoding, best=True))
+    write_atomic(TEMPLATE_DIGEST_FILE, digest)
 
 def main():
     """Start the web dashboard"""
+    parser = argparse.ArgumentParser(description="SDN Web Dashboard")
+    parser.add_argument('--dev', action='store_true',
+                        help="use Flask's development server even if waitress is installed")
+    parser.add_argument('--x-sendfile', action='store_true',
+                        help="let a front-end server supporting X-Sendfile send the page file")
+    args = parser.parse_args()
+    
+    # The response then only names the file, and the front end transfers it itself
+    app.config['USE_X_SENDFILE'] = args.x_sendfile
+    
     print("Creating HTML template...")
     create_html_template()
     
@@ -543,7 +1133,12 @@ def main():
     print("Dashboard will be available at: http://localhost:5000")
     print("Press Ctrl+C to stop")
     
-    app.run(host='0.0.0.0', port=5000, debug=False)
+    if serve is not None and not args.dev:
+        serve(app, host='0.0.0.0', port=5000,
+              threads=SERVER_THREADS, connection_limit=SERVER_CONNECTION_LIMIT)
+    else:
+        # Handle each request on its own thread so slow endpoints don't block the rest
+        app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file